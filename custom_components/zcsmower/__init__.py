@@ -15,6 +15,7 @@ from homeassistant.helpers import (
     device_registry as dr,
     entity_registry as er,
 )
+from homeassistant.helpers.storage import Store
 
 from .const import (
     LOGGER,
@@ -38,12 +39,15 @@ from .const import (
     CONF_MAP_ROTATION,
     CONF_MAP_POINTS,
     CONF_MAP_DRAW_LINES,
+    CONF_MAP_IMAGE_FORMAT,
     CONF_HIBERNATION_ENABLE,
     CONF_MOWERS,
     STANDBY_TIME_START_DEFAULT,
     STANDBY_TIME_STOP_DEFAULT,
     CONFIGURATION_DEFAULTS,
     MAP_POINTS_DEFAULT,
+    MAP_IMAGE_FORMAT_DEFAULT,
+    STORAGE_VERSION,
 )
 from .services import async_setup_services
 from .coordinator import ZcsMowerDataUpdateCoordinator
@@ -65,8 +69,17 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
             hass=hass,
             config_entry=config_entry,
         )
-        await coordinator.initialize()
-        await coordinator.async_config_entry_first_refresh()
+        # With the last known state, entities are set up at once
+        # and the state is reconciled with the API in the background
+        if await coordinator.async_restore():
+            config_entry.async_create_background_task(
+                hass,
+                coordinator.async_refresh(),
+                f"{DOMAIN}_{config_entry.entry_id}_refresh",
+            )
+        else:
+            await coordinator.initialize()
+            await coordinator.async_config_entry_first_refresh()
     except ZcsMowerApiAuthenticationError as err:
         raise ConfigEntryAuthFailed from err
     except Exception as err:
@@ -100,9 +113,17 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
     unload_ok = await hass.config_entries.async_unload_platforms(
         config_entry, PLATFORMS
     )
+    if unload_ok:
+        # Last known state is available for the next start
+        await config_entry.runtime_data.async_save()
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Remove stored state, when the config entry is removed."""
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{config_entry.entry_id}").async_remove()
+
+
 async def async_reload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
     """Reload config entry."""
     await hass.config_entries.async_reload(config_entry.entry_id)
@@ -204,5 +225,20 @@ async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
             version=12,
         )
 
+    if config_entry.version < 13:
+        _options = dict(config_entry.options)
+        _options.update(
+            {
+                CONF_MAP_IMAGE_FORMAT: config_entry.options.get(CONF_MAP_IMAGE_FORMAT, MAP_IMAGE_FORMAT_DEFAULT),
+            }
+        )
+        hass.config_entries.async_update_entry(
+            config_entry,
+            title=str(config_entry.title),
+            data={},
+            options=_options,
+            version=13,
+        )
+
     LOGGER.info("Migration to version %s successful", config_entry.version)
     return True
@@ -4,13 +4,32 @@ https://github.com/deviceWISE/sample_tr50_python
 """
 from __future__ import annotations
 
+import asyncio
+import bisect
+import random
 import socket
+import time
 
 import aiohttp
-import async_timeout
 import json
 
-from .const import LOGGER
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from .const import (
+    LOGGER,
+    API_LATENCY_BUCKETS,
+    API_SESSION_LIFETIME,
+    API_SESSION_REFRESH_MARGIN,
+    API_CIRCUIT_FAILURE_THRESHOLD,
+    API_CIRCUIT_BACKOFF_INITIAL,
+    API_CIRCUIT_BACKOFF_MAX,
+    API_CIRCUIT_BACKOFF_JITTER,
+    API_CIRCUIT_PROBE_TIMEOUT,
+    API_CIRCUIT_CLOSED,
+    API_CIRCUIT_OPEN,
+    API_CIRCUIT_HALF_OPEN,
+)
 
 
 class ZcsMowerApiError(Exception):
@@ -25,6 +44,249 @@ class ZcsMowerApiAuthenticationError(ZcsMowerApiError):
     """Exception to indicate an authentication error."""
 
 
+class ZcsMowerApiCircuitOpenError(ZcsMowerApiError):
+    """Exception to indicate, that requests are blocked by the open circuit breaker."""
+
+
+@dataclass(frozen=True)
+class ZcsMowerApiResponse:
+    """Result of one TR50 command."""
+
+    success: bool
+    errors: tuple[str, ...] = ()
+    params: any = None
+
+    def __bool__(self) -> bool:
+        """Return True, if the command succeeded."""
+        return self.success
+
+
+class ZcsMowerApiSessionMetrics:
+    """Collect connection and latency metrics of an aiohttp session."""
+
+    def __init__(self) -> None:
+        """Initialize metrics."""
+        self.requests = 0
+        self.request_errors = 0
+        self.connections_created = 0
+        self.connections_reused = 0
+        self.dns_cache_hits = 0
+        self.dns_cache_misses = 0
+        self.latency_total = 0.0
+        # Number of requests per upper bound of latency in seconds, last one is open
+        self.latency_histogram = [0] * (len(API_LATENCY_BUCKETS) + 1)
+
+    def create_trace_config(self) -> aiohttp.TraceConfig:
+        """Create trace config, which reports into this metrics."""
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(self._on_request_start)
+        trace_config.on_request_end.append(self._on_request_end)
+        trace_config.on_request_exception.append(self._on_request_exception)
+        trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reuseconn)
+        trace_config.on_dns_cache_hit.append(self._on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(self._on_dns_cache_miss)
+        return trace_config
+
+    def as_dict(self) -> dict[str, any]:
+        """Return metrics as dict."""
+        connections = self.connections_created + self.connections_reused
+        histogram = {
+            f"<={bucket}s": count
+            for bucket, count in zip(API_LATENCY_BUCKETS, self.latency_histogram, strict=False)
+        }
+        histogram[f">{API_LATENCY_BUCKETS[-1]}s"] = self.latency_histogram[-1]
+        return {
+            "requests": self.requests,
+            "request_errors": self.request_errors,
+            # Every new connection to the HTTPS endpoint requires a TLS handshake
+            "tls_handshakes": self.connections_created,
+            "connections_reused": self.connections_reused,
+            "connection_reuse_rate": (
+                round(self.connections_reused / connections, 3) if connections else None
+            ),
+            "dns_cache_hits": self.dns_cache_hits,
+            "dns_cache_misses": self.dns_cache_misses,
+            "latency_average": (
+                round(self.latency_total / self.requests, 3) if self.requests else None
+            ),
+            "latency_histogram": histogram,
+        }
+
+    async def _on_request_start(self, session, context, params) -> None:
+        context.start = time.monotonic()
+
+    async def _on_request_end(self, session, context, params) -> None:
+        latency = time.monotonic() - context.start
+        self.requests += 1
+        self.latency_total += latency
+        self.latency_histogram[bisect.bisect_left(API_LATENCY_BUCKETS, latency)] += 1
+
+    async def _on_request_exception(self, session, context, params) -> None:
+        self.request_errors += 1
+
+    async def _on_connection_create_end(self, session, context, params) -> None:
+        self.connections_created += 1
+
+    async def _on_connection_reuseconn(self, session, context, params) -> None:
+        self.connections_reused += 1
+
+    async def _on_dns_cache_hit(self, session, context, params) -> None:
+        self.dns_cache_hits += 1
+
+    async def _on_dns_cache_miss(self, session, context, params) -> None:
+        self.dns_cache_misses += 1
+
+
+class ZcsMowerApiCircuitBreaker:
+    """Stop requests to the API during an outage.
+
+    The circuit opens after several failed requests in a row. While it is
+    open, requests fail at once. After a backoff, which doubles with every
+    failed probe and has a random part, one request is let through as probe
+    in the half-open state. Its success closes the circuit again. A probe,
+    which is cancelled or does not finish in time, opens the circuit again.
+    Responses with errors of a command count as success, only requests
+    without a valid response count as failure.
+    """
+
+    def __init__(self) -> None:
+        """Initialize closed circuit breaker."""
+        self.state = API_CIRCUIT_CLOSED
+        # Failed requests in a row and openings without success in between
+        self.failures = 0
+        self.openings = 0
+        self.rejected = 0
+        self.opened_total = 0
+        # Monotonic time of the next probe, while the circuit is open
+        self._retry_at = None
+        # Number of the running probe and its monotonic deadline
+        self.probes = 0
+        self._probe_deadline = None
+        # Called, when the state or the time of the next probe changes
+        self._listeners: list[Callable[[], None]] = []
+
+    def add_listener(self, update_callback: Callable[[], None]) -> Callable[[], None]:
+        """Listen for changes of the circuit breaker, return function to remove the listener."""
+        self._listeners.append(update_callback)
+
+        def remove_listener() -> None:
+            if update_callback in self._listeners:
+                self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    def _notify_listeners(self) -> None:
+        """Call all listeners."""
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    @property
+    def retry_in(self) -> float | None:
+        """Return seconds until the next probe, None if the circuit is not open."""
+        if self.state != API_CIRCUIT_OPEN:
+            return None
+        return max(self._retry_at - time.monotonic(), 0.0)
+
+    def is_probe_due(self) -> bool:
+        """Return True, if the next request is the probe.
+
+        This is the case, if the circuit is open and the backoff is over or if
+        the running probe exceeded its deadline.
+        """
+        if self.state == API_CIRCUIT_OPEN:
+            return time.monotonic() >= self._retry_at
+        if self.state == API_CIRCUIT_HALF_OPEN:
+            return time.monotonic() >= self._probe_deadline
+        return False
+
+    def before_request(self) -> int | None:
+        """Let request pass or raise ZcsMowerApiCircuitOpenError.
+
+        Returns the number of the probe, if the request is the probe, which has
+        to be handed to release_probe after the request.
+        """
+        if self.state == API_CIRCUIT_CLOSED:
+            return None
+        if self.is_probe_due():
+            LOGGER.info("API circuit half-open, sending probe")
+            self.state = API_CIRCUIT_HALF_OPEN
+            self.probes += 1
+            self._probe_deadline = time.monotonic() + API_CIRCUIT_PROBE_TIMEOUT
+            self._notify_listeners()
+            return self.probes
+        self.rejected += 1
+        raise ZcsMowerApiCircuitOpenError(
+            "API is not available, requests are paused"
+        )
+
+    def release_probe(self, probe: int) -> None:
+        """Open the circuit again, if the given probe ended without result.
+
+        The next request is the probe then, without a further backoff.
+        """
+        if self.state != API_CIRCUIT_HALF_OPEN or probe != self.probes:
+            return None
+        LOGGER.debug("API probe ended without result, circuit open")
+        self.state = API_CIRCUIT_OPEN
+        self._retry_at = time.monotonic()
+        self._probe_deadline = None
+        self._notify_listeners()
+
+    def record_success(self) -> None:
+        """Close the circuit after a valid response."""
+        self.failures = 0
+        if self.state == API_CIRCUIT_CLOSED:
+            return None
+        LOGGER.info("API available again, circuit closed")
+        self.state = API_CIRCUIT_CLOSED
+        self.openings = 0
+        self._retry_at = None
+        self._probe_deadline = None
+        self._notify_listeners()
+
+    def record_failure(self) -> None:
+        """Count a request without valid response, open the circuit if necessary."""
+        if self.state == API_CIRCUIT_OPEN:
+            return None
+        self.failures += 1
+        if self.state == API_CIRCUIT_HALF_OPEN or self.failures >= API_CIRCUIT_FAILURE_THRESHOLD:
+            self._open()
+
+    def _open(self) -> None:
+        """Open the circuit with exponential backoff and jitter."""
+        self.openings += 1
+        self.opened_total += 1
+        backoff = min(
+            API_CIRCUIT_BACKOFF_INITIAL * 2 ** (self.openings - 1),
+            API_CIRCUIT_BACKOFF_MAX,
+        )
+        backoff += random.uniform(-API_CIRCUIT_BACKOFF_JITTER, API_CIRCUIT_BACKOFF_JITTER) * backoff
+        self._retry_at = time.monotonic() + backoff
+        self._probe_deadline = None
+        self.state = API_CIRCUIT_OPEN
+        # Only the start of an outage is a warning, failed probes are not
+        (LOGGER.warning if self.openings == 1 else LOGGER.debug)(
+            "API not available after %s failed request(s), next probe in %.0f seconds",
+            self.failures,
+            backoff,
+        )
+        self._notify_listeners()
+
+    def as_dict(self) -> dict[str, any]:
+        """Return state of the circuit breaker as dict."""
+        retry_in = self.retry_in
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "openings": self.openings,
+            "opened_total": self.opened_total,
+            "rejected": self.rejected,
+            "probes": self.probes,
+            "retry_in": round(retry_in, 1) if retry_in is not None else None,
+        }
+
+
 class ZcsMowerApiClient:
     """Sample API Client."""
 
@@ -43,15 +305,6 @@ class ZcsMowerApiClient:
     # Holds the current session identifier.
     _session_id = ""
 
-    # If the last request succeeded or failed.
-    _response_status = None
-
-    # Holds any error returned by the API.
-    _response_error = []
-
-    # Holds the response data from the API call.
-    _response = []
-
     def __init__(
         self,
         session: aiohttp.ClientSession,
@@ -73,97 +326,130 @@ class ZcsMowerApiClient:
         if "session_id" in options:
             self._session_id = options["session_id"]
 
+        # Requests are paused during an outage of the API
+        self.circuit_breaker = ZcsMowerApiCircuitBreaker()
+
+        # Only one task refreshes the session, all others wait for it
+        self._auth_lock = asyncio.Lock()
+        # Monotonic time, when the session has to be refreshed proactively
+        self._session_refresh_at = None
+
     # This method sends the TR50 request to the server and parses the response.
     # https://github.com/deviceWISE/sample_tr50_python
     # @param    mixed    data     JSON command and arguments. This parameter can also
     #                             be a dict that will be converted to a JSON string.
-    # @return   bool     Success or failure to post.
+    # @return   dict     The decoded response.
     async def post(
         self,
         data: dict | None = None,
         headers: dict | None = None,
-    ) -> bool:
+        retry: bool = True,
+    ) -> dict:
         """Send the TR50 request to the server and parses the response.
 
+        The response is kept local to the call, so concurrent requests over
+        one client do not interfere.
+
         Args:
             data (dict | None): JSON command and arguments to send.
             headers (dict | None): Headers to send.
+            retry (bool): Retry once after an invalid session was refreshed.
 
         Returns:
-            bool: Success or failure to post.
+            dict: The decoded response of a successful request.
 
         """
-        self._response_status = False
-        self._response_error = []
-        self._response = ""
+        response_status = False
+        response_error = []
 
         if not isinstance(data, dict):
             data = json.loads(data)
 
         data = await self.set_json_auth(data)
+        # After the authentication, which is a request on its own
+        probe = self.circuit_breaker.before_request()
         LOGGER.debug("API.request:")
         LOGGER.debug(data)
 
         try:
-            async with async_timeout.timeout(60):
-                response = await self._session.request(
-                    method="POST",
-                    url=self._endpoint,
-                    headers=headers,
-                    json=data,
-                )
+            # Connect and read timeouts are set in the client session
+            async with self._session.request(
+                method="POST",
+                url=self._endpoint,
+                headers=headers,
+                json=data,
+            ) as response:
                 if not response.status == 200:
+                    # Only server errors are an outage of the API
+                    if response.status >= 500:
+                        self.circuit_breaker.record_failure()
+                    else:
+                        self.circuit_breaker.record_success()
                     raise ZcsMowerApiError(
                         "Failed to POST to API"
                     )
                 response.raise_for_status()
 
-                self._response = await response.json()
-                assert self._response
+                response_data = await response.json()
+                assert response_data
+                self.circuit_breaker.record_success()
 
-                if "errorMessages" in self._response:
-                    self._response_error.extend(self._response["errorMessages"])
-                if "data" in self._response and "errorMessages" in self._response["data"]:
-                    self._response_error.extend(self._response["data"]["errorMessages"])
+                # Numbered commands of a batch request, see execute_many
+                batch_keys = [key for key in data if key.isdigit()]
 
-                if "success" in self._response:
-                    self._response_status = self._response["success"]
-                elif "data" in self._response and "success" in self._response["data"]:
-                    self._response_status = self._response["data"]["success"]
-                elif "auth" in self._response and "success" in self._response["auth"]:
-                    self._response_status = self._response["auth"]["success"]
+                if "errorMessages" in response_data:
+                    response_error.extend(response_data["errorMessages"])
+                if "data" in response_data and "errorMessages" in response_data["data"]:
+                    response_error.extend(response_data["data"]["errorMessages"])
+                for key in batch_keys:
+                    response_error.extend(
+                        response_data.get(key, {}).get("errorMessages", [])
+                    )
+
+                if "success" in response_data:
+                    response_status = response_data["success"]
+                elif "data" in response_data and "success" in response_data["data"]:
+                    response_status = response_data["data"]["success"]
+                elif "auth" in response_data and "success" in response_data["auth"]:
+                    response_status = response_data["auth"]["success"]
+                elif batch_keys:
+                    # A batch request succeeds, if every command has a result and the
+                    # session is valid, failed commands are reported per command
+                    response_status = all(
+                        key in response_data for key in batch_keys
+                    ) and not any(
+                        "Authentication session is invalid: " in error
+                        for error in response_error
+                    )
 
                 LOGGER.debug("API.response:")
-                LOGGER.debug(self._response)
-
-                # If _response_status is True
-                if self._response_status:
-                    return self._response_status
-                # Else _response_status is False
-                else:
-                    # If session is invalid, refresh authentication and execute command
-                    # again possible loop, if authentication session is always invalid
-                    # after successful refresh
-                    if len([
-                        error
-                        for error in self._response_error
-                        if "Authentication session is invalid: " in error
-                    ]) > 0:
-                        refresh_auth = await self.auth()
-                        if refresh_auth:
-                            data["auth"]["sessionId"] = self._session_id
-                            return await self.post(data, headers)
-
-                    raise ZcsMowerApiCommunicationError(self._response_error)
+                LOGGER.debug(response_data)
+
+                # If response_status is True
+                if response_status:
+                    return response_data
+                # Else response_status is False, if session is invalid, refresh
+                # authentication below and execute command again, but only once
+                if not retry or len([
+                    error
+                    for error in response_error
+                    if "Authentication session is invalid: " in error
+                ]) == 0:
+                    raise ZcsMowerApiCommunicationError(response_error)
         except ZcsMowerApiCommunicationError as exception:
             raise ZcsMowerApiCommunicationError(
                 f"Communication failed: {exception}"
             ) from exception
+        except ZcsMowerApiError:
+            # Already counted by the circuit breaker
+            raise
         except (TimeoutError, AssertionError) as exception:
+            self.circuit_breaker.record_failure()
             raise ZcsMowerApiCommunicationError(
                 "Timeout error fetching information",
             ) from exception
         except (aiohttp.ClientError, socket.gaierror) as exception:
+            self.circuit_breaker.record_failure()
             raise ZcsMowerApiCommunicationError(
                 "Error fetching information",
             ) from exception
@@ -171,18 +457,32 @@ class ZcsMowerApiClient:
             raise ZcsMowerApiError(
                 "Something really wrong happened!"
             ) from exception
+        finally:
+            # Also, if the probe was cancelled
+            if probe is not None:
+                self.circuit_breaker.release_probe(probe)
+
+        # Outside of the request, so the requests of the refresh and the retry
+        # are counted by the circuit breaker on their own
+        refresh_auth = await self.refresh_auth(data["auth"].get("sessionId"))
+        if not refresh_auth:
+            raise ZcsMowerApiCommunicationError(
+                f"Communication failed: {response_error}"
+            )
+        data["auth"]["sessionId"] = self._session_id
+        return await self.post(data, headers, retry=False)
 
     # Package the command and the params into an array and sends the command to the
     # configured endpoint for processing.
     # https://github.com/deviceWISE/sample_tr50_python
     # @param    command    string    The TR50 command to execute.
     # @param    params     dict      The command parameters.
-    # @return   bool       Success or failure to post.
+    # @return   ZcsMowerApiResponse    Result of the command.
     async def execute(
         self,
         command: str,
         params: dict | bool = False
-    ) -> bool:
+    ) -> ZcsMowerApiResponse:
         """Execute commands agains the deviceWISE API.
 
         Package the command and the params into an array and sends the
@@ -193,7 +493,7 @@ class ZcsMowerApiClient:
             params (dict): The command parameters.
 
         Returns:
-            bool: Successor failure to post.
+            ZcsMowerApiResponse: Result of the command.
 
         """
         if command == "api.authenticate":
@@ -212,7 +512,73 @@ class ZcsMowerApiClient:
             if params is not False:
                 parameters["data"]["params"] = params
 
-        return await self.post(parameters)
+        # The authentication runs in refresh_auth, which holds the lock, so an
+        # invalid session must not refresh the authentication again
+        response_data = await self.post(parameters, retry=command != "api.authenticate")
+        result = response_data.get("auth" if command == "api.authenticate" else "data", {})
+        return ZcsMowerApiResponse(
+            success=True,
+            errors=tuple(result.get("errorMessages", [])),
+            params=result.get("params", None),
+        )
+
+    # Package several commands into one request with numbered commands.
+    # @param    commands    list    Tuples of the TR50 command and its parameters.
+    # @return   list        Result of each command in the given order.
+    async def execute_many(
+        self,
+        commands: list[tuple[str, dict | bool]],
+    ) -> list[ZcsMowerApiResponse]:
+        """Execute several commands in one request against the deviceWISE API.
+
+        TR50 accepts numbered commands in one request and returns the result
+        of each command under its number.
+
+        Args:
+            commands (list): Tuples of the TR50 command and its parameters.
+
+        Returns:
+            list[ZcsMowerApiResponse]: Result of each command in the given order.
+
+        """
+        if len(commands) == 0:
+            return []
+
+        parameters = {}
+        for index, (command, params) in enumerate(commands, start=1):
+            parameters[str(index)] = {
+                "command" : command
+            }
+            if params is not False:
+                parameters[str(index)]["params"] = params
+
+        response_data = await self.post(parameters)
+
+        results = []
+        for index in range(1, len(commands) + 1):
+            result = response_data.get(str(index), {})
+            results.append(
+                ZcsMowerApiResponse(
+                    success=result.get("success", False),
+                    errors=tuple(result.get("errorMessages", [])),
+                    params=result.get("params", None),
+                )
+            )
+        return results
+
+    # Probe the API with a cheap command, while the circuit breaker is open.
+    # @return    bool    True, if the API is available again.
+    async def probe(
+        self
+    ) -> bool:
+        """Probe the API with a cheap command, the circuit breaker is updated by its response."""
+        try:
+            await self.execute("diag.ping")
+        except ZcsMowerApiCommunicationError:
+            # An error of the command is a valid response, too
+            if self.circuit_breaker.state != API_CIRCUIT_CLOSED:
+                raise
+        return True
 
     # Depending on the configuration, authenticate the app or the user, prefer the app.
     # https://github.com/deviceWISE/sample_tr50_python
@@ -229,6 +595,24 @@ class ZcsMowerApiClient:
             return await self.app_auth(self._app_id, self._app_token, self._thing_key)
         return False
 
+    # Refresh the session, if it is still the given invalid session.
+    # @param     string    invalid_session_id    The session ID, which is invalid or expired.
+    # @return    bool      Success or failure to authenticate.
+    async def refresh_auth(
+        self,
+        invalid_session_id: str | None = None,
+    ) -> bool:
+        """Refresh the session once for all concurrent callers.
+
+        The first caller authenticates, all others wait for the lock and use
+        the new session, if it differs from the one, which became invalid.
+        """
+        async with self._auth_lock:
+            if len(self._session_id) > 0 and self._session_id != invalid_session_id:
+                return True
+            LOGGER.debug("API.refresh_auth")
+            return await self.auth()
+
     # Authenticate the application.
     # https://github.com/deviceWISE/sample_tr50_python
     # @param     string    app_id                The application ID.
@@ -251,9 +635,12 @@ class ZcsMowerApiClient:
                 "thingKey": thing_key
             }
             response = await self.execute("api.authenticate", params)
-            if response is True:
+            if response.success:
                 if update_session_id:
-                    self._session_id = self._response["auth"]["params"]["sessionId"]
+                    self._session_id = response.params["sessionId"]
+                    self._session_refresh_at = (
+                        time.monotonic() + API_SESSION_LIFETIME - API_SESSION_REFRESH_MARGIN
+                    )
                 return True
             return False
         except ZcsMowerApiCommunicationError as exception:
@@ -263,20 +650,35 @@ class ZcsMowerApiClient:
         except Exception as exception:
             raise exception
 
-    # Return the response data for the last command if the last command was successful.
-    # https://github.com/deviceWISE/sample_tr50_python
-    # @return    dict    The response data.
-    async def get_response(
+    # Get the current session, so it can be restored after a restart.
+    # @return    dict|None    Session ID and wall clock time of its refresh, None without session.
+    def get_session(
         self
-    ) -> any:
-        """Return the response data for the last command if the last command was successful."""
-        if (
-            self._response_status
-            and len(self._response["data"]) > 0
-            and "params" in self._response["data"]
-        ):
-            return self._response["data"]["params"]
-        return None
+    ) -> dict[str, any] | None:
+        """Get the current session and the wall clock time, when it has to be refreshed."""
+        if len(self._session_id) == 0 or self._session_refresh_at is None:
+            return None
+        return {
+            "session_id": self._session_id,
+            "refresh_at": time.time() + self._session_refresh_at - time.monotonic(),
+        }
+
+    # Restore a stored session, if it has not to be refreshed yet.
+    # @param     string    session_id    The stored session ID.
+    # @param     float     refresh_at    Wall clock time, when the session has to be refreshed.
+    # @return    bool      True, if the session was restored.
+    def restore_session(
+        self,
+        session_id: str,
+        refresh_at: float,
+    ) -> bool:
+        """Restore a stored session, if it is still valid."""
+        remaining = refresh_at - time.time()
+        if len(session_id) == 0 or remaining <= 0:
+            return False
+        self._session_id = session_id
+        self._session_refresh_at = time.monotonic() + remaining
+        return True
 
     # This method checks the JSON command for the auth parameter. If it is not set, it adds.
     # https://github.com/deviceWISE/sample_tr50_python
@@ -291,8 +693,12 @@ class ZcsMowerApiClient:
             data = json.loads(data)
 
         if "auth" not in data:
-            if len(self._session_id) == 0:
-                await self.auth()
+            # Refresh session, if it is missing or runs out soon
+            if len(self._session_id) == 0 or (
+                self._session_refresh_at is not None
+                and time.monotonic() >= self._session_refresh_at
+            ):
+                await self.refresh_auth(self._session_id)
             # If it is still empty, we cannot proceed
             if len(self._session_id) == 0:
                 raise ZcsMowerApiAuthenticationError(
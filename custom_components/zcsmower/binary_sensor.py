@@ -27,12 +27,14 @@ from .const import (
     ATTR_LAST_SEEN,
     ATTR_LAST_PULL,
     ATTR_NEXT_PULL,
+    ATTR_ERROR,
 )
 from .coordinator import ZcsMowerDataUpdateCoordinator
 from .entity import (
     ZcsMowerRobotEntity,
     ZcsMowerConfigEntity,
 )
+from .models import get_robot_state_by_name
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -122,6 +124,18 @@ class ZcsMowerRobotBinarySensorEntity(ZcsMowerRobotEntity, BinarySensorEntity):
             entity_description=entity_description,
             imei=imei,
         )
+        if self._entity_key == "error":
+            self._subscribed_fields = frozenset({ATTR_STATE, ATTR_ERROR})
+        elif self._entity_key == "connection":
+            self._subscribed_fields = frozenset(
+                {
+                    ATTR_CONNECTED,
+                    ATTR_LAST_COMM,
+                    ATTR_LAST_SEEN,
+                    ATTR_LAST_PULL,
+                    ATTR_NEXT_PULL,
+                }
+            )
 
     def _update_extra_state_attributes(self) -> None:
         """Update extra attributes."""
@@ -142,13 +156,7 @@ class ZcsMowerRobotBinarySensorEntity(ZcsMowerRobotEntity, BinarySensorEntity):
     def is_on(self) -> bool:
         """Return True if the binary_sensor is on."""
         if self._entity_key == "error":
-            return self._get_attribute(ATTR_STATE) in (
-                "fail",
-                "nosignal",
-                "expired",
-                "renewed",
-                "hot_temperature",
-            )
+            return get_robot_state_by_name(self._get_attribute(ATTR_STATE)).error
         elif self._entity_key == "connection":
             return (self._get_attribute(ATTR_CONNECTED) is True)
 
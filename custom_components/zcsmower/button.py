@@ -89,6 +89,9 @@ async def async_setup_entry(
 class ZcsMowerRobotButtonEntity(ZcsMowerRobotEntity, ButtonEntity):
     """Representation of a ZCS Lawn Mower Robot button."""
 
+    # Only the availability is rendered
+    _subscribed_fields = frozenset()
+
     def __init__(
         self,
         hass: HomeAssistant,
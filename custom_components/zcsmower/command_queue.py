@@ -0,0 +1,269 @@
+"""ZCS Lawn Mower Robot command queue."""
+from __future__ import annotations
+
+import asyncio
+
+from collections.abc import (
+    Awaitable,
+    Callable,
+)
+from dataclasses import (
+    dataclass,
+    field,
+)
+from time import monotonic
+
+from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+
+from .const import (
+    LOGGER,
+    COMMAND_SUPERSEDE_PARAMS,
+)
+
+
+class ZcsMowerCommandSupersededError(Exception):
+    """Exception to indicate, that a pending command was replaced by a newer one."""
+
+
+@dataclass(slots=True)
+class ZcsMowerCommand:
+    """Pending command of a lawn mower.
+
+    Callers of an identical command share it and get its result.
+    """
+
+    method: str
+    params: dict[str, any] | list[any] | None
+    enqueued: float
+    futures: list[asyncio.Future] = field(default_factory=list)
+
+    def set_result(
+        self,
+        result: bool,
+    ) -> None:
+        """Set result for all callers."""
+        for future in self.futures:
+            if not future.done():
+                future.set_result(result)
+
+    def set_exception(
+        self,
+        exception: BaseException,
+    ) -> None:
+        """Set exception for all callers."""
+        for future in self.futures:
+            if not future.done():
+                future.set_exception(exception)
+
+    def is_superseded_by(
+        self,
+        method: str,
+        params: dict[str, any] | list[any] | None,
+    ) -> bool:
+        """Check if the command is replaced by a newer one with other params."""
+        if method != self.method or (keys := COMMAND_SUPERSEDE_PARAMS.get(method)) is None:
+            return False
+        if params == self.params:
+            return False
+        if not keys:
+            return True
+        if not isinstance(params, dict) or not isinstance(self.params, dict):
+            return False
+        return all(
+            params.get(key) is not None and params.get(key) == self.params.get(key)
+            for key in keys
+        )
+
+
+@dataclass(slots=True)
+class ZcsMowerCommandMetrics:
+    """Command queue metrics of a lawn mower."""
+
+    enqueued: int = 0
+    executed: int = 0
+    superseded: int = 0
+    failed: int = 0
+    depth: int = 0
+    depth_max: int = 0
+    latency_last: float | None = None
+    latency_max: float | None = None
+    latency_total: float = 0.0
+
+    def add_latency(
+        self,
+        latency: float,
+    ) -> None:
+        """Add time from enqueueing until the end of execution of a command."""
+        self.executed += 1
+        self.latency_last = latency
+        self.latency_max = max(self.latency_max or 0.0, latency)
+        self.latency_total += latency
+
+    def as_dict(self) -> dict[str, any]:
+        """Return metrics as dict."""
+        return {
+            "enqueued": self.enqueued,
+            "executed": self.executed,
+            "superseded": self.superseded,
+            "failed": self.failed,
+            "depth": self.depth,
+            "depth_max": self.depth_max,
+            "latency_last": (
+                round(self.latency_last, 3) if self.latency_last is not None else None
+            ),
+            "latency_average": (
+                round(self.latency_total / self.executed, 3) if self.executed else None
+            ),
+            "latency_max": (
+                round(self.latency_max, 3) if self.latency_max is not None else None
+            ),
+        }
+
+
+class ZcsMowerCommandQueue:
+    """Serialize the commands of each lawn mower.
+
+    Commands of a lawn mower are executed in order by one task. The last
+    pending command of a method in COMMAND_SUPERSEDE_PARAMS is replaced by a
+    newer one of the same method with other params, so several work_until in
+    a row execute only the last one. Its callers get
+    ZcsMowerCommandSupersededError. An identical command is executed once for
+    all its callers. The lawn mower is prepared once for all commands, which
+    are pending when it is awake.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        prepare: Callable[[str], Awaitable[bool]],
+        execute: Callable[[str, str, dict[str, any] | list[any] | None], Awaitable[bool]],
+    ) -> None:
+        """Initialize the command queue.
+
+        Args:
+            hass (HomeAssistant): Home Assistant instance.
+            config_entry (ConfigEntry): Config entry, which owns the queue tasks.
+            prepare (Callable): Wakes up the lawn mower, raises TimeoutError if it is not available.
+            execute (Callable): Executes a method on the prepared lawn mower.
+
+        """
+        self._hass = hass
+        self._config_entry = config_entry
+        self._prepare = prepare
+        self._execute = execute
+        self._pending: dict[str, list[ZcsMowerCommand]] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+
+        self.metrics: dict[str, ZcsMowerCommandMetrics] = {}
+
+    def _get_metrics(
+        self,
+        imei: str,
+    ) -> ZcsMowerCommandMetrics:
+        """Get metrics of the lawn mower, create them on first use."""
+        if (metrics := self.metrics.get(imei)) is None:
+            metrics = self.metrics[imei] = ZcsMowerCommandMetrics()
+        return metrics
+
+    async def async_send(
+        self,
+        imei: str,
+        method: str,
+        params: dict[str, any] | list[any] | None = None,
+    ) -> bool:
+        """Enqueue a command and wait for its result."""
+        future = self._hass.loop.create_future()
+        # Retrieve the exception, if the caller was cancelled
+        future.add_done_callback(
+            lambda done: done.cancelled() or done.exception()
+        )
+        metrics = self._get_metrics(imei)
+        metrics.enqueued += 1
+
+        pending = self._pending.setdefault(imei, [])
+        # Only the last command is replaced, so the order of other methods is kept
+        last = pending[-1] if pending else None
+        if last is not None and last.method == method and last.params == params:
+            last.futures.append(future)
+        else:
+            if last is not None and last.is_superseded_by(method, params):
+                pending.pop()
+                last.set_exception(
+                    ZcsMowerCommandSupersededError(
+                        f"Command {method} for {imei} superseded by a newer one"
+                    )
+                )
+                metrics.superseded += 1
+                LOGGER.debug("Command %s for %s superseded, params %s replaced by %s", method, imei, last.params, params)
+            pending.append(
+                ZcsMowerCommand(
+                    method=method,
+                    params=params,
+                    enqueued=monotonic(),
+                    futures=[future],
+                )
+            )
+        metrics.depth = len(pending)
+        metrics.depth_max = max(metrics.depth_max, metrics.depth)
+
+        if imei not in self._tasks:
+            self._tasks[imei] = self._config_entry.async_create_background_task(
+                self._hass,
+                self._async_process(imei),
+                f"zcsmower_command_queue_{imei}",
+            )
+        # Cancelling the caller must not cancel the command for the other callers
+        return await asyncio.shield(future)
+
+    async def _async_process(
+        self,
+        imei: str,
+    ) -> None:
+        """Prepare the lawn mower and execute its pending commands in order."""
+        metrics = self._get_metrics(imei)
+        commands: list[ZcsMowerCommand] = []
+        try:
+            while self._pending.get(imei):
+                try:
+                    await self._prepare(imei)
+                except Exception as exception:  # pylint: disable=broad-except
+                    if isinstance(exception, TimeoutError):
+                        LOGGER.error(exception)
+                    else:
+                        LOGGER.error("Preparation of %s failed: %s", imei, exception, exc_info=exception)
+                    commands = self._pending.pop(imei, [])
+                    metrics.depth = 0
+                    metrics.failed += len(commands)
+                    for command in commands:
+                        command.set_result(False)
+                    continue
+
+                # All commands pending now run on this wake-up
+                commands = self._pending.pop(imei, [])
+                metrics.depth = 0
+                while commands:
+                    command = commands.pop(0)
+                    try:
+                        result = await self._execute(imei, command.method, command.params)
+                    except Exception as exception:  # pylint: disable=broad-except
+                        metrics.failed += 1
+                        command.set_exception(exception)
+                    else:
+                        metrics.add_latency(monotonic() - command.enqueued)
+                        command.set_result(result)
+        finally:
+            self._tasks.pop(imei, None)
+            # Callers must not wait forever, if the task was cancelled on unload
+            for command in (*commands, *self._pending.pop(imei, [])):
+                for future in command.futures:
+                    future.cancel()
+            metrics.depth = 0
+
+    def as_dict(self) -> dict[str, any]:
+        """Return command queue metrics per lawn mower."""
+        return {
+            imei: metrics.as_dict()
+            for imei, metrics in self.metrics.items()
+        }
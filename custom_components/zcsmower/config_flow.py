@@ -23,10 +23,6 @@ from homeassistant.helpers import (
     entity_registry as er,
     selector,
 )
-from homeassistant.helpers.aiohttp_client import (
-    async_create_clientsession,
-    async_get_clientsession,
-)
 import voluptuous as vol
 
 from .const import (
@@ -51,6 +47,7 @@ from .const import (
     CONF_MAP_ROTATION,
     CONF_MAP_POINTS,
     CONF_MAP_DRAW_LINES,
+    CONF_MAP_IMAGE_FORMAT,
     CONF_HIBERNATION_ENABLE,
     CONF_MOWERS,
     ATTR_IMEI,
@@ -62,6 +59,8 @@ from .const import (
     STANDBY_TIME_STOP_DEFAULT,
     LOCATION_HISTORY_ITEMS_DEFAULT,
     MAP_POINTS_DEFAULT,
+    MAP_IMAGE_FORMAT_DEFAULT,
+    MAP_IMAGE_FORMATS,
 )
 from .api import (
     ZcsMowerApiClient,
@@ -70,6 +69,7 @@ from .api import (
     ZcsMowerApiError,
 )
 from .helpers import (
+    async_get_api_session,
     delete_robot_client,
     get_client_key,
     get_first_empty_robot_client,
@@ -83,7 +83,7 @@ from .helpers import (
 class ZcsMowerConfigFlow(ConfigFlow, domain=DOMAIN):
     """ZCS Lawn Mower config flow."""
 
-    VERSION = 12
+    VERSION = 13
     CONNECTION_CLASS = CONN_CLASS_CLOUD_POLL
 
     def __init__(self) -> None:
@@ -106,7 +106,7 @@ class ZcsMowerConfigFlow(ConfigFlow, domain=DOMAIN):
 
             try:
                 client = ZcsMowerApiClient(
-                    session=async_create_clientsession(self.hass),
+                    session=async_get_api_session(self.hass),
                     options={
                         "endpoint": API_BASE_URI,
                     },
@@ -153,6 +153,7 @@ class ZcsMowerConfigFlow(ConfigFlow, domain=DOMAIN):
                     CONF_MAP_HISTORY_ENABLE: True,
                     CONF_MAP_POINTS: int(MAP_POINTS_DEFAULT),
                     CONF_MAP_DRAW_LINES: True,
+                    CONF_MAP_IMAGE_FORMAT: MAP_IMAGE_FORMAT_DEFAULT,
                     CONF_HIBERNATION_ENABLE: False,
                     CONF_MOWERS: {},
                 }
@@ -336,7 +337,7 @@ class ZcsMowerConfigFlow(ConfigFlow, domain=DOMAIN):
             try:
                 client_key = self._options[CONF_CLIENT_KEY]
                 client = ZcsMowerApiClient(
-                    session=async_get_clientsession(self.hass),
+                    session=async_get_api_session(self.hass),
                     options={
                         "endpoint": API_BASE_URI,
                         "app_id": client_key,
@@ -477,7 +478,7 @@ class ZcsMowerOptionsFlowHandler(OptionsFlow):
                 try:
                     client_key = self.options[CONF_CLIENT_KEY]
                     client = ZcsMowerApiClient(
-                        session=async_get_clientsession(self.hass),
+                        session=async_get_api_session(self.hass),
                         options={
                             "endpoint": API_BASE_URI,
                             "app_id": client_key,
@@ -698,7 +699,7 @@ class ZcsMowerOptionsFlowHandler(OptionsFlow):
                     try:
                         client_key = self.options[CONF_CLIENT_KEY]
                         client = ZcsMowerApiClient(
-                            session=async_get_clientsession(self.hass),
+                            session=async_get_api_session(self.hass),
                             options={
                                 "endpoint": API_BASE_URI,
                                 "app_id": client_key,
@@ -788,6 +789,9 @@ class ZcsMowerOptionsFlowHandler(OptionsFlow):
                             user_input.get(CONF_MAP_POINTS, MAP_POINTS_DEFAULT)
                         ),
                         CONF_MAP_DRAW_LINES: user_input.get(CONF_MAP_DRAW_LINES, False),
+                        CONF_MAP_IMAGE_FORMAT: user_input.get(
+                            CONF_MAP_IMAGE_FORMAT, MAP_IMAGE_FORMAT_DEFAULT
+                        ),
                     }
                 )
                 if user_input.get(CONF_MAP_GPS_TOP_LEFT):
@@ -899,6 +903,19 @@ class ZcsMowerOptionsFlowHandler(OptionsFlow):
                             CONF_MAP_DRAW_LINES, False
                         ),
                     ): selector.BooleanSelector(),
+                    vol.Required(
+                        CONF_MAP_IMAGE_FORMAT,
+                        default=(user_input or self.options).get(
+                            CONF_MAP_IMAGE_FORMAT, MAP_IMAGE_FORMAT_DEFAULT
+                        ),
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=list(MAP_IMAGE_FORMATS.keys()),
+                            mode=selector.SelectSelectorMode.DROPDOWN,
+                            translation_key=CONF_MAP_IMAGE_FORMAT,
+                            multiple=False,
+                        )
+                    ),
                 }
             ),
             errors=errors,
@@ -937,7 +954,7 @@ class ZcsMowerOptionsFlowHandler(OptionsFlow):
 
                 try:
                     client = ZcsMowerApiClient(
-                        session=async_create_clientsession(self.hass),
+                        session=async_get_api_session(self.hass),
                         options={
                             "endpoint": API_BASE_URI,
                         },
@@ -15,6 +15,8 @@ from homeassistant.helpers import config_validation as cv
 LOGGER = getLogger(__package__)
 
 DOMAIN = "zcsmower"
+DATA_API_SESSION = "api_session"
+DATA_API_METRICS = "api_metrics"
 PLATFORMS = [
     Platform.BINARY_SENSOR,
     Platform.BUTTON,
@@ -47,6 +49,7 @@ CONF_MAP_GPS_BOTTOM_RIGHT = "map_gps_bottom_right"
 CONF_MAP_ROTATION = "map_rotation"
 CONF_MAP_POINTS = "map_points"
 CONF_MAP_DRAW_LINES = "map_draw_lines"
+CONF_MAP_IMAGE_FORMAT = "map_image_format"
 CONF_HIBERNATION_ENABLE = "hibernation_enable"
 CONF_MOWERS = "lawn_mowers"
 
@@ -60,6 +63,8 @@ ATTR_SERIAL_NUMBER = "serial_number"
 ATTR_WORKING = "working"
 ATTR_ERROR = "error"
 ATTR_CALIBRATION = "calibration_points"
+ATTR_RENDER_COUNT = "render_count"
+ATTR_RENDER_SKIP_RATE = "render_skip_rate"
 ATTR_LOCATION_HISTORY = "location_history"
 ATTR_AVAILABLE = "available"
 ATTR_CONNECTED = "connected"
@@ -187,7 +192,46 @@ API_CLIENT_KEY_DEFAULT = "homeassistantzcsmowerintegra"
 API_CLIENT_KEY_LENGTH = 28
 API_DATETIME_FORMAT_DEFAULT = "%Y-%m-%dT%H:%M:%S.%f%z"
 API_DATETIME_FORMAT_FALLBACK = "%Y-%m-%dT%H:%M:%S%z"
+API_DATETIME_CACHE_SIZE = 256
 API_ACK_TIMEOUT = 30
+API_SESSION_LIFETIME = 1800
+API_SESSION_REFRESH_MARGIN = 60
+API_TIMEOUT_TOTAL = 60
+API_TIMEOUT_CONNECT = 10
+API_TIMEOUT_SOCK_READ = 45
+API_KEEPALIVE_TIMEOUT = 60
+API_DNS_CACHE_TTL = 300
+API_CONNECTIONS_PER_HOST = 4
+API_LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+# Circuit breaker of the API opens after this number of failed requests in a row
+API_CIRCUIT_FAILURE_THRESHOLD = 3
+# Seconds until the first probe, doubled after every failed probe
+API_CIRCUIT_BACKOFF_INITIAL = 60
+API_CIRCUIT_BACKOFF_MAX = 3600
+# Random part of the backoff, so clients sharing the app token do not probe at once
+API_CIRCUIT_BACKOFF_JITTER = 0.2
+# Seconds until a probe without result is given up and the circuit opens again
+API_CIRCUIT_PROBE_TIMEOUT = API_TIMEOUT_TOTAL + 10
+API_CIRCUIT_CLOSED = "closed"
+API_CIRCUIT_OPEN = "open"
+API_CIRCUIT_HALF_OPEN = "half_open"
+API_CIRCUIT_STATES = (
+    API_CIRCUIT_CLOSED,
+    API_CIRCUIT_OPEN,
+    API_CIRCUIT_HALF_OPEN,
+)
+# Fields of thing.list, which change between polls
+API_FIELDS_HOT = (
+    "key",
+    "connected",
+    "lastSeen",
+    "lastCommunication",
+    "alarms",
+)
+# Fields of thing.list, which are effectively static
+API_FIELDS_STATIC = (
+    "attrs",
+)
 
 CONFIGURATION_DEFAULTS = {
     CONF_UPDATE_INTERVAL_WORKING: {
@@ -237,10 +281,76 @@ CONFIGURATION_DEFAULTS = {
 STANDBY_TIME_START_DEFAULT = "08:00:00"
 STANDBY_TIME_STOP_DEFAULT = "22:00:00"
 
+# Lawn mowers due within this number of seconds are pulled together
+UPDATE_INTERVAL_TOLERANCE = 5
+# Static attributes of lawn mowers are refreshed after this number of seconds
+STATIC_ATTRIBUTES_REFRESH_INTERVAL = 21600
+
+# Connection state of woken up lawn mowers is polled with exponential backoff
+WAKE_UP_POLL_DELAY_INITIAL = 5
+WAKE_UP_POLL_DELAY_MAX = 30
+WAKE_UP_POLL_BACKOFF_FACTOR = 2
+# Random part of a poll delay, so polls of several config entries do not align
+WAKE_UP_POLL_JITTER = 0.2
+
+# A pending command of these methods is replaced by a newer one of the same
+# method, if the listed params are equal, e.g. keep_out of the same zone
+COMMAND_SUPERSEDE_PARAMS = {
+    "work_until": (),
+    "charge_until": (),
+    "set_profile": (),
+    "keep_out": ("index",),
+}
+
 LOCATION_HISTORY_DAYS_DEFAULT = 7
 LOCATION_HISTORY_ITEMS_DEFAULT = 200
+# Recorder states are read backwards in pages of this size
+LOCATION_HISTORY_QUERY_LIMIT = 200
+
+# Last known state of the lawn mowers is stored for the next start
+STORAGE_VERSION = 1
+# Changes are written at most once within this number of seconds
+STORAGE_SAVE_DELAY = 30
+# Number of newest locations of the location history, which are stored
+STORAGE_LOCATION_HISTORY_ITEMS = 50
 
 MAP_POINTS_DEFAULT = 100
+MAP_IMAGE_SIZE_MAX = 4096
+MAP_IMAGE_FORMAT_DEFAULT = "png"
+MAP_IMAGE_FORMATS = {
+    "png": {
+        "format": "PNG",
+        "content_type": "image/png",
+        "params": {
+            "compress_level": 3,
+        },
+    },
+    "png_palette": {
+        "format": "PNG",
+        "content_type": "image/png",
+        "colors": 256,
+        "params": {
+            "compress_level": 9,
+            "optimize": True,
+        },
+    },
+    "webp": {
+        "format": "WEBP",
+        "content_type": "image/webp",
+        "params": {
+            "quality": 80,
+            "method": 4,
+        },
+    },
+    "jpeg": {
+        "format": "JPEG",
+        "content_type": "image/jpeg",
+        "params": {
+            "quality": 85,
+            "optimize": True,
+        },
+    },
+}
 
 MANUFACTURER_DEFAULT = "Zucchetti Centro Sistemi"
 MANUFACTURER_MAP = {
@@ -8,8 +8,12 @@ from datetime import (
     datetime,
     time,
 )
+from time import monotonic
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import (
+    callback,
+    HomeAssistant,
+)
 from homeassistant.const import (
     ATTR_NAME,
     ATTR_ICON,
@@ -28,7 +32,7 @@ from homeassistant.components.recorder import (
     get_instance,
     history,
 )
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
@@ -41,6 +45,10 @@ from .api import (
     ZcsMowerApiAuthenticationError,
     ZcsMowerApiError,
 )
+from .helpers import (
+    async_get_api_session,
+    parse_api_datetime,
+)
 from .const import (
     LOGGER,
     DOMAIN,
@@ -57,7 +65,6 @@ from .const import (
     CONF_WAKE_UP_TIMEOUT,
     CONF_HIBERNATION_ENABLE,
     CONF_MOWERS,
-    ATTR_IMEI,
     ATTR_DATA_THRESHOLD,
     ATTR_CONNECT_EXPIRATION,
     ATTR_INFINITY_STATE,
@@ -71,28 +78,42 @@ from .const import (
     ATTR_LAST_COMM,
     ATTR_LAST_SEEN,
     ATTR_LAST_PULL,
+    ATTR_NEXT_PULL,
     ATTR_LAST_STATE,
     ATTR_LAST_WAKE_UP,
     ATTR_LAST_TRACE_POSITION,
     API_BASE_URI,
     API_APP_TOKEN,
-    API_DATETIME_FORMAT_DEFAULT,
-    API_DATETIME_FORMAT_FALLBACK,
     API_ACK_TIMEOUT,
+    API_FIELDS_HOT,
+    API_FIELDS_STATIC,
     STANDBY_TIME_START_DEFAULT,
     STANDBY_TIME_STOP_DEFAULT,
+    UPDATE_INTERVAL_TOLERANCE,
+    STATIC_ATTRIBUTES_REFRESH_INTERVAL,
     CONFIGURATION_DEFAULTS,
     LOCATION_HISTORY_DAYS_DEFAULT,
     LOCATION_HISTORY_ITEMS_DEFAULT,
-    MANUFACTURER_DEFAULT,
+    LOCATION_HISTORY_QUERY_LIMIT,
+    STORAGE_VERSION,
+    STORAGE_SAVE_DELAY,
+    STORAGE_LOCATION_HISTORY_ITEMS,
     MANUFACTURER_MAP,
     ROBOT_MODELS,
-    ROBOT_STATES,
-    ROBOT_STATES_WORKING,
     ROBOT_ERRORS,
-    DATA_THRESHOLD_STATES,
-    INFINITY_PLAN_STATES,
 )
+from .models import (
+    ZcsMowerLocationHistory,
+    ZcsMowerState,
+    get_robot_state,
+    get_data_threshold_state,
+    get_infinity_plan_state,
+)
+from .command_queue import (
+    ZcsMowerCommandQueue,
+    ZcsMowerCommandSupersededError,
+)
+from .wake_up import ZcsMowerWakeUpOrchestrator
 
 
 # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
@@ -119,7 +140,7 @@ class ZcsMowerDataUpdateCoordinator(DataUpdateCoordinator):
         )
         self.config_entry = config_entry
         self.client = ZcsMowerApiClient(
-            session=async_get_clientsession(hass),
+            session=async_get_api_session(hass),
             options={
                 "endpoint": API_BASE_URI,
                 "app_id": config_entry.options.get(CONF_CLIENT_KEY, ""),
@@ -129,34 +150,13 @@ class ZcsMowerDataUpdateCoordinator(DataUpdateCoordinator):
         )
         self.mowers = dict(config_entry.options.get(CONF_MOWERS, []))
 
-        self.data = {}
-        for _imei, _mower in self.mowers.items():
-            self.data[_imei] = {
-                ATTR_IMEI: _imei,
-                ATTR_NAME: _mower.get(ATTR_NAME, _imei),
-                ATTR_STATE: None,
-                ATTR_DATA_THRESHOLD: None,
-                ATTR_CONNECT_EXPIRATION: None,
-                ATTR_INFINITY_STATE: None,
-                ATTR_INFINITY_EXPIRATION: None,
-                ATTR_ICON: None,
-                ATTR_WORKING: False,
-                ATTR_AVAILABLE: False,
-                ATTR_ERROR: None,
-                ATTR_LOCATION: {},
-                ATTR_LOCATION_HISTORY: None,
-                ATTR_SERIAL_NUMBER: None,
-                ATTR_MANUFACTURER: MANUFACTURER_DEFAULT,
-                ATTR_MODEL: None,
-                ATTR_SW_VERSION: None,
-                ATTR_CONNECTED: False,
-                ATTR_LAST_COMM: None,
-                ATTR_LAST_SEEN: None,
-                ATTR_LAST_PULL: None,
-                ATTR_LAST_STATE: None,
-                ATTR_LAST_WAKE_UP: None,
-                ATTR_LAST_TRACE_POSITION: None,
-            }
+        self.data: dict[str, ZcsMowerState] = {
+            _imei: ZcsMowerState(
+                imei=_imei,
+                name=_mower.get(ATTR_NAME, _imei),
+            )
+            for _imei, _mower in self.mowers.items()
+        }
 
         self.hibernation_enable = self.config_entry.options.get(CONF_HIBERNATION_ENABLE, False)
         self.standby_time_start = datetime.strptime(
@@ -169,20 +169,51 @@ class ZcsMowerDataUpdateCoordinator(DataUpdateCoordinator):
         )
         self.next_pull = None
 
+        # Last refresh of static attributes per lawn mower
+        self._static_attributes_pulls: dict[str, datetime] = {}
+
+        # Fields changed per lawn mower since listeners were last updated
+        self._changed_fields: dict[str, set[str]] = {}
+        self._changed_fields_all = True
+
         self._loop = asyncio.get_event_loop()
         self._scheduled_update_listeners: asyncio.TimerHandle | None = None
         self._scheduled_update_entry: asyncio.TimerHandle | None = None
+        self._scheduled_location_history: asyncio.TimerHandle | None = None
+        self._location_history_entities: dict[str, str] = {}
+        self.location_history_load: dict[str, any] | None = None
+
+        # Last known state of the lawn mowers for the next start, contains the session ID
+        self._store = Store(
+            hass,
+            STORAGE_VERSION,
+            f"{DOMAIN}.{config_entry.entry_id}",
+            private=True,
+        )
+        self.restored = False
+
+        # Commands for lawn mowers, which are woken up, share one waiter per lawn mower
+        self.wake_up = ZcsMowerWakeUpOrchestrator(
+            hass=hass,
+            config_entry=config_entry,
+            fetch=self._async_fetch_woken_up_mowers,
+        )
+        # Commands are serialized per lawn mower and superseded while pending
+        self.command_queue = ZcsMowerCommandQueue(
+            hass=hass,
+            config_entry=config_entry,
+            prepare=self.async_prepare_for_command,
+            execute=self._async_execute_command,
+        )
+        self._command_batch: list[tuple[str, str, dict[str, any] | list[any] | None, asyncio.Future]] = []
 
     def _convert_datetime_from_api(
         self,
         date_string: str,
     ) -> datetime:
         """Convert datetime string from API data into datetime object."""
-        try:
-            _dt = datetime.strptime(date_string, API_DATETIME_FORMAT_DEFAULT)
-        except ValueError:
-            _dt = datetime.strptime(date_string, API_DATETIME_FORMAT_FALLBACK)
-        return dt_util.as_local(_dt)
+        # Time zone of Home Assistant may change, so it is not part of the memoized value
+        return dt_util.as_local(parse_api_datetime(date_string))
 
     def _get_datetime_now(self) -> datetime:
         """Get current datetime in local time."""
@@ -208,30 +239,96 @@ class ZcsMowerDataUpdateCoordinator(DataUpdateCoordinator):
         """Set up a ZCS Mower instance."""
         await self.client.auth()
 
+    async def async_restore(self) -> bool:
+        """Restore last known state of the lawn mowers and the session from the store.
+
+        Returns True, if at least one lawn mower was restored. Its entities can
+        then be set up without waiting for the API.
+        """
+        try:
+            stored = await self._store.async_load()
+        except Exception as exception:  # pylint: disable=broad-except
+            LOGGER.warning("Stored state could not be loaded: %s", exception)
+            return False
+        if not stored:
+            return False
+
+        if (session := stored.get("session", None)) is not None:
+            self.client.restore_session(
+                session.get("session_id", ""),
+                session.get("refresh_at", 0.0),
+            )
+        for imei, stored_mower in stored.get("mowers", {}).items():
+            if imei not in self.data:
+                continue
+            self.data[imei] = ZcsMowerState.from_storage(
+                imei=imei,
+                name=self.data[imei][ATTR_NAME],
+                data=stored_mower.get("state", {}),
+            )
+            if (
+                (static_attributes_pull := stored_mower.get("static_attributes_pull", None)) is not None
+                and (static_attributes_pull := dt_util.parse_datetime(static_attributes_pull)) is not None
+            ):
+                self._static_attributes_pulls[imei] = static_attributes_pull
+            self.restored = True
+        LOGGER.debug("Restored stored state: %s", self.restored)
+        return self.restored
+
+    def _get_snapshot(self) -> dict[str, any]:
+        """Get last known state of the lawn mowers and the session for the store."""
+        return {
+            "session": self.client.get_session(),
+            "mowers": {
+                imei: {
+                    "state": mower.as_storage(STORAGE_LOCATION_HISTORY_ITEMS),
+                    "static_attributes_pull": (
+                        static_attributes_pull.isoformat()
+                        if (static_attributes_pull := self._static_attributes_pulls.get(imei)) is not None
+                        else None
+                    ),
+                }
+                for imei, mower in self.data.items()
+            },
+        }
+
+    async def async_save(self) -> None:
+        """Write last known state of the lawn mowers into the store at once."""
+        await self._store.async_save(self._get_snapshot())
+
     async def __aenter__(self):
         """Return Self."""
         return self
 
     async def __aexit__(self, *excinfo):
-        """Close Session before class is destroyed."""
-        await self.client._session.close()
+        """Keep the client session, it is shared and closed by Home Assistant."""
 
     async def _async_update_data(self):
         """Update data via library."""
         try:
-            # Update all mowers.
-            await self.async_fetch_all_mowers()
+            # Probe the API with a cheap request first, while it is not available
+            if self.client.circuit_breaker.is_probe_due():
+                await self.client.probe()
+
+            # Update all due mowers.
+            due_imeis = self.get_due_mowers()
+            await self.async_fetch_all_mowers(due_imeis)
 
             LOGGER.debug("_async_update_data")
             LOGGER.debug(self.data)
 
             # Set update interval
-            self.set_update_interval()
+            self.set_update_interval(due_imeis)
 
             return self.data
         except ZcsMowerApiAuthenticationError as exception:
             raise ConfigEntryAuthFailed(exception) from exception
         except ZcsMowerApiError as exception:
+            # Next update is the probe of the open circuit breaker
+            if (retry_in := self.client.circuit_breaker.retry_in) is not None:
+                self.update_interval = timedelta(
+                    seconds=max(retry_in, UPDATE_INTERVAL_TOLERANCE)
+                )
             raise UpdateFailed(exception) from exception
 
     async def _async_update_listeners(self) -> None:
@@ -243,6 +340,44 @@ class ZcsMowerDataUpdateCoordinator(DataUpdateCoordinator):
             lambda: self.async_update_listeners(),
         )
 
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all registered listeners and reset the changed fields."""
+        super().async_update_listeners()
+        self._changed_fields = {}
+        self._changed_fields_all = False
+        # Changes are written delayed and with the final write on shutdown
+        self._store.async_delay_save(self._get_snapshot, STORAGE_SAVE_DELAY)
+
+    def _mark_changed(
+        self,
+        imei: str,
+        *fields: str,
+    ) -> None:
+        """Mark fields of a lawn mower as changed."""
+        self._changed_fields.setdefault(imei, set()).update(fields)
+
+    def _set_mower_attributes(
+        self,
+        imei: str,
+        **attributes: any,
+    ) -> None:
+        """Replace the lawn mower by a copy with the given attributes."""
+        mower = self.data[imei].copy()
+        for key, value in attributes.items():
+            mower[key] = value
+        self.data[imei] = mower
+        self._mark_changed(imei, *attributes)
+
+    def get_changed_fields(
+        self,
+        imei: str,
+    ) -> set[str] | None:
+        """Get changed fields of a lawn mower, None if all fields have to be considered as changed."""
+        if self._changed_fields_all:
+            return None
+        return self._changed_fields.get(imei, set())
+
     async def async_set_entry_option(
         self,
         key: str,
@@ -267,7 +402,7 @@ class ZcsMowerDataUpdateCoordinator(DataUpdateCoordinator):
     def get_mower_attributes(
         self,
         imei: str,
-    ) -> dict[str, any] | None:
+    ) -> ZcsMowerState | None:
         """Get attributes of an given lawn mower."""
         return self.data.get(imei, None)
 
@@ -277,45 +412,123 @@ class ZcsMowerDataUpdateCoordinator(DataUpdateCoordinator):
         imei: str,
     ) -> None:
         """Initiate location history for lawn mower."""
-        # Load Recorder after loading entity
-        await get_instance(self.hass).async_add_executor_job(
-            self.get_location_history,
-            entity_id,
-            imei,
+        # Collect locations of polls while the recorder is loading
+        if self.data[imei][ATTR_LOCATION_HISTORY] is None:
+            self._set_mower_attributes(imei, **{ATTR_LOCATION_HISTORY: ZcsMowerLocationHistory()})
+
+        # Load location history of all lawn mowers in one recorder job
+        # after the last device tracker was added
+        self._location_history_entities[imei] = entity_id
+        if self._scheduled_location_history:
+            self._scheduled_location_history.cancel()
+        self._scheduled_location_history = self.hass.loop.call_later(
+            1,
+            lambda: self.hass.async_create_task(
+                self._async_load_location_histories()
+            ),
         )
+
+    async def _async_load_location_histories(self) -> None:
+        """Load location history of all registered lawn mowers from the recorder."""
+        self._scheduled_location_history = None
+        entity_ids = self._location_history_entities
+        self._location_history_entities = {}
+        if len(entity_ids) == 0:
+            return None
+
+        load_start = monotonic()
+        histories, rows = await get_instance(self.hass).async_add_executor_job(
+            self.get_location_histories,
+            entity_ids,
+        )
+        for imei, locations in histories.items():
+            # Recorded locations precede the polled and the restored ones,
+            # which are skipped, if the recorder knows them already
+            location_history = ZcsMowerLocationHistory()
+            recorded_until = locations[-1][1] if locations else 0.0
+            for location, timestamp in locations:
+                location_history.append(location, timestamp)
+            for location, timestamp in self.data[imei][ATTR_LOCATION_HISTORY].items():
+                if timestamp > recorded_until:
+                    location_history.append(location, timestamp)
+            self._set_mower_attributes(imei, **{ATTR_LOCATION_HISTORY: location_history})
+
+        self.location_history_load = {
+            "mowers": len(histories),
+            "rows": rows,
+            "locations": sum(len(locations) for locations in histories.values()),
+            "duration": round(monotonic() - load_start, 3),
+        }
+        LOGGER.debug("Location history loaded: %s", self.location_history_load)
         # Always update HA states after getting location history.
         self.hass.async_create_task(
             self._async_update_listeners()
         )
 
+    def get_location_histories(
+        self,
+        entity_ids: dict[str, str],
+    ) -> tuple[dict[str, list[tuple[tuple[float, float], float]]], int]:
+        """Get locations of the given lawn mowers from the recorder and the number of read rows."""
+        histories = {}
+        rows = 0
+        for imei, entity_id in entity_ids.items():
+            histories[imei], entity_rows = self.get_location_history(entity_id)
+            rows += entity_rows
+        return histories, rows
+
     def get_location_history(
         self,
         entity_id: str,
-        imei: str,
-    ) -> None:
-        """Get location history for lawn mower."""
-        if self.data[imei][ATTR_LOCATION_HISTORY] is None:
-            self.data[imei][ATTR_LOCATION_HISTORY] = []
-
-        # Getting history with history.get_last_state_changes can cause instability
-        # because it has to scan the table to find the last number_of_states states
-        # because the metadata_id_last_updated_ts index is in ascending order.
-        history_list = history.state_changes_during_period(
-            self.hass,
-            start_time=self._get_datetime_now() - timedelta(days=LOCATION_HISTORY_DAYS_DEFAULT),
-            entity_id=entity_id,
-            no_attributes=False,
-            include_start_time_state=True,
-        )
-        for state in history_list.get(entity_id, []):
-            if state.state not in (STATE_UNKNOWN, STATE_UNAVAILABLE, None):
+    ) -> tuple[list[tuple[tuple[float, float], float]], int]:
+        """Get locations and their timestamps for lawn mower from the recorder.
+
+        States are read backwards in pages, until enough locations are found
+        or the period of the location history is reached.
+        """
+        locations = []
+        rows = 0
+        start_time = self._get_datetime_now() - timedelta(days=LOCATION_HISTORY_DAYS_DEFAULT)
+        end_time = None
+        # One more location, so the repetitions of the oldest one are complete
+        while len(locations) <= LOCATION_HISTORY_ITEMS_DEFAULT:
+            # Getting history with history.get_last_state_changes can cause instability
+            # because it has to scan the table to find the last number_of_states states
+            # because the metadata_id_last_updated_ts index is in ascending order.
+            # A bounded period in descending order with a limit reads only one page.
+            page = history.state_changes_during_period(
+                self.hass,
+                start_time=start_time,
+                end_time=end_time,
+                entity_id=entity_id,
+                no_attributes=False,
+                descending=True,
+                limit=LOCATION_HISTORY_QUERY_LIMIT,
+                include_start_time_state=False,
+            ).get(entity_id, [])
+            # States at the end time were read with the previous page already
+            states = [
+                state
+                for state in page
+                if end_time is None or state.last_updated < end_time
+            ]
+            rows += len(states)
+            for state in states:
+                if state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE, None):
+                    continue
                 latitude = state.attributes.get(ATTR_LATITUDE, None)
                 longitude = state.attributes.get(ATTR_LONGITUDE, None)
-                if latitude and longitude:
-                    self.add_location_history(
-                        imei=imei,
-                        location=(latitude, longitude),
-                    )
+                if not latitude or not longitude:
+                    continue
+                # Repeated location keeps the timestamp of its first occurrence
+                if locations and locations[-1][0] == (latitude, longitude):
+                    locations.pop()
+                locations.append(((latitude, longitude), state.last_updated.timestamp()))
+            if len(page) < LOCATION_HISTORY_QUERY_LIMIT or len(states) == 0:
+                break
+            end_time = states[-1].last_updated
+        locations.reverse()
+        return locations[-LOCATION_HISTORY_ITEMS_DEFAULT:], rows
 
     def add_location_history(
         self,
@@ -323,17 +536,15 @@ class ZcsMowerDataUpdateCoordinator(DataUpdateCoordinator):
         location: tuple[float, float],
     ) -> bool:
         """Add item to location history."""
-        if self.data[imei][ATTR_LOCATION_HISTORY] is None:
+        location_history = self.data[imei][ATTR_LOCATION_HISTORY]
+        if location_history is None:
             return False
 
-        location_history = self.data[imei][ATTR_LOCATION_HISTORY].copy()
         # Abort, if provided location is last item in location history
-        if location in location_history[-1:]:
+        if not location_history.append(location, self._get_datetime_now().timestamp()):
             return False
 
-        location_history.append(location)
-        self.data[imei][ATTR_LOCATION_HISTORY] = location_history[-LOCATION_HISTORY_ITEMS_DEFAULT:]
-
+        self._mark_changed(imei, ATTR_LOCATION_HISTORY)
         return True
 
     def has_working_mowers(
@@ -365,67 +576,136 @@ class ZcsMowerDataUpdateCoordinator(DataUpdateCoordinator):
         """Return stop of next standby time."""
         return self._get_datetime_from_time(dt_util.as_local(self.standby_time_stop).time())
 
-    def set_update_interval(
+    def get_mower_update_interval(
         self,
-    ) -> bool:
-        """Set calculated update interval."""
-        now = self._get_datetime_now()
+        imei: str,
+        now: datetime | None = None,
+    ) -> timedelta:
+        """Get update interval for a single lawn mower by its state."""
+        mower = self.get_mower_attributes(imei)
+        if now is None:
+            now = self._get_datetime_now()
 
-        # If one or more lawn mower(s) working, increase update_interval
-        if self.has_working_mowers():
-            LOGGER.debug("Set update_interval: Working")
-            suggested_update_interval = timedelta(
+        # If lawn mower is working or is waiting for a wake up, increase update_interval
+        last_wake_up = mower.get(ATTR_LAST_WAKE_UP, None)
+        if mower.get(ATTR_WORKING, False) or (
+            last_wake_up is not None
+            and not mower.get(ATTR_CONNECTED, False)
+            and (now - last_wake_up).total_seconds() < self.config_entry.options.get(
+                CONF_WAKE_UP_TIMEOUT,
+                CONFIGURATION_DEFAULTS.get(CONF_WAKE_UP_TIMEOUT).get("default")
+            )
+        ):
+            LOGGER.debug("Set update_interval for %s: Working", imei)
+            return timedelta(
                 seconds=self.config_entry.options.get(
                     CONF_UPDATE_INTERVAL_WORKING,
                     CONFIGURATION_DEFAULTS.get(CONF_UPDATE_INTERVAL_WORKING).get("default")
                 )
             )
         # If hibernation is enabled, decrease update_interval
-        elif self.hibernation_enable:
-            LOGGER.debug("Set update_interval: Hibernation")
-            suggested_update_interval = timedelta(
+        if self.hibernation_enable:
+            LOGGER.debug("Set update_interval for %s: Hibernation", imei)
+            return timedelta(
                 seconds=self.config_entry.options.get(
                     CONF_UPDATE_INTERVAL_HIBERNATION,
                     CONFIGURATION_DEFAULTS.get(CONF_UPDATE_INTERVAL_HIBERNATION).get("default")
                 )
             )
         # If current time is in standby time, decrease update_interval
-        elif self.is_standby_time(now):
-            LOGGER.debug("Set update_interval: Standby")
-            suggested_update_interval = timedelta(
+        if self.is_standby_time(now):
+            LOGGER.debug("Set update_interval for %s: Standby", imei)
+            return timedelta(
                 seconds=self.config_entry.options.get(
                     CONF_UPDATE_INTERVAL_STANDBY,
                     CONFIGURATION_DEFAULTS.get(CONF_UPDATE_INTERVAL_STANDBY).get("default")
                 )
             )
         # If current time is out of standby time, calculate update_interval
-        else:
-            LOGGER.debug("Set update_interval: Idle")
+        LOGGER.debug("Set update_interval for %s: Idle", imei)
+        suggested_update_interval = timedelta(
+            seconds=self.config_entry.options.get(
+                CONF_UPDATE_INTERVAL_IDLING,
+                CONFIGURATION_DEFAULTS.get(CONF_UPDATE_INTERVAL_IDLING).get("default")
+            )
+        )
+        time_to_standby = (dt_util.as_local(self.standby_time_start) - now).seconds
+
+        # Time until start of standby time is shorter than update_interval for idle time
+        if time_to_standby < suggested_update_interval.seconds:
+            LOGGER.debug("Set update_interval: Time until start of standby time is shorter than update_interval for idle time")
+            # If time to standby is shorter than update_interval for working time
+            if (time_to_standby < (interval_working := self.config_entry.options.get(
+                CONF_UPDATE_INTERVAL_WORKING,
+                CONFIGURATION_DEFAULTS.get(CONF_UPDATE_INTERVAL_WORKING).get("default"))
+            )):
+                LOGGER.debug("Set update_interval: Time to standby is shorter than update_interval for working time")
+                time_to_standby = interval_working
+
             suggested_update_interval = timedelta(
-                seconds=self.config_entry.options.get(
-                    CONF_UPDATE_INTERVAL_IDLING,
-                    CONFIGURATION_DEFAULTS.get(CONF_UPDATE_INTERVAL_IDLING).get("default")
-                )
+                seconds=time_to_standby
             )
-            time_to_standby = (dt_util.as_local(self.standby_time_start) - now).seconds
+        return suggested_update_interval
 
-            # Time until start of standby time is shorter than update_interval for idle time
-            if time_to_standby < suggested_update_interval.seconds:
-                LOGGER.debug("Set update_interval: Time until start of standby time is shorter than update_interval for idle time")
-                # If time to standby is shorter than update_interval for working time
-                if (time_to_standby < (interval_working := self.config_entry.options.get(
-                    CONF_UPDATE_INTERVAL_WORKING,
-                    CONFIGURATION_DEFAULTS.get(CONF_UPDATE_INTERVAL_WORKING).get("default"))
-                )):
-                    LOGGER.debug("Set update_interval: Time to standby is shorter than update_interval for working time")
-                    time_to_standby = interval_working
+    def is_static_attributes_due(
+        self,
+        imei: str,
+        now: datetime | None = None,
+    ) -> bool:
+        """Return True if the static attributes of the lawn mower are outdated."""
+        if (last_pull := self._static_attributes_pulls.get(imei)) is None:
+            return True
+        if now is None:
+            now = self._get_datetime_now()
+        return (now - last_pull).total_seconds() >= STATIC_ATTRIBUTES_REFRESH_INTERVAL
 
-                suggested_update_interval = timedelta(
-                    seconds=time_to_standby
-                )
+    def get_due_mowers(
+        self,
+        now: datetime | None = None,
+    ) -> list[str]:
+        """Get IMEIs of all lawn mowers, which are due for the next pull."""
+        if now is None:
+            now = self._get_datetime_now()
+        # Mowers due within the tolerance are pulled with this tick
+        due_time = now + timedelta(seconds=UPDATE_INTERVAL_TOLERANCE)
+        return [
+            imei
+            for imei, mower in self.data.items()
+            if mower.get(ATTR_NEXT_PULL) is None or mower.get(ATTR_NEXT_PULL) <= due_time
+        ]
+
+    def set_update_interval(
+        self,
+        imeis: list[str] | None = None,
+    ) -> bool:
+        """Set next pull of the given lawn mowers and the calculated update interval.
+
+        The update interval of the coordinator is the time until the next
+        lawn mower is due.
+        """
+        now = self._get_datetime_now()
+        if imeis is None:
+            imeis = list(self.data.keys())
+        for imei in imeis:
+            self._set_mower_attributes(
+                imei,
+                **{ATTR_NEXT_PULL: now + self.get_mower_update_interval(imei, now)},
+            )
+
+        next_pulls = [
+            mower[ATTR_NEXT_PULL]
+            for mower in self.data.values()
+            if mower.get(ATTR_NEXT_PULL) is not None
+        ]
+        if len(next_pulls) == 0:
+            return False
 
         # Set next_pull
-        self.next_pull = now + suggested_update_interval
+        self.next_pull = min(next_pulls)
+        suggested_update_interval = max(
+            self.next_pull - now,
+            timedelta(seconds=UPDATE_INTERVAL_TOLERANCE),
+        )
 
         # Set suggested update_interval
         if suggested_update_interval != self.update_interval:
@@ -436,56 +716,68 @@ class ZcsMowerDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def async_fetch_all_mowers(
         self,
+        imeis: list[str] | None = None,
     ) -> None:
-        """Fetch data for all mowers."""
-        mower_imeis = list(self.data.keys())
+        """Fetch data for all or the given mowers in one request."""
+        mower_imeis = list(self.data.keys()) if imeis is None else imeis
         if len(mower_imeis) == 0:
             return None
 
-        await self.client.execute(
-            "thing.list",
-            {
-                "show": [
-                    "id",
-                    "key",
-                    "name",
-                    "connected",
-                    "lastSeen",
-                    "lastCommunication",
-                    "loc",
-                    "properties",
-                    "alarms",
-                    "attrs",
-                    "createdOn",
-                    "storage",
-                    "varBillingPlanCode",
-                ],
-                "hideFields": True,
-                "keys": mower_imeis,
-            },
-        )
-        response = await self.client.get_response()
-        if "result" in response:
-            result_list = response["result"]
-            for mower in (
-                mower
-                for mower in result_list
-                if "key" in mower and mower["key"] in self.data
-            ):
-                await self.async_update_mower(mower)
+        # Static attributes are only fetched, if they are outdated
+        now = self._get_datetime_now()
+        static_imeis = [
+            imei
+            for imei in mower_imeis
+            if self.is_static_attributes_due(imei, now)
+        ]
+        hot_imeis = [
+            imei
+            for imei in mower_imeis
+            if imei not in static_imeis
+        ]
+        commands = [
+            (
+                "thing.list",
+                {
+                    "show": list(fields),
+                    "hideFields": True,
+                    "keys": _imeis,
+                },
+            )
+            for _imeis, fields in (
+                (hot_imeis, API_FIELDS_HOT),
+                (static_imeis, API_FIELDS_HOT + API_FIELDS_STATIC),
+            )
+            if len(_imeis) > 0
+        ]
+        if len(commands) == 1:
+            responses = [await self.client.execute(*commands[0])]
+        else:
+            responses = await self.client.execute_many(commands)
+
+        for response in responses:
+            if response.params and "result" in response.params:
+                result_list = response.params["result"]
+                for mower in (
+                    mower
+                    for mower in result_list
+                    if "key" in mower and mower["key"] in self.data
+                ):
+                    await self.async_update_mower(mower)
 
     async def async_fetch_single_mower(
         self,
         imei: str,
     ) -> bool:
         """Fetch data for single mower, return connection state."""
-        await self.client.execute(
-            "thing.find",
-            {
-                "imei": imei,
-            },
-        )
-        response = await self.client.get_response()
+        response = (
+            await self.client.execute(
+                "thing.find",
+                {
+                    "imei": imei,
+                },
+            )
+        ).params or {}
         await self.async_update_mower(response)
 
         # Always update HA states after a command was executed.
@@ -505,18 +797,20 @@ class ZcsMowerDataUpdateCoordinator(DataUpdateCoordinator):
         mower = self.get_mower_attributes(imei)
         if mower is None:
             return None
+        # Update a copy, so the lawn mower is replaced at once
+        mower_before = mower
+        mower = mower_before.copy()
+        location = None
         # Start refreshing mower in coordinator from fetched API data
         if "alarms" in data:
             # Get robot state, error code and location
             if "robot_state" in data["alarms"]:
                 robot_state = data["alarms"]["robot_state"]
-                _state = (
-                    robot_state["state"] if robot_state["state"] < len(ROBOT_STATES) else 0
-                )
-                mower[ATTR_STATE] = ROBOT_STATES[_state]["name"]
-                mower[ATTR_ICON] = ROBOT_STATES[_state]["icon"]
-                mower[ATTR_WORKING] = _state in list(ROBOT_STATES_WORKING)
-                mower[ATTR_AVAILABLE] = _state > 0
+                _state = get_robot_state(robot_state["state"])
+                mower[ATTR_STATE] = _state.name
+                mower[ATTR_ICON] = _state.icon
+                mower[ATTR_WORKING] = _state.working
+                mower[ATTR_AVAILABLE] = _state.code > 0
                 # msg not always available
                 if "msg" in robot_state:
                     mower[ATTR_ERROR] = ROBOT_ERRORS.get(int(robot_state["msg"]), None)
@@ -528,21 +822,23 @@ class ZcsMowerDataUpdateCoordinator(DataUpdateCoordinator):
                         ATTR_LATITUDE: latitude,
                         ATTR_LONGITUDE: longitude,
                     }
-                    self.add_location_history(
-                        imei=imei,
-                        location=(latitude, longitude),
-                    )
+                    location = (latitude, longitude)
             # Get data threshold status from lawn mower
             if "data_th" in data["alarms"]:
                 data_th = data["alarms"]["data_th"]
-                _state = data_th["state"] if data_th["state"] < len(DATA_THRESHOLD_STATES) else 0
-                mower[ATTR_DATA_THRESHOLD] = DATA_THRESHOLD_STATES[_state]["name"]
+                mower[ATTR_DATA_THRESHOLD] = get_data_threshold_state(data_th["state"])
             # Get +Infinity status from lawn mower
             if "infinity_plan_status" in data["alarms"]:
                 infinity_plan_status = data["alarms"]["infinity_plan_status"]
-                _state = infinity_plan_status["state"] if infinity_plan_status["state"] < len(INFINITY_PLAN_STATES) else 0
-                mower[ATTR_INFINITY_STATE] = INFINITY_PLAN_STATES[_state]["name"]
+                mower[ATTR_INFINITY_STATE] = get_infinity_plan_state(infinity_plan_status["state"])
+                # +Infinity plan changed, so its expiration date has to be refreshed
+                if (
+                    "attrs" not in data
+                    and mower[ATTR_INFINITY_STATE] != mower_before.get(ATTR_INFINITY_STATE)
+                ):
+                    self._static_attributes_pulls.pop(imei, None)
         if "attrs" in data:
+            self._static_attributes_pulls[imei] = self._get_datetime_now()
             # In most cases, expiration_date is not available
             if "expiration_date" in data["attrs"]:
                 expiration_date = data["attrs"]["expiration_date"]
@@ -577,18 +873,7 @@ class ZcsMowerDataUpdateCoordinator(DataUpdateCoordinator):
 
         # Lawn mower is working
         if mower.get(ATTR_WORKING, False):
-            # Get inifity interval, if +Infinity is active or pending and valid
-            if mower.get(ATTR_INFINITY_STATE) in ("active", "pending") and mower.get(ATTR_INFINITY_EXPIRATION) > self._get_datetime_now():
-                _wake_up_interval = self.config_entry.options.get(
-                    CONF_WAKE_UP_INTERVAL_INFINITY,
-                    CONFIGURATION_DEFAULTS.get(CONF_WAKE_UP_INTERVAL_INFINITY).get("default")
-                )
-            # Get default interval, if +Infinity is not active
-            else:
-                _wake_up_interval = self.config_entry.options.get(
-                    CONF_WAKE_UP_INTERVAL_DEFAULT,
-                    CONFIGURATION_DEFAULTS.get(CONF_WAKE_UP_INTERVAL_DEFAULT).get("default")
-                )
+            _wake_up_interval = self._get_wake_up_interval(mower)
 
             # Send a wake_up command every WAKE_UP_INTERVAL seconds
             if (
@@ -614,27 +899,58 @@ class ZcsMowerDataUpdateCoordinator(DataUpdateCoordinator):
             mower[ATTR_LAST_STATE] = mower.get(ATTR_STATE)
 
         self.data[imei] = mower
+        self._mark_changed(imei, *mower.get_changed_fields(mower_before))
+        # The location history is shared by all copies of the lawn mower,
+        # so the new location is added, when the new copy is published
+        if location is not None:
+            self.add_location_history(
+                imei=imei,
+                location=location,
+            )
+
+        # Commands waiting for the lawn mower can proceed, if it is connected
+        self.wake_up.async_set_connection_state(imei, mower[ATTR_CONNECTED])
+
+    def _get_wake_up_interval(
+        self,
+        mower: ZcsMowerState,
+    ) -> int:
+        """Get interval in seconds to wake up the working lawn mower."""
+        # Get inifity interval, if +Infinity is active or pending and valid
+        if mower.get(ATTR_INFINITY_STATE) in ("active", "pending") and mower.get(ATTR_INFINITY_EXPIRATION) > self._get_datetime_now():
+            return self.config_entry.options.get(
+                CONF_WAKE_UP_INTERVAL_INFINITY,
+                CONFIGURATION_DEFAULTS.get(CONF_WAKE_UP_INTERVAL_INFINITY).get("default")
+            )
+        # Get default interval, if +Infinity is not active
+        return self.config_entry.options.get(
+            CONF_WAKE_UP_INTERVAL_DEFAULT,
+            CONFIGURATION_DEFAULTS.get(CONF_WAKE_UP_INTERVAL_DEFAULT).get("default")
+        )
 
     async def async_prepare_for_command(
         self,
         imei: str,
     ) -> bool:
         """Prepare lawn mower for incomming command."""
+        # Join a pending wake-up of the lawn mower
+        if self.wake_up.is_waiting(imei):
+            await self.async_wait_for_connection(imei)
+            return True
+
         # Use connection state from last fetch if last pull was not longer than 10 seconds ago
         mower = self.get_mower_attributes(imei)
         last_pull = mower.get(ATTR_LAST_PULL, None)
         last_wake_up = mower.get(ATTR_LAST_WAKE_UP, None)
-
-        if (
+        is_fresh = (
             last_pull is not None
             and (self._get_datetime_now() - last_pull).total_seconds() < 10
-            and mower.get(ATTR_CONNECTED, False)
-        ):
+        )
+        if is_fresh and mower.get(ATTR_CONNECTED, False):
             return True
 
         # Fetch connection state fresh from API
-        connected = await self.async_fetch_single_mower(imei)
-        if connected is True:
+        if not is_fresh and await self.async_fetch_single_mower(imei) is True:
             return True
 
         # Send wake up command if last attempt was more than 60 seconds ago
@@ -644,59 +960,226 @@ class ZcsMowerDataUpdateCoordinator(DataUpdateCoordinator):
         ):
             await self.async_wake_up(imei)
 
-        # Wait 10 seconds before the loop starts
-        await asyncio.sleep(10)
+        await self.async_wait_for_connection(imei)
+        return True
+
+    async def async_wait_for_connection(
+        self,
+        imei: str,
+    ) -> None:
+        """Wait for the lawn mower to connect, raise TimeoutError after the wake-up timeout."""
+        await self.wake_up.async_wait_for_connection(
+            imei,
+            self.config_entry.options.get(
+                CONF_WAKE_UP_TIMEOUT,
+                CONFIGURATION_DEFAULTS.get(CONF_WAKE_UP_TIMEOUT).get("default")
+            ),
+        )
 
-        # Set max attempts minimum 1 to avoid infinite loop
-        _wait_for_wake_up = self.config_entry.options.get(
-            CONF_WAKE_UP_TIMEOUT,
-            CONFIGURATION_DEFAULTS.get(CONF_WAKE_UP_TIMEOUT).get("default")
+    async def _async_fetch_woken_up_mowers(
+        self,
+        imeis: list[str],
+    ) -> None:
+        """Fetch connection state of woken up lawn mowers in one request."""
+        await self.async_fetch_all_mowers(imeis)
+        self.hass.async_create_task(
+            self._async_update_listeners()
         )
-        _wait_for_wake_up_remaining = max(_wait_for_wake_up - 10, 10)
-        attempts_max = round(_wait_for_wake_up_remaining / 10)
-        attempt = 0
-        # Wait for connection state to be True and max attempts is not exceeded
-        while connected is False and attempt <= attempts_max:
-            connected = await self.async_fetch_single_mower(imei)
-            if connected is True:
-                LOGGER.debug("Connected after %s attempt(s)", attempt)
-                return True
-            attempt = attempt + 1
-            # Wait 10 seconds before next attempt
-            await asyncio.sleep(10)
-
-        raise TimeoutError(
-            f"The lawn mower with IMEI {imei} was not available after a long wait"
+
+    async def async_prepare_for_commands(
+        self,
+        imeis: list[str],
+    ) -> None:
+        """Prepare several lawn mowers for incomming commands together.
+
+        Connection states of all lawn mowers are fetched and all disconnected
+        lawn mowers are woken up with one request each. The command queue of
+        each lawn mower waits for its wake-up afterwards.
+        """
+        # Fetch connection state of lawn mowers without fresh state in one request
+        stale_imeis = [
+            imei
+            for imei in imeis
+            if (last_pull := self.get_mower_attributes(imei).get(ATTR_LAST_PULL, None)) is None
+            or (self._get_datetime_now() - last_pull).total_seconds() >= 10
+        ]
+        await self.async_fetch_mowers(stale_imeis)
+
+        # Wake up all disconnected lawn mowers in one request
+        await self.async_wake_up(
+            [
+                imei
+                for imei in imeis
+                if not self.get_mower_attributes(imei).get(ATTR_CONNECTED, False)
+                and (
+                    (last_wake_up := self.get_mower_attributes(imei).get(ATTR_LAST_WAKE_UP, None)) is None
+                    or (self._get_datetime_now() - last_wake_up).total_seconds() > 60
+                )
+            ]
         )
 
-    async def async_update_now(
+    async def _async_send_command(
+        self,
+        imei: str | list[str],
+        method: str,
+        params: dict[str, any] | list[any] | None = None,
+    ) -> bool:
+        """Send method to one or several lawn mowers through their command queues.
+
+        A command, which was superseded by a newer one while pending, returns False.
+        """
+        if isinstance(imei, str):
+            try:
+                return await self.command_queue.async_send(imei, method, params)
+            except ZcsMowerCommandSupersededError as exception:
+                LOGGER.info(exception)
+                return False
+
+        imeis = list(imei)
+        if len(imeis) == 0:
+            return False
+        if len(imeis) > 1:
+            await self.async_prepare_for_commands(imeis)
+        results = await asyncio.gather(
+            *(self.command_queue.async_send(_imei, method, params) for _imei in imeis),
+            return_exceptions=True,
+        )
+        for _imei, result in zip(imeis, results, strict=True):
+            if isinstance(result, ZcsMowerCommandSupersededError):
+                LOGGER.info(result)
+            elif isinstance(result, BaseException):
+                LOGGER.error("Command %s failed for %s: %s", method, _imei, result)
+        return all(result is True for result in results)
+
+    async def _async_execute_command(
         self,
         imei: str,
+        method: str,
+        params: dict[str, any] | list[any] | None = None,
+    ) -> bool:
+        """Execute method on a prepared lawn mower.
+
+        Commands of several lawn mowers, which are ready in the same loop
+        iteration, are sent with one request.
+        """
+        future = self.hass.loop.create_future()
+        self._command_batch.append((imei, method, params, future))
+        if len(self._command_batch) == 1:
+            self.hass.async_create_task(
+                self._async_flush_commands()
+            )
+        return await future
+
+    async def _async_flush_commands(self) -> None:
+        """Send all collected commands in one request."""
+        batch = self._command_batch
+        self._command_batch = []
+        commands = []
+        for _imei, method, params, _future in batch:
+            _params = {
+                "method": method,
+                "imei": _imei,
+            }
+            if params is not None:
+                _params["params"] = params
+            _params["ackTimeout"] = API_ACK_TIMEOUT
+            _params["singleton"] = True
+            commands.append(("method.exec", _params))
+
+        try:
+            if len(commands) == 1:
+                results = [await self.client.execute(*commands[0])]
+            else:
+                results = await self.client.execute_many(commands)
+        except Exception as exception:  # pylint: disable=broad-except
+            for *_command, future in batch:
+                if not future.done():
+                    future.set_exception(exception)
+            return None
+
+        for (_imei, method, _params, future), result in zip(batch, results, strict=True):
+            if not result.success:
+                LOGGER.error("Command %s failed for %s: %s", method, _imei, result.errors)
+            if not future.done():
+                future.set_result(result.success)
+
+    async def async_fetch_mowers(
+        self,
+        imeis: list[str],
+    ) -> None:
+        """Fetch data for several mowers in one request."""
+        if len(imeis) == 0:
+            return None
+        if len(imeis) == 1:
+            await self.async_fetch_single_mower(imeis[0])
+            return None
+
+        results = await self.client.execute_many(
+            [
+                (
+                    "thing.find",
+                    {
+                        "imei": imei,
+                    },
+                )
+                for imei in imeis
+            ]
+        )
+        for imei, result in zip(imeis, results, strict=True):
+            if result.success and result.params:
+                await self.async_update_mower(result.params)
+            else:
+                LOGGER.error("Fetching %s failed: %s", imei, result.errors)
+
+        self.hass.async_create_task(
+            self._async_update_listeners()
+        )
+
+    async def async_update_now(
+        self,
+        imei: str | list[str],
     ) -> bool:
         """Fetch data for mower from API."""
         LOGGER.debug("update_now: %s", imei)
         try:
-            return await self.async_fetch_single_mower(imei)
+            if isinstance(imei, str):
+                return await self.async_fetch_single_mower(imei)
+            await self.async_fetch_mowers(list(imei))
+            return True
         except Exception as exception:
             LOGGER.exception(exception)
         return False
 
     async def async_wake_up(
         self,
-        imei: str,
+        imei: str | list[str],
     ) -> bool:
         """Send command wake_up to lawn nower."""
         LOGGER.debug("wake_up: %s", imei)
+        imeis = [imei] if isinstance(imei, str) else list(imei)
+        if len(imeis) == 0:
+            return True
         try:
-            self.data[imei][ATTR_LAST_WAKE_UP] = self._get_datetime_now()
-            return await self.client.execute(
-                "sms.send",
-                {
-                    "coding": "SEVEN_BIT",
-                    "imei": imei,
-                    "message": "UP",
-                },
-            )
+            commands = []
+            for _imei in imeis:
+                self._set_mower_attributes(
+                    _imei,
+                    **{ATTR_LAST_WAKE_UP: self._get_datetime_now()},
+                )
+                commands.append(
+                    (
+                        "sms.send",
+                        {
+                            "coding": "SEVEN_BIT",
+                            "imei": _imei,
+                            "message": "UP",
+                        },
+                    )
+                )
+            if len(commands) == 1:
+                return (await self.client.execute(*commands[0])).success
+            results = await self.client.execute_many(commands)
+            return all(result.success for result in results)
         except TimeoutError as exception:
             LOGGER.error(exception)
         except Exception as exception:
@@ -705,23 +1188,17 @@ class ZcsMowerDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def async_set_profile(
         self,
-        imei: str,
+        imei: str | list[str],
         profile: int,
     ) -> bool:
         """Send command set_profile to lawn nower."""
         LOGGER.debug("set_profile: %s", imei)
         try:
-            await self.async_prepare_for_command(imei)
-            return await self.client.execute(
-                "method.exec",
+            return await self._async_send_command(
+                imei,
+                "set_profile",
                 {
-                    "method": "set_profile",
-                    "imei": imei,
-                    "params": {
-                        "profile": (profile - 1),
-                    },
-                    "ackTimeout": API_ACK_TIMEOUT,
-                    "singleton": True,
+                    "profile": (profile - 1),
                 },
             )
         except TimeoutError as exception:
@@ -731,21 +1208,12 @@ class ZcsMowerDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def async_work_now(
         self,
-        imei: str,
+        imei: str | list[str],
     ) -> bool:
         """Send command work_now to lawn nower."""
         LOGGER.debug("work_now: %s", imei)
         try:
-            await self.async_prepare_for_command(imei)
-            return await self.client.execute(
-                "method.exec",
-                {
-                    "method": "work_now",
-                    "imei": imei,
-                    "ackTimeout": API_ACK_TIMEOUT,
-                    "singleton": True,
-                },
-            )
+            return await self._async_send_command(imei, "work_now")
         except TimeoutError as exception:
             LOGGER.error(exception)
         except Exception as exception:
@@ -753,7 +1221,7 @@ class ZcsMowerDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def async_work_for(
         self,
-        imei: str,
+        imei: str | list[str],
         duration: int,
         area: int | None = None,
     ) -> bool:
@@ -770,7 +1238,7 @@ class ZcsMowerDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def async_work_until(
         self,
-        imei: str,
+        imei: str | list[str],
         hours: int,
         minutes: int,
         area: int | None = None,
@@ -786,17 +1254,7 @@ class ZcsMowerDataUpdateCoordinator(DataUpdateCoordinator):
         else:
             _params["area"] = 255
         try:
-            await self.async_prepare_for_command(imei)
-            return await self.client.execute(
-                "method.exec",
-                {
-                    "method": "work_until",
-                    "imei": imei,
-                    "params": _params,
-                    "ackTimeout": API_ACK_TIMEOUT,
-                    "singleton": True,
-                },
-            )
+            return await self._async_send_command(imei, "work_until", _params)
         except TimeoutError as exception:
             LOGGER.error(exception)
         except Exception as exception:
@@ -804,21 +1262,12 @@ class ZcsMowerDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def async_border_cut(
         self,
-        imei: str,
+        imei: str | list[str],
     ) -> bool:
         """Send command border_cut to lawn nower."""
         LOGGER.debug("border_cut: %s", imei)
         try:
-            await self.async_prepare_for_command(imei)
-            return await self.client.execute(
-                "method.exec",
-                {
-                    "method": "border_cut",
-                    "imei": imei,
-                    "ackTimeout": API_ACK_TIMEOUT,
-                    "singleton": True,
-                },
-            )
+            return await self._async_send_command(imei, "border_cut")
         except TimeoutError as exception:
             LOGGER.error(exception)
         except Exception as exception:
@@ -826,21 +1275,12 @@ class ZcsMowerDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def async_charge_now(
         self,
-        imei: str,
+        imei: str | list[str],
     ) -> bool:
         """Send command charge_now to lawn nower."""
         LOGGER.debug("charge_now: %s", imei)
         try:
-            await self.async_prepare_for_command(imei)
-            return await self.client.execute(
-                "method.exec",
-                {
-                    "method": "charge_now",
-                    "imei": imei,
-                    "ackTimeout": API_ACK_TIMEOUT,
-                    "singleton": True,
-                },
-            )
+            return await self._async_send_command(imei, "charge_now")
         except TimeoutError as exception:
             LOGGER.error(exception)
         except Exception as exception:
@@ -848,7 +1288,7 @@ class ZcsMowerDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def async_charge_for(
         self,
-        imei: str,
+        imei: str | list[str],
         duration: int,
     ) -> bool:
         """Prepare command charge_until."""
@@ -864,7 +1304,7 @@ class ZcsMowerDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def async_charge_until(
         self,
-        imei: str,
+        imei: str | list[str],
         hours: int,
         minutes: int,
         weekday: int,
@@ -872,19 +1312,13 @@ class ZcsMowerDataUpdateCoordinator(DataUpdateCoordinator):
         """Send command charge_until to lawn nower."""
         LOGGER.debug("charge_until: %s", imei)
         try:
-            await self.async_prepare_for_command(imei)
-            return await self.client.execute(
-                "method.exec",
+            return await self._async_send_command(
+                imei,
+                "charge_until",
                 {
-                    "method": "charge_until",
-                    "imei": imei,
-                    "params": {
-                        "hh": hours,
-                        "mm": minutes,
-                        "weekday": (weekday - 1),
-                    },
-                    "ackTimeout": API_ACK_TIMEOUT,
-                    "singleton": True,
+                    "hh": hours,
+                    "mm": minutes,
+                    "weekday": (weekday - 1),
                 },
             )
         except TimeoutError as exception:
@@ -894,22 +1328,17 @@ class ZcsMowerDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def async_trace_position(
         self,
-        imei: str,
+        imei: str | list[str],
     ) -> bool:
         """Send command trace_position to lawn nower."""
         LOGGER.debug("trace_position: %s", imei)
         try:
-            self.data[imei][ATTR_LAST_TRACE_POSITION] = self._get_datetime_now()
-            await self.async_prepare_for_command(imei)
-            return await self.client.execute(
-                "method.exec",
-                {
-                    "method": "trace_position",
-                    "imei": imei,
-                    "ackTimeout": API_ACK_TIMEOUT,
-                    "singleton": True,
-                },
-            )
+            for _imei in [imei] if isinstance(imei, str) else imei:
+                self._set_mower_attributes(
+                    _imei,
+                    **{ATTR_LAST_TRACE_POSITION: self._get_datetime_now()},
+                )
+            return await self._async_send_command(imei, "trace_position")
         except TimeoutError as exception:
             LOGGER.error(exception)
         except Exception as exception:
@@ -917,21 +1346,12 @@ class ZcsMowerDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def async_change_operator(
         self,
-        imei: str,
+        imei: str | list[str],
     ) -> bool:
         """Send command change_operator to lawn nower."""
         LOGGER.debug("change_operator: %s", imei)
         try:
-            await self.async_prepare_for_command(imei)
-            return await self.client.execute(
-                "method.exec",
-                {
-                    "method": "change_operator",
-                    "imei": imei,
-                    "ackTimeout": API_ACK_TIMEOUT,
-                    "singleton": True,
-                },
-            )
+            return await self._async_send_command(imei, "change_operator")
         except TimeoutError as exception:
             LOGGER.error(exception)
         except Exception as exception:
@@ -939,7 +1359,7 @@ class ZcsMowerDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def async_keep_out(
         self,
-        imei: str,
+        imei: str | list[str],
         latitude: float,
         longitude: float,
         radius: int,
@@ -961,17 +1381,7 @@ class ZcsMowerDataUpdateCoordinator(DataUpdateCoordinator):
         if isinstance(index, int):
             _params["index"] = index
         try:
-            await self.async_prepare_for_command(imei)
-            return await self.client.execute(
-                "method.exec",
-                {
-                    "method": "keep_out",
-                    "imei": imei,
-                    "params": _params,
-                    "ackTimeout": API_ACK_TIMEOUT,
-                    "singleton": True,
-                },
-            )
+            return await self._async_send_command(imei, "keep_out", _params)
         except TimeoutError as exception:
             LOGGER.error(exception)
         except Exception as exception:
@@ -979,7 +1389,7 @@ class ZcsMowerDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def async_custom_command(
         self,
-        imei: str,
+        imei: str | list[str],
         command: str,
         params: dict[str, any] | list[any] | None = None,
     ) -> bool:
@@ -988,17 +1398,7 @@ class ZcsMowerDataUpdateCoordinator(DataUpdateCoordinator):
         LOGGER.debug(command)
         LOGGER.debug(params)
         try:
-            await self.async_prepare_for_command(imei)
-            return await self.client.execute(
-                "method.exec",
-                {
-                    "method": command,
-                    "imei": imei,
-                    "params": params,
-                    "ackTimeout": API_ACK_TIMEOUT,
-                    "singleton": True,
-                },
-            )
+            return await self._async_send_command(imei, command, params)
         except TimeoutError as exception:
             LOGGER.error(exception)
         except Exception as exception:
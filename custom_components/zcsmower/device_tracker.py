@@ -63,6 +63,7 @@ class ZcsMowerRobotTrackerEntity(ZcsMowerRobotEntity, TrackerEntity):
     """Representation of a ZCS Lawn Mower Robot sensor."""
 
     _attr_name = None
+    _subscribed_fields = frozenset({ATTR_LOCATION})
 
     def __init__(
         self,
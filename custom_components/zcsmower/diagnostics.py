@@ -17,6 +17,7 @@ from .const import (
     ATTR_SERIAL_NUMBER,
     ATTR_LOCATION_HISTORY,
 )
+from .helpers import async_get_api_session_metrics
 
 TO_REDACT = {
     CONF_CLIENT_KEY,
@@ -38,5 +39,10 @@ async def async_get_config_entry_diagnostics(
     diagnostics_data = {
         "config_entry_data": async_redact_data(config_entry.as_dict(), TO_REDACT),
         "coordinator_data": async_redact_data(coordinator.data, TO_REDACT),
+        "api_session": async_get_api_session_metrics(hass),
+        "location_history_load": coordinator.location_history_load,
+        "wake_up": coordinator.wake_up.as_dict(),
+        "command_queue": coordinator.command_queue.as_dict(),
+        "api_circuit": coordinator.client.circuit_breaker.as_dict(),
     }
     return diagnostics_data
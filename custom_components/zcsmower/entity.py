@@ -32,6 +32,7 @@ from .const import (
     ATTR_SERIAL_NUMBER,
     ATTR_ERROR,
     ATTR_AVAILABLE,
+    ATTR_NEXT_PULL,
     ATTRIBUTION,
     MANUFACTURER_DEFAULT,
 )
@@ -43,6 +44,8 @@ class ZcsMowerRobotEntity(CoordinatorEntity):
 
     _attr_attribution = ATTRIBUTION
     _attr_has_entity_name = True
+    # Fields of the lawn mower rendered by the entity, None for all fields
+    _subscribed_fields: frozenset[str] | None = None
 
     def __init__(
         self,
@@ -91,13 +94,15 @@ class ZcsMowerRobotEntity(CoordinatorEntity):
         default_value: any | None = None,
     ) -> any:
         """Get attribute of the current mower."""
-        return self.coordinator.data.get(self._imei, {}).get(attr, default_value)
+        if (mower := self.coordinator.data.get(self._imei)) is None:
+            return default_value
+        return getattr(mower, attr, default_value)
 
     def _get_next_pull(
         self,
     ) -> datetime | None:
-        """Get attribute of the current mower."""
-        return self.coordinator.next_pull
+        """Get next pull of the current mower."""
+        return self._get_attribute(ATTR_NEXT_PULL)
 
     def _get_localized_status(
         self,
@@ -135,6 +140,18 @@ class ZcsMowerRobotEntity(CoordinatorEntity):
         """Handle updated data."""
         self._update_extra_state_attributes()
 
+    def _has_subscribed_changes(self) -> bool:
+        """Return True if a subscribed field of the current mower has changed."""
+        if self._subscribed_fields is None:
+            return True
+        changed_fields = self.coordinator.get_changed_fields(self._imei)
+        if changed_fields is None:
+            return True
+        return (
+            ATTR_AVAILABLE in changed_fields
+            or not changed_fields.isdisjoint(self._subscribed_fields)
+        )
+
     @property
     def unique_id(self) -> str:
         """Return the unique ID of the entity."""
@@ -167,6 +184,9 @@ class ZcsMowerRobotEntity(CoordinatorEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        # Skip state write, if no rendered field has changed
+        if not self._has_subscribed_changes():
+            return None
         self._update_handler()
         self.async_write_ha_state()
 
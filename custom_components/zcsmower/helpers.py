@@ -4,17 +4,118 @@ from __future__ import annotations
 import string
 import random
 
+from datetime import datetime
+from functools import lru_cache
+
+import aiohttp
+
+from homeassistant.core import (
+    callback,
+    Event,
+    HomeAssistant,
+)
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.util.ssl import client_context
+
 from .const import (
+    DOMAIN,
+    DATA_API_SESSION,
+    DATA_API_METRICS,
     API_APP_TOKEN,
     API_CLIENT_KEY_LENGTH,
+    API_DATETIME_FORMAT_DEFAULT,
+    API_DATETIME_FORMAT_FALLBACK,
+    API_DATETIME_CACHE_SIZE,
+    API_TIMEOUT_TOTAL,
+    API_TIMEOUT_CONNECT,
+    API_TIMEOUT_SOCK_READ,
+    API_KEEPALIVE_TIMEOUT,
+    API_DNS_CACHE_TTL,
+    API_CONNECTIONS_PER_HOST,
 )
 from .api import (
     ZcsMowerApiClient,
     ZcsMowerApiAuthenticationError,
     ZcsMowerApiCommunicationError,
+    ZcsMowerApiSessionMetrics,
 )
 
 
+@callback
+def async_get_api_session(
+    hass: HomeAssistant,
+) -> aiohttp.ClientSession:
+    """Get the client session for the deviceWISE API, create it on first use.
+
+    The session is shared by all config entries, the config flow and the
+    helpers, so connections to the endpoint are kept alive and reused.
+    It has its own connector, because the helper of Home Assistant does not
+    accept a tuned one, and is closed, when Home Assistant stops.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    session = domain_data.get(DATA_API_SESSION)
+    if session is not None and not session.closed:
+        return session
+
+    if (metrics := domain_data.get(DATA_API_METRICS)) is None:
+        metrics = domain_data[DATA_API_METRICS] = ZcsMowerApiSessionMetrics()
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            ssl=client_context(),
+            limit_per_host=API_CONNECTIONS_PER_HOST,
+            ttl_dns_cache=API_DNS_CACHE_TTL,
+            keepalive_timeout=API_KEEPALIVE_TIMEOUT,
+        ),
+        timeout=aiohttp.ClientTimeout(
+            total=API_TIMEOUT_TOTAL,
+            connect=API_TIMEOUT_CONNECT,
+            sock_read=API_TIMEOUT_SOCK_READ,
+        ),
+        trace_configs=[metrics.create_trace_config()],
+    )
+    domain_data[DATA_API_SESSION] = session
+
+    async def _async_close_session(event: Event) -> None:
+        """Close client session and its connector, when Home Assistant stops."""
+        await session.close()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_session)
+    return session
+
+
+@callback
+def async_get_api_session_metrics(
+    hass: HomeAssistant,
+) -> dict[str, any] | None:
+    """Get connection and latency metrics of the client session for the deviceWISE API."""
+    if (metrics := hass.data.get(DOMAIN, {}).get(DATA_API_METRICS)) is None:
+        return None
+    return metrics.as_dict()
+
+
+@lru_cache(maxsize=API_DATETIME_CACHE_SIZE)
+def parse_api_datetime(
+    date_string: str,
+) -> datetime:
+    """Parse datetime string from API data into an aware datetime object.
+
+    Timestamps like lastSeen repeat unchanged from poll to poll, so parsed
+    values are memoized by the raw string.
+    """
+    # Fast path, both API formats are ISO 8601
+    try:
+        _dt = datetime.fromisoformat(date_string)
+    except ValueError:
+        pass
+    else:
+        if _dt.tzinfo is not None:
+            return _dt
+    try:
+        return datetime.strptime(date_string, API_DATETIME_FORMAT_DEFAULT)
+    except ValueError:
+        return datetime.strptime(date_string, API_DATETIME_FORMAT_FALLBACK)
+
+
 async def generate_client_key() -> str:
     """Generate client key."""
     # get random client key with letters and digits
@@ -53,13 +154,13 @@ async def publish_client_thing(
     client_name: str,
 ) -> None:
     """Publish client name."""
-    await client.execute(
+    response = await client.execute(
         "thing.find",
         {
             "key": client_key,
         },
     )
-    if await client.get_response():
+    if response.params:
         await client.execute(
             "thing.update",
             {
@@ -89,14 +190,14 @@ async def validate_imei(
     if not imei.startswith("35") or len(imei) != 15:
         raise ValueError
 
-    mower = await client.execute(
+    response = await client.execute(
         "thing.find",
         {
             "imei": imei
         }
     )
-    if mower:
-        return await client.get_response()
+    if response.success and response.params:
+        return response.params
 
     # Lawn mower not found
     raise KeyError(
@@ -168,19 +269,20 @@ async def replace_robot_client(
     client_key_new: str,
 ) -> None:
     """Replace robot_client in all given lawn mowers."""
-    await client.execute(
-        "thing.list",
-        {
-            "show": [
-                "id",
-                "key",
-                "attrs",
-            ],
-            "hideFields": True,
-            "keys": list(mowers.keys()),
-        },
-    )
-    response = await client.get_response()
+    response = (
+        await client.execute(
+            "thing.list",
+            {
+                "show": [
+                    "id",
+                    "key",
+                    "attrs",
+                ],
+                "hideFields": True,
+                "keys": list(mowers.keys()),
+            },
+        )
+    ).params or {}
     if "result" in response:
         result_list = response["result"]
         for mower in (
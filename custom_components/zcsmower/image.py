@@ -1,29 +1,18 @@
 """ZCS Lawn Mower Robot image platform."""
 from __future__ import annotations
 
-import io
-import os
-import math
-import numpy as np
-
-from geopy.distance import (
-    distance,
-    geodesic,
-)
-from PIL import (
-    Image,
-    ImageDraw,
-)
+import asyncio
+import importlib
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from homeassistant.core import (
     callback,
     HomeAssistant,
 )
-from homeassistant.const import (
-    ATTR_LOCATION,
-    ATTR_LATITUDE,
-    ATTR_LONGITUDE,
-)
+from homeassistant.const import ATTR_LOCATION
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.components.image import (
     ImageEntity,
@@ -37,35 +26,63 @@ import homeassistant.util.dt as dt_util
 
 from .const import (
     LOGGER,
-    MAP_POINTS_DEFAULT,
+    MAP_IMAGE_SIZE_MAX,
+    MAP_IMAGE_FORMAT_DEFAULT,
+    MAP_IMAGE_FORMATS,
     CONF_MAP_ENABLE,
-    CONF_MAP_IMAGE_PATH,
-    CONF_MAP_MARKER_PATH,
-    CONF_MAP_GPS_TOP_LEFT,
-    CONF_MAP_GPS_BOTTOM_RIGHT,
-    CONF_MAP_ROTATION,
-    CONF_MAP_HISTORY_ENABLE,
-    CONF_MAP_POINTS,
-    CONF_MAP_DRAW_LINES,
-    ATTR_LOCATION_HISTORY,
+    CONF_MAP_IMAGE_FORMAT,
     ATTR_CALIBRATION,
+    ATTR_LOCATION_HISTORY,
+    ATTR_RENDER_COUNT,
+    ATTR_RENDER_SKIP_RATE,
 )
 from .coordinator import ZcsMowerDataUpdateCoordinator
 from .entity import ZcsMowerRobotEntity
 
+if TYPE_CHECKING:
+    from .renderer import (
+        ZcsMowerMapRenderer,
+        ZcsMowerMapVariant,
+    )
+
+
+@dataclass(frozen=True, kw_only=True)
+class ZcsMowerImageEntityDescription(ImageEntityDescription):
+    """Describes ZCS Lawn Mower image entity."""
+
+    max_size: int
+    marker_size: int
+
+
 ROBOT_ENTITY_DESCRIPTIONS = (
-    ImageEntityDescription(
+    ZcsMowerImageEntityDescription(
         key="map",
         icon="mdi:map",
         translation_key="map",
         entity_category=EntityCategory.DIAGNOSTIC,
+        max_size=600,
+        marker_size=32,
+    ),
+    ZcsMowerImageEntityDescription(
+        key="map_thumbnail",
+        icon="mdi:map",
+        translation_key="map_thumbnail",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        max_size=200,
+        marker_size=16,
+    ),
+    ZcsMowerImageEntityDescription(
+        key="map_full",
+        icon="mdi:map",
+        translation_key="map_full",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        # Rendering in full resolution is expensive, so it is opt-in
+        entity_registry_enabled_default=False,
+        max_size=MAP_IMAGE_SIZE_MAX,
+        marker_size=64,
     ),
 )
 
-GpsPoint = tuple[float, float]
-ImgPoint = tuple[int, int]
-ImgDimensions = tuple[int, int]
-
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -74,35 +91,179 @@ async def async_setup_entry(
 ) -> None:
     """Do setup images from a config entry created in the integrations UI."""
     coordinator = config_entry.runtime_data
-    async_add_entities(
-        [
+    entities = []
+    for imei in coordinator.mowers:
+        # All variants of the map share one renderer per mower
+        renderer = ZcsMowerMapRendererLoader(
+            hass=hass,
+            config_entry=config_entry,
+            coordinator=coordinator,
+            imei=imei,
+        )
+        entities.extend(
             ZcsMowerRobotImageEntity(
                 hass=hass,
                 config_entry=config_entry,
                 coordinator=coordinator,
                 entity_description=entity_description,
                 imei=imei,
+                renderer=renderer,
             )
-            for imei in coordinator.mowers
             for entity_description in ROBOT_ENTITY_DESCRIPTIONS
-        ],
+        )
+    async_add_entities(
+        entities,
         update_before_add=True,
     )
 
 
+class ZcsMowerMapRendererLoader:
+    """Create the map renderer of a mower on first use.
+
+    The renderer depends on NumPy, Pillow and geopy. They are imported in
+    the executor, when the first map entity is added, so config entries
+    without an enabled map do not load them at all.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        coordinator: ZcsMowerDataUpdateCoordinator,
+        imei: str,
+    ) -> None:
+        """Initialize the renderer loader."""
+        self._hass = hass
+        self._config_entry = config_entry
+        self._coordinator = coordinator
+        self._imei = imei
+        self._renderer: ZcsMowerMapRenderer | None = None
+        self._lock = asyncio.Lock()
+
+    async def async_get_renderer(self) -> ZcsMowerMapRenderer:
+        """Get the renderer, import and create it once."""
+        async with self._lock:
+            if self._renderer is None:
+                renderer_module = await self._hass.async_add_import_executor_job(
+                    importlib.import_module,
+                    f"{__package__}.renderer",
+                )
+                self._renderer = renderer_module.ZcsMowerMapRenderer(
+                    config_entry=self._config_entry,
+                    coordinator=self._coordinator,
+                    imei=self._imei,
+                )
+            return self._renderer
+
+
+class ZcsMowerMapRenderScheduler:
+    """Coalesce render requests of a map image.
+
+    At most one render is in flight and one is pending. Further requests
+    are merged into the pending one and a render is skipped, if the inputs
+    of the map have not changed since the last render.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        render: Callable[[], None],
+        fingerprint: Callable[[], any],
+        rendered: Callable[[], None] | None = None,
+    ) -> None:
+        """Initialize the render scheduler.
+
+        Args:
+            hass (HomeAssistant): Home Assistant instance.
+            render (Callable): Blocking render function, runs in the executor.
+            fingerprint (Callable): Returns the current inputs of the map.
+            rendered (Callable): Called in the event loop after a render.
+
+        """
+        self._hass = hass
+        self._render = render
+        self._fingerprint = fingerprint
+        self._rendered = rendered
+        self._task: asyncio.Task | None = None
+        self._queued = 0
+        self._last_fingerprint = None
+        self._has_rendered = False
+
+        self.requests = 0
+        self.renders = 0
+        self.skips = 0
+
+    @property
+    def skip_rate(self) -> float:
+        """Return the rate of skipped render requests."""
+        if self.requests == 0:
+            return 0.0
+        return round(self.skips / self.requests, 3)
+
+    @callback
+    def async_request_render(self) -> asyncio.Task:
+        """Request a render and return the task, which processes it."""
+        self.requests += 1
+        self._queued += 1
+        if self._task is None:
+            self._task = self._hass.async_create_task(
+                self._async_render_loop()
+            )
+        return self._task
+
+    async def async_render(self) -> None:
+        """Request a render and wait until it is done."""
+        await asyncio.shield(self.async_request_render())
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel render in progress."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._queued = 0
+
+    async def _async_render_loop(self) -> None:
+        """Render until no request is pending."""
+        try:
+            while self._queued:
+                # All queued requests are merged into one render
+                self.skips += self._queued - 1
+                self._queued = 0
+                fingerprint = self._fingerprint()
+                if self._has_rendered and fingerprint == self._last_fingerprint:
+                    self.skips += 1
+                else:
+                    await self._hass.async_add_executor_job(self._render)
+                    self._has_rendered = True
+                    self._last_fingerprint = fingerprint
+                    self.renders += 1
+                    if self._rendered is not None:
+                        self._rendered()
+        finally:
+            self._task = None
+
+
 class ZcsMowerRobotImageEntity(ZcsMowerRobotEntity, ImageEntity):
     """Representation of a ZCS Lawn Mower Robot image."""
 
     _attr_entity_registry_enabled_default = False
-    _attr_name = "Map"
+    _unrecorded_attributes = frozenset(
+        {
+            ATTR_RENDER_COUNT,
+            ATTR_RENDER_SKIP_RATE,
+        }
+    )
+    _subscribed_fields = frozenset({ATTR_LOCATION, ATTR_LOCATION_HISTORY})
 
     def __init__(
         self,
         hass: HomeAssistant,
         config_entry: ConfigEntry,
         coordinator: ZcsMowerDataUpdateCoordinator,
-        entity_description: ImageEntityDescription,
+        entity_description: ZcsMowerImageEntityDescription,
         imei: str,
+        renderer: ZcsMowerMapRendererLoader,
     ) -> None:
         """Initialize the image class."""
         ImageEntity.__init__(self, hass)
@@ -114,326 +275,133 @@ class ZcsMowerRobotImageEntity(ZcsMowerRobotEntity, ImageEntity):
             entity_description=entity_description,
             imei=imei,
         )
-        self.content_type = "image/png"
-
+        self._renderer_loader = renderer
+        # Renderer is loaded, when the entity is added
+        self.renderer: ZcsMowerMapRenderer | None = None
+        self.content_type = MAP_IMAGE_FORMATS.get(
+            self.config_entry.options.get(CONF_MAP_IMAGE_FORMAT, MAP_IMAGE_FORMAT_DEFAULT),
+            MAP_IMAGE_FORMATS[MAP_IMAGE_FORMAT_DEFAULT],
+        )["content_type"]
         self.map_enabled = self.config_entry.options.get(CONF_MAP_ENABLE, False)
-        self.map_gps_top_left = None
-        self.map_gps_bottom_right = None
-        self.map_rotation = 0
-
-        self.last_location_history = None
 
-        self._attr_entity_registry_enabled_default = self.map_enabled
+        self._attr_entity_registry_enabled_default = (
+            self.map_enabled and entity_description.entity_registry_enabled_default
+        )
         if self.map_enabled:
             LOGGER.info("Map enabled")
-            self.map_gps_top_left = self.config_entry.options.get(CONF_MAP_GPS_TOP_LEFT, None)
-            self.map_gps_bottom_right = self.config_entry.options.get(CONF_MAP_GPS_BOTTOM_RIGHT, None)
-            self.map_rotation = self.config_entry.options.get(CONF_MAP_ROTATION, 0.0)
         else:
             LOGGER.info("Map disabled")
-            latitude_current = self._get_attribute(ATTR_LOCATION, {}).get(ATTR_LATITUDE, None)
-            longitude_current = self._get_attribute(ATTR_LOCATION, {}).get(ATTR_LONGITUDE, None)
-            if latitude_current and longitude_current:
-                earth_radius = 6371008  # meters
-                offset = 100  # meters
-                top_left_latitude = latitude_current - (offset / earth_radius) * (180 / math.pi)
-                top_left_longitude = longitude_current - (offset / earth_radius) * (180 / math.pi) / math.cos(latitude_current * math.pi / 180)
-                bottom_right_latitude = latitude_current + (offset / earth_radius) * (180 / math.pi)
-                bottom_right_longitude = longitude_current + (offset / earth_radius) * (180 / math.pi) / math.cos(latitude_current * math.pi / 180)
-                self.map_gps_top_left = (top_left_latitude, top_left_longitude)
-                self.map_gps_bottom_right = (bottom_right_latitude, bottom_right_longitude)
-
-        self._image_scale = None
-        self._image_center_px = None
-        self._image_center_gps = None
-
-        self._image = self._create_empty_map_image("Map initialization.")
+
+        self._variant: ZcsMowerMapVariant | None = None
         self._image_bytes = None
-        self._image_to_bytes()
+
+        self._is_added = False
+        self._render_scheduler = ZcsMowerMapRenderScheduler(
+            hass=hass,
+            render=self._generate_image,
+            fingerprint=self._get_fingerprint,
+            rendered=self._async_image_rendered,
+        )
+        # Map is rendered lazily, when a client requests the image
+        self._render_dirty = False
+        self._dirty_fingerprint = None
 
     def _generate_image(self) -> None:
         """Generate image."""
-        if self.map_enabled:
-            map_image_path = self.config_entry.options.get(CONF_MAP_IMAGE_PATH, None)
-            if map_image_path and os.path.isfile(map_image_path):
-                map_image = Image.open(map_image_path, "r")
-                map_image = map_image.convert("RGB")
-                map_image_size = self._calculate_image_size(map_image, (600, 600))
-                map_image = map_image.resize(map_image_size)
-            else:
-                map_image = self._create_empty_map_image("No valid path configured to a map image.")
-                LOGGER.warning("No valid map image path configured")
-        else:
-            map_image = self._create_empty_map_image("Map is disabled.")
-
-        try:
-            if self.map_gps_top_left is not None and self.map_gps_bottom_right is not None:
-                img_draw = ImageDraw.Draw(map_image, "RGBA")
-                latitude_current = self._get_attribute(ATTR_LOCATION, {}).get(ATTR_LATITUDE, None)
-                longitude_current = self._get_attribute(ATTR_LOCATION, {}).get(ATTR_LONGITUDE, None)
-                if latitude_current and longitude_current:
-                    location_current = (latitude_current, longitude_current)
-                else:
-                    location_current = None
-
-                # Get location history
-                history_enable = self.config_entry.options.get(CONF_MAP_HISTORY_ENABLE, True)
-                location_history = self._get_attribute(ATTR_LOCATION_HISTORY, [])
-
-                # If history has not change, abort generation
-                if self.last_location_history == location_history:
-                    return None
-
-                if history_enable and location_history is not None:
-                    self.last_location_history = location_history
-
-                    # If current location is not last item in location history, append to it
-                    if location_current and location_current not in location_history[-1:]:
-                        LOGGER.debug("Map: Current location is not last item in location history")
-                        location_history.append(location_current)
-
-                    # Calculate map points
-                    location_history_items = len(location_history)
-                    map_point_max = int(self.config_entry.options.get(CONF_MAP_POINTS, MAP_POINTS_DEFAULT))
-                    map_point_count = min(map_point_max, location_history_items)
-                    map_point_first = location_history_items - map_point_count
-
-                    # At first draw lines between location points, if lines should show
-                    draw_lines = self.config_entry.options.get(CONF_MAP_DRAW_LINES, True)
-                    if draw_lines:
-                        for i in range(location_history_items - 1, map_point_first, -1):
-                            point_1 = location_history[i]
-                            scaled_loc_1 = self._scale_to_image(
-                                point_1, map_image.size
-                            )
-                            point_2 = location_history[i - 1]
-                            scaled_loc_2 = self._scale_to_image(
-                                point_2, map_image.size
-                            )
-                            opacity = self._get_location_opacity(i, map_point_count, map_point_first)
-                            plot_points = self._find_points_on_line(scaled_loc_1, scaled_loc_2)
-                            for p in range(0, len(plot_points) - 1, 2):
-                                img_draw.line(
-                                    (plot_points[p], plot_points[p + 1]),
-                                    fill=(64, 185, 60, opacity),
-                                    width=1
-                                )
-
-                    # At second draw location points
-                    marker_radius = 4
-                    map_point_items = location_history_items -1 if latitude_current and longitude_current else location_history_items
-                    for i in range(map_point_first, map_point_items):
-                        point = location_history[i]
-                        scaled_loc = self._scale_to_image(
-                            point, map_image.size
-                        )
-                        opacity = self._get_location_opacity(i, map_point_count, map_point_first)
-                        img_draw.ellipse(
-                            [
-                                (scaled_loc[0] - marker_radius, scaled_loc[1] - marker_radius),
-                                (scaled_loc[0] + marker_radius, scaled_loc[1] + marker_radius)
-                            ],
-                            fill=(255, 0, 0, opacity),
-                            outline=(64, 185, 60, opacity),
-                            width=3
-                        )
-
-                if location_current:
-                    map_marker_path = self.config_entry.options.get(CONF_MAP_MARKER_PATH, None)
-                    if not map_marker_path or not os.path.isfile(map_marker_path):
-                        map_marker_path = f"{os.path.dirname(__file__)}/resources/marker.png"
-                    map_marker = Image.open(map_marker_path, "r")
-                    map_marker_size = self._calculate_image_size(map_marker, (32, 32))
-                    map_marker = map_marker.resize(map_marker_size)
-
-                    x1, y1 = self._scale_to_image(location_current, map_image.size)
-                    img_w, img_h = map_marker.size
-                    # TODO: sometimes we get ValueError: bad transparency mask
-                    try:
-                        map_image.paste(
-                            map_marker, (x1 - img_w // 2, y1 - img_h // 2), map_marker
-                        )
-                    except Exception as exception:
-                        LOGGER.exception(exception)
-        except Exception as exception:
-            map_image = self._create_empty_map_image("Could not generate the map. Check error log for details.")
-            LOGGER.exception(exception)
-
+        self._image_bytes = self.renderer.render(self._variant)
+
+    def _get_fingerprint(self) -> tuple:
+        """Get the inputs of the map from the renderer."""
+        return self.renderer.get_fingerprint()
+
+    def _invalidate_image(self) -> None:
+        """Mark the map as dirty, if its inputs have changed."""
+        if self.renderer is None:
+            return None
+        fingerprint = self.renderer.get_fingerprint()
+        if fingerprint == self._dirty_fingerprint:
+            return None
+        self._dirty_fingerprint = fingerprint
+        self._render_dirty = True
         self._attr_image_last_updated = dt_util.utcnow()
-        self._image = map_image
-        self._image_to_bytes()
-
-    def _get_location_opacity(
-        self,
-        loc_index: int,
-        loc_count: int,
-        loc_first: int | None = 0,
-    ) -> int:
-        """Get opacity of one location point for map."""
-        return round((loc_index - loc_first) * (200 / loc_count)) + 55
-
-    def _find_points_on_line(
-        self,
-        point_1: ImgPoint,
-        point_2: ImgPoint,
-    ) -> list[ImgPoint]:
-        """Find points on line between two points."""
-        dash_length = 10
-        line_length = math.sqrt(
-            (point_2[0] - point_1[0]) ** 2 + (point_2[1] - point_1[1]) ** 2
-        )
-        dashes = int(line_length // dash_length)
-
-        points = []
-        points.append(point_1)
-        for _i in range(dashes):
-            points.append(self._get_point_on_vector(points[-1], point_2, dash_length))
-
-        points.append(point_2)
-
-        return points
-
-    def _get_point_on_vector(
-        self,
-        initial_pt: ImgPoint,
-        terminal_pt: ImgPoint,
-        distance: int,
-    ) -> ImgPoint:
-        """Get point on vector."""
-        v = np.array(initial_pt, dtype=float)
-        u = np.array(terminal_pt, dtype=float)
-        n = v - u
-        n /= np.linalg.norm(n, 2)
-        point = v - distance * n
-
-        return tuple(point)
-
-    def _find_image_scale(
-        self,
-        size: ImgDimensions,
-    ):
-        """Find the scale ration in m/px and centers of image."""
-        # Length of hypotenuse in meters
-        len_meter = geodesic(self.map_gps_top_left, self.map_gps_bottom_right).meters
-
-        # Length of hypotenuse in pixels
-        len_px = int(math.dist((0, 0), size))
-
-        # Scale in pixels/meter
-        self._image_scale = len_px / len_meter
-
-        # Center of image in pixels
-        self._image_center_px = int((0 + size[0]) / 2), int(
-            (0 + size[1]) / 2
-        )
-        # Center of image in lat/long
-        self._image_center_gps = (
-            (self.map_gps_top_left[0] + self.map_gps_bottom_right[0]) / 2,
-            (self.map_gps_top_left[1] + self.map_gps_bottom_right[1]) / 2,
-        )
-
-    def _scale_to_image(
-        self,
-        location: GpsPoint,
-        size: ImgDimensions
-    ) -> ImgPoint:
-        """Convert from latitude and longitude to the image pixels."""
-        # If image scale is not calculated, do it
-        if self._image_scale is None:
-            self._find_image_scale(size)
-
-        # Bearing resource
-        bearing_res = distance(self._image_center_gps, location).geod.Inverse(
-            self._image_center_gps[0], self._image_center_gps[1], location[0], location[1]
-        )
-        bearing_center_deg = bearing_res.get("azi1")
-        plot_point_center_meter = bearing_res.get("s12") * 1000
-        bearing_center = math.radians(bearing_center_deg - 90 + self.map_rotation)
-
-        # Build the final point
-        point_px = (
-            self._image_center_px[0] + (plot_point_center_meter * self._image_scale * math.cos(bearing_center)),
-            self._image_center_px[1] + (plot_point_center_meter * self._image_scale * math.sin(bearing_center)),
-        )
-        return int(point_px[0]), int(point_px[1])
-
-    def _calculate_image_size(
-        self,
-        image: Image,
-        max_size: ImgDimensions,
-    ) -> ImgDimensions:
-        """Calculate new image size with max dimensions."""
-        img_w, img_h = image.size
-        max_w, max_h = max_size
-
-        scale = max(1, (img_w / max_w), (img_h / max_h))
-        new_w = round(img_w / scale)
-        new_h = round(img_h / scale)
-
-        return (new_w, new_h)
-
-    def _create_empty_map_image(self, text: str = "No map") -> Image:
-        """Create empty map image."""
-        map_image = Image.new("RGB", (600, 400), color=(255, 255, 255))
-        img_draw = ImageDraw.Draw(map_image)
-        _, _, w, h = img_draw.textbbox((0,0), text.upper())
-        img_draw.text(((map_image.size[0] - w) / 2, (map_image.size[1] - h) / 2), text.upper(), fill=(0, 0, 0))
-        return map_image
-
-    def _image_to_bytes(self) -> None:
-        """Save generated image in variable."""
-        img_byte_arr = io.BytesIO()
-        self._image.save(
-            img_byte_arr,
-            format="PNG",
-            #optimize=True,
-            #compress_level=9,
-        )
-        self._image_bytes = img_byte_arr.getvalue()
 
     def _update_extra_state_attributes(self) -> None:
         """Update extra attributes."""
-        # Calculate calibration points only if map is enabled and first image generation is done
-        if self.map_enabled and self._image_scale is not None:
-            calibration_points = []
-            for point in (
-                self.map_gps_top_left,
-                self.map_gps_bottom_right,
-            ):
-                img_point = self._scale_to_image(
-                    (point[0], point[1]), (self._image.size[0], self._image.size[1])
-                )
-                calibration_points.append(
-                    {
-                        "vacuum": {
-                            "x": point[0],
-                            "y": point[1],
-                        },
-                        "map": {
-                            "x": int(img_point[0]),
-                            "y": int(img_point[1])
-                        },
-                    }
-                )
+        # Calibration points are known only if map is enabled and first image generation is done
+        calibration_points = None
+        if self.renderer is not None:
+            calibration_points = self.renderer.get_calibration_points(self._variant)
+        if calibration_points is not None:
             self._additional_extra_state_attributes = {
                 ATTR_CALIBRATION: calibration_points,
             }
+        self._additional_extra_state_attributes.update(
+            {
+                ATTR_RENDER_COUNT: self._render_scheduler.renders,
+                ATTR_RENDER_SKIP_RATE: self._render_scheduler.skip_rate,
+            }
+        )
 
     def image(self) -> bytes | None:
-        """Return bytes of image."""
+        """Return bytes of the last rendered image."""
+        return self._image_bytes
+
+    async def async_image(self) -> bytes | None:
+        """Return bytes of image, render it first if the map is dirty.
+
+        If the render fails, the map stays dirty and the last image is returned.
+        """
+        if self.renderer is not None and self._render_dirty:
+            # Cleared before the render, so an update during the render marks it dirty again
+            self._render_dirty = False
+            try:
+                await self._render_scheduler.async_render()
+            except Exception as exception:  # pylint: disable=broad-except
+                self._render_dirty = True
+                LOGGER.exception(exception)
         return self._image_bytes
 
+    @callback
+    def _async_image_rendered(self) -> None:
+        """Write state once calibration points are known after the first render."""
+        if (
+            self._is_added
+            and ATTR_CALIBRATION not in self._additional_extra_state_attributes
+            and self.renderer.get_calibration_points(self._variant) is not None
+        ):
+            self._update_handler()
+            self.async_write_ha_state()
+
     async def async_update(self) -> None:
         """Handle map image update."""
+        self._invalidate_image()
         await super().async_update()
-        await self.hass.async_add_executor_job(
-            self._generate_image
+
+    async def async_added_to_hass(self) -> None:
+        """Register callbacks."""
+        self.renderer = await self._renderer_loader.async_get_renderer()
+        self._variant = self.renderer.get_variant(
+            name=self.entity_description.key,
+            max_size=self.entity_description.max_size,
+            marker_size=self.entity_description.marker_size,
         )
+        self._invalidate_image()
+        await super().async_added_to_hass()
+        self._is_added = True
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel rendering and clear render cache of the variant when entity will be removed."""
+        await super().async_will_remove_from_hass()
+        self._is_added = False
+        self._render_scheduler.async_cancel()
+        if self.renderer is not None:
+            await self.hass.async_add_executor_job(
+                self.renderer.clear_render_cache,
+                self._variant,
+            )
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        self._invalidate_image()
         super()._handle_coordinator_update()
-        self.hass.async_add_executor_job(
-            self._generate_image
-        )
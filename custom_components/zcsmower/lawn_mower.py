@@ -7,7 +7,6 @@ from homeassistant.const import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.components.lawn_mower import (
-    LawnMowerActivity,
     LawnMowerEntity,
     LawnMowerEntityEntityDescription,
     LawnMowerEntityFeature,
@@ -18,9 +17,11 @@ from .const import (
     LOGGER,
     DOMAIN,
     ATTR_STATUS,
+    ATTR_ERROR,
 )
 from .coordinator import ZcsMowerDataUpdateCoordinator
 from .entity import ZcsMowerRobotEntity
+from .models import get_robot_state_by_name
 
 ROBOT_SUPPORTED_FEATURES = (
     LawnMowerEntityFeature.START_MOWING
@@ -62,6 +63,7 @@ class ZcsMowerRobotLawnMowerEntity(ZcsMowerRobotEntity, LawnMowerEntity):
     """Representation of a ZCS Lawn Mower Robot entity."""
 
     _attr_name = None
+    _subscribed_fields = frozenset({ATTR_STATE, ATTR_ERROR})
 
     def __init__(
         self,
@@ -91,13 +93,7 @@ class ZcsMowerRobotLawnMowerEntity(ZcsMowerRobotEntity, LawnMowerEntity):
     @property
     def state(self) -> str:
         """Return the state of the lawn mower."""
-        if self._get_attribute(ATTR_STATE) in ("work", "gotoarea", "gotostation", "bordercut", "mapping_started", "mapping_ended"):
-            return LawnMowerActivity.MOWING
-        if self._get_attribute(ATTR_STATE) == "charge":
-            return LawnMowerActivity.DOCKED
-        if self._get_attribute(ATTR_STATE) in ("pause", "work_standby"):
-            return LawnMowerActivity.PAUSED
-        return LawnMowerActivity.ERROR
+        return get_robot_state_by_name(self._get_attribute(ATTR_STATE)).lawn_mower_activity
 
     @property
     def error(self) -> str | None:
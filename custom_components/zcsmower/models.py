@@ -0,0 +1,433 @@
+"""ZCS Lawn Mower Robot state models."""
+from __future__ import annotations
+
+from array import array
+from collections.abc import (
+    Iterator,
+    Mapping,
+)
+from dataclasses import (
+    dataclass,
+    field,
+    fields,
+)
+from datetime import datetime
+from itertools import count
+from operator import attrgetter
+from typing import TYPE_CHECKING
+
+from homeassistant.components.lawn_mower import LawnMowerActivity
+from homeassistant.components.vacuum import VacuumActivity
+from homeassistant.const import ATTR_NAME
+import homeassistant.util.dt as dt_util
+
+from .const import (
+    ATTR_IMEI,
+    ATTR_CONNECT_EXPIRATION,
+    ATTR_INFINITY_EXPIRATION,
+    ATTR_LOCATION_HISTORY,
+    ATTR_LAST_COMM,
+    ATTR_LAST_SEEN,
+    ATTR_LAST_PULL,
+    ATTR_NEXT_PULL,
+    ATTR_LAST_WAKE_UP,
+    ATTR_LAST_TRACE_POSITION,
+    LOCATION_HISTORY_ITEMS_DEFAULT,
+    MANUFACTURER_DEFAULT,
+    ROBOT_STATES,
+    ROBOT_STATES_WORKING,
+    DATA_THRESHOLD_STATES,
+    INFINITY_PLAN_STATES,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# States of the lawn mower, which are reported as an error
+ROBOT_STATES_ERROR = (
+    "fail",
+    "nosignal",
+    "expired",
+    "renewed",
+    "hot_temperature",
+)
+ROBOT_STATES_LAWN_MOWER_ACTIVITY = {
+    "work": LawnMowerActivity.MOWING,
+    "gotoarea": LawnMowerActivity.MOWING,
+    "gotostation": LawnMowerActivity.MOWING,
+    "bordercut": LawnMowerActivity.MOWING,
+    "mapping_started": LawnMowerActivity.MOWING,
+    "mapping_ended": LawnMowerActivity.MOWING,
+    "charge": LawnMowerActivity.DOCKED,
+    "pause": LawnMowerActivity.PAUSED,
+    "work_standby": LawnMowerActivity.PAUSED,
+}
+ROBOT_STATES_VACUUM_ACTIVITY = {
+    "work": VacuumActivity.CLEANING,
+    "gotoarea": VacuumActivity.CLEANING,
+    "bordercut": VacuumActivity.CLEANING,
+    "mapping_started": VacuumActivity.CLEANING,
+    "charge": VacuumActivity.DOCKED,
+    "pause": VacuumActivity.PAUSED,
+    "gotostation": VacuumActivity.RETURNING,
+    "mapping_ended": VacuumActivity.RETURNING,
+    "work_standby": VacuumActivity.IDLE,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ZcsMowerRobotState:
+    """State of a lawn mower as reported by the robot_state alarm."""
+
+    code: int
+    name: str
+    icon: str
+    working: bool
+    error: bool
+    lawn_mower_activity: LawnMowerActivity
+    vacuum_activity: VacuumActivity
+
+
+def _compile_robot_states() -> tuple[ZcsMowerRobotState, ...]:
+    """Compile state records of the lawn mower from the state table."""
+    return tuple(
+        ZcsMowerRobotState(
+            code=code,
+            name=state["name"],
+            icon=state["icon"],
+            working=code in ROBOT_STATES_WORKING,
+            error=state["name"] in ROBOT_STATES_ERROR,
+            lawn_mower_activity=ROBOT_STATES_LAWN_MOWER_ACTIVITY.get(
+                state["name"], LawnMowerActivity.ERROR
+            ),
+            vacuum_activity=ROBOT_STATES_VACUUM_ACTIVITY.get(
+                state["name"], VacuumActivity.ERROR
+            ),
+        )
+        for code, state in enumerate(ROBOT_STATES)
+    )
+
+
+ROBOT_STATE_RECORDS = _compile_robot_states()
+ROBOT_STATE_RECORDS_BY_NAME = {
+    record.name: record
+    for record in ROBOT_STATE_RECORDS
+}
+DATA_THRESHOLD_STATE_NAMES = tuple(state["name"] for state in DATA_THRESHOLD_STATES)
+INFINITY_PLAN_STATE_NAMES = tuple(state["name"] for state in INFINITY_PLAN_STATES)
+
+
+def get_robot_state(
+    code: int,
+) -> ZcsMowerRobotState:
+    """Get state record of the lawn mower by its code, unknown if code is out of range."""
+    if 0 <= code < len(ROBOT_STATE_RECORDS):
+        return ROBOT_STATE_RECORDS[code]
+    return ROBOT_STATE_RECORDS[0]
+
+
+def get_robot_state_by_name(
+    name: str | None,
+) -> ZcsMowerRobotState:
+    """Get state record of the lawn mower by its name, unknown if name is not known."""
+    return ROBOT_STATE_RECORDS_BY_NAME.get(name, ROBOT_STATE_RECORDS[0])
+
+
+def get_data_threshold_state(
+    code: int,
+) -> str:
+    """Get name of the data threshold state by its code."""
+    if 0 <= code < len(DATA_THRESHOLD_STATE_NAMES):
+        return DATA_THRESHOLD_STATE_NAMES[code]
+    return DATA_THRESHOLD_STATE_NAMES[0]
+
+
+def get_infinity_plan_state(
+    code: int,
+) -> str:
+    """Get name of the +Infinity plan state by its code."""
+    if 0 <= code < len(INFINITY_PLAN_STATE_NAMES):
+        return INFINITY_PLAN_STATE_NAMES[code]
+    return INFINITY_PLAN_STATE_NAMES[0]
+
+
+# Versions are unique over all location histories
+_location_history_versions = count(1)
+
+
+class ZcsMowerLocationHistory:
+    """Location history of a lawn mower in a ring buffer of fixed capacity.
+
+    Locations and timestamps are stored as float64 in a ring of twice the
+    capacity, and every item is written twice, to its position and to its
+    position in the mirrored second half. So the newest locations are always
+    contiguous and can be returned as a NumPy view without a copy. A view
+    is not overwritten by the next appends up to the capacity, so it can be
+    used in the executor, while the event loop appends new locations.
+    """
+
+    __slots__ = (
+        "capacity",
+        "total",
+        "version",
+        "_size",
+        "_head",
+        "_length",
+        "_locations",
+        "_timestamps",
+    )
+
+    def __init__(
+        self,
+        capacity: int = LOCATION_HISTORY_ITEMS_DEFAULT,
+    ) -> None:
+        """Initialize empty location history."""
+        self.capacity = capacity
+        # Number of all appended locations, the sequence number of the newest one
+        self.total = 0
+        self.version = next(_location_history_versions)
+
+        self._size = 2 * capacity
+        self._head = 0
+        self._length = 0
+        # Latitude and longitude of each item in the ring and in its mirror
+        self._locations = array("d", bytes(2 * 2 * self._size * 8))
+        self._timestamps = array("d", bytes(2 * self._size * 8))
+
+    def __len__(self) -> int:
+        """Return number of locations."""
+        return self._length
+
+    def __getitem__(self, index: int) -> tuple[float, float]:
+        """Get location by its index, the oldest location has index 0."""
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("location history index out of range")
+        position = 2 * (self._head + self._size - self._length + index)
+        return (self._locations[position], self._locations[position + 1])
+
+    def __iter__(self) -> Iterator[tuple[float, float]]:
+        """Iterate over locations from the oldest to the newest."""
+        for index in range(self._length):
+            yield self[index]
+
+    def last(self) -> tuple[float, float] | None:
+        """Get newest location, None if location history is empty."""
+        if self._length == 0:
+            return None
+        return self[-1]
+
+    def items(self) -> Iterator[tuple[tuple[float, float], float]]:
+        """Iterate over locations and their timestamps from the oldest to the newest."""
+        start = self._head + self._size - self._length
+        for index in range(self._length):
+            yield self[index], self._timestamps[start + index]
+
+    def append(
+        self,
+        location: tuple[float, float],
+        timestamp: float = 0.0,
+    ) -> bool:
+        """Append location in O(1), return False if it is the newest location already."""
+        latitude, longitude = location
+        locations = self._locations
+        head = self._head
+        if self._length > 0:
+            last = 2 * (head - 1 + self._size)
+            if locations[last] == latitude and locations[last + 1] == longitude:
+                return False
+        mirror = head + self._size
+        locations[2 * head] = locations[2 * mirror] = latitude
+        locations[2 * head + 1] = locations[2 * mirror + 1] = longitude
+        self._timestamps[head] = self._timestamps[mirror] = timestamp
+        self._head = (head + 1) % self._size
+        self._length = min(self._length + 1, self.capacity)
+        self.total += 1
+        self.version = next(_location_history_versions)
+        return True
+
+    def as_array(self) -> np.ndarray:
+        """Return read-only view of shape (n, 2) with latitude and longitude."""
+        import numpy as np
+
+        view = np.frombuffer(
+            self._locations,
+            dtype=np.float64,
+            count=2 * self._length,
+            offset=2 * (self._head + self._size - self._length) * 8,
+        ).reshape(-1, 2)
+        view.flags.writeable = False
+        return view
+
+    def timestamps_as_array(self) -> np.ndarray:
+        """Return read-only view of the timestamps."""
+        import numpy as np
+
+        view = np.frombuffer(
+            self._timestamps,
+            dtype=np.float64,
+            count=self._length,
+            offset=(self._head + self._size - self._length) * 8,
+        )
+        view.flags.writeable = False
+        return view
+
+
+@dataclass(slots=True, kw_only=True)
+class ZcsMowerState(Mapping):
+    """State of a lawn mower in the coordinator.
+
+    Field names are the values of the ATTR_* constants, so the state can
+    still be read and written like the former dict. The coordinator
+    replaces the state with an updated copy instead of changing it in
+    place, so readers always see a consistent lawn mower. Only the location
+    history is shared by the copies, it is append-only and versioned.
+    """
+
+    imei: str
+    name: str
+    state: str | None = None
+    data_threshold: str | None = None
+    connect_expiration: datetime | None = None
+    infinity_state: str | None = None
+    infinity_expiration: datetime | None = None
+    icon: str | None = None
+    working: bool = False
+    available: bool = False
+    error: str | None = None
+    location: dict[str, float] = field(default_factory=dict)
+    location_history: ZcsMowerLocationHistory | None = None
+    serial_number: str | None = None
+    manufacturer: str = MANUFACTURER_DEFAULT
+    model: str | None = None
+    sw_version: str | None = None
+    connected: bool = False
+    last_communication: datetime | None = None
+    last_seen: datetime | None = None
+    last_pull: datetime | None = None
+    next_pull: datetime | None = None
+    last_state: str | None = None
+    last_wake_up: datetime | None = None
+    last_trace_position: datetime | None = None
+
+    def __getitem__(self, key: str) -> any:
+        """Get field by its attribute name."""
+        if key not in _ZCS_MOWER_STATE_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: any) -> None:
+        """Set field by its attribute name."""
+        if key not in _ZCS_MOWER_STATE_KEYS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over attribute names."""
+        return iter(ZCS_MOWER_STATE_FIELDS)
+
+    def __len__(self) -> int:
+        """Return number of attributes."""
+        return len(ZCS_MOWER_STATE_FIELDS)
+
+    def get(self, key: str, default: any = None) -> any:
+        """Get field by its attribute name, default if attribute is not known."""
+        if key not in _ZCS_MOWER_STATE_KEYS:
+            return default
+        return getattr(self, key)
+
+    def copy(self) -> ZcsMowerState:
+        """Return a shallow copy of the state."""
+        # Faster than dataclasses.replace, which passes all fields through __init__
+        other = object.__new__(ZcsMowerState)
+        for key, value in zip(ZCS_MOWER_STATE_FIELDS, _get_state_values(self), strict=True):
+            setattr(other, key, value)
+        return other
+
+    def get_changed_fields(self, other: ZcsMowerState) -> list[str]:
+        """Get names of the attributes, which differ from the other state."""
+        return [
+            key
+            for key, value, value_other in zip(
+                ZCS_MOWER_STATE_FIELDS,
+                _get_state_values(self),
+                _get_state_values(other),
+                strict=True,
+            )
+            if value is not value_other and value != value_other
+        ]
+
+    def as_storage(
+        self,
+        history_items: int,
+    ) -> dict[str, any]:
+        """Return JSON serializable state with the newest locations of the location history."""
+        data = {}
+        for key, value in zip(ZCS_MOWER_STATE_FIELDS, _get_state_values(self), strict=True):
+            if key in _ZCS_MOWER_STATE_STORAGE_EXCLUDED:
+                continue
+            if isinstance(value, datetime):
+                value = value.isoformat()
+            data[key] = value
+        if self.location_history is not None:
+            items = list(self.location_history.items())[-history_items:]
+            data[ATTR_LOCATION_HISTORY] = [
+                [latitude, longitude, timestamp]
+                for (latitude, longitude), timestamp in items
+            ]
+        return data
+
+    @classmethod
+    def from_storage(
+        cls,
+        imei: str,
+        name: str,
+        data: dict[str, any],
+    ) -> ZcsMowerState:
+        """Create state from stored data, unknown or invalid values are ignored."""
+        mower = cls(imei=imei, name=name)
+        for key, value in data.items():
+            if key not in _ZCS_MOWER_STATE_KEYS or key in _ZCS_MOWER_STATE_STORAGE_EXCLUDED:
+                continue
+            if key in _ZCS_MOWER_STATE_DATETIME_FIELDS and value is not None:
+                value = dt_util.parse_datetime(value)
+                if value is None:
+                    continue
+                value = dt_util.as_local(value)
+            mower[key] = value
+        if (locations := data.get(ATTR_LOCATION_HISTORY, None)) is not None:
+            mower.location_history = ZcsMowerLocationHistory()
+            for latitude, longitude, timestamp in locations:
+                mower.location_history.append((latitude, longitude), timestamp)
+        return mower
+
+
+ZCS_MOWER_STATE_FIELDS = tuple(
+    state_field.name
+    for state_field in fields(ZcsMowerState)
+)
+_ZCS_MOWER_STATE_KEYS = frozenset(ZCS_MOWER_STATE_FIELDS)
+_get_state_values = attrgetter(*ZCS_MOWER_STATE_FIELDS)
+_ZCS_MOWER_STATE_DATETIME_FIELDS = frozenset(
+    {
+        ATTR_CONNECT_EXPIRATION,
+        ATTR_INFINITY_EXPIRATION,
+        ATTR_LAST_COMM,
+        ATTR_LAST_SEEN,
+        ATTR_LAST_PULL,
+        ATTR_NEXT_PULL,
+        ATTR_LAST_WAKE_UP,
+        ATTR_LAST_TRACE_POSITION,
+    }
+)
+# Identity comes from the config entry, location history is stored separately
+# and the next pull is planned anew after a start
+_ZCS_MOWER_STATE_STORAGE_EXCLUDED = frozenset(
+    {
+        ATTR_IMEI,
+        ATTR_NAME,
+        ATTR_LOCATION_HISTORY,
+        ATTR_NEXT_PULL,
+    }
+)
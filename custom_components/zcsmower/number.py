@@ -119,6 +119,8 @@ class ZcsMowerRobotNumberEntity(ZcsMowerRobotEntity, NumberEntity):
     """Representation of a ZCS Lawn Mower Robot number."""
 
     _attr_entity_registry_enabled_default = False
+    # Only the availability is rendered
+    _subscribed_fields = frozenset()
 
     def __init__(
         self,
@@ -0,0 +1,76 @@
+"""ZCS Lawn Mower Robot map projection."""
+from __future__ import annotations
+
+import math
+import numpy as np
+
+# WGS84 ellipsoid
+WGS84_SEMI_MAJOR_AXIS = 6378137.0  # meters
+WGS84_ECCENTRICITY_SQUARED = 6.69437999014e-3
+
+GpsPoint = tuple[float, float]
+ImgPoint = tuple[int, int]
+
+
+class ZcsMowerMapProjection:
+    """Project GPS coordinates onto the pixels of the map image.
+
+    Uses a local tangent plane (east, north) anchored at the center of the
+    map. For the size of a garden, the deviation from the geodesic solution
+    is far below one pixel, but a whole location history is projected with
+    a single matrix multiplication.
+    """
+
+    def __init__(
+        self,
+        center_gps: GpsPoint,
+        center_px: ImgPoint,
+        scale: float,
+        rotation: float = 0.0,
+    ) -> None:
+        """Initialize projection.
+
+        Args:
+            center_gps (GpsPoint): Center of the map in latitude and longitude.
+            center_px (ImgPoint): Center of the map in pixels.
+            scale (float): Scale of the map in pixels per meter.
+            rotation (float): Rotation of the map from true north in degrees.
+
+        """
+        self.center_gps = center_gps
+        self.center_px = center_px
+        self.scale = scale
+        self.rotation = rotation
+
+        # Radii of curvature at the center of the map
+        latitude = math.radians(center_gps[0])
+        w = 1 - WGS84_ECCENTRICITY_SQUARED * math.sin(latitude) ** 2
+        meridian_radius = WGS84_SEMI_MAJOR_AXIS * (1 - WGS84_ECCENTRICITY_SQUARED) / w ** 1.5
+        normal_radius = WGS84_SEMI_MAJOR_AXIS / math.sqrt(w)
+        self._meters_per_degree = np.array(
+            [
+                math.radians(1) * normal_radius * math.cos(latitude),
+                math.radians(1) * meridian_radius,
+            ]
+        )
+        self._origin = np.array([center_gps[1], center_gps[0]], dtype=float)
+
+        # Rotate (east, north) into image axes (x to the right, y downwards)
+        rotation_rad = math.radians(rotation)
+        self._matrix = scale * np.array(
+            [
+                [math.cos(rotation_rad), math.sin(rotation_rad)],
+                [math.sin(rotation_rad), -math.cos(rotation_rad)],
+            ]
+        )
+        self._offset = np.array(center_px, dtype=float)
+
+    def to_pixels(
+        self,
+        locations: list[GpsPoint] | np.ndarray,
+    ) -> np.ndarray:
+        """Convert an array of (latitude, longitude) into an array of subpixel (x, y)."""
+        points = np.asarray(locations, dtype=float).reshape(-1, 2)
+        # (latitude, longitude) -> (east, north) in meters
+        east_north = (points[:, ::-1] - self._origin) * self._meters_per_degree
+        return east_north @ self._matrix.T + self._offset
@@ -0,0 +1,712 @@
+"""ZCS Lawn Mower Robot map renderer."""
+from __future__ import annotations
+
+import io
+import os
+import math
+import threading
+import numpy as np
+
+from geopy.distance import geodesic
+from PIL import (
+    Image,
+    ImageDraw,
+)
+
+from homeassistant.const import (
+    ATTR_LOCATION,
+    ATTR_LATITUDE,
+    ATTR_LONGITUDE,
+)
+from homeassistant.config_entries import ConfigEntry
+
+from .const import (
+    LOGGER,
+    MAP_POINTS_DEFAULT,
+    MAP_IMAGE_SIZE_MAX,
+    MAP_IMAGE_FORMAT_DEFAULT,
+    MAP_IMAGE_FORMATS,
+    CONF_MAP_ENABLE,
+    CONF_MAP_IMAGE_PATH,
+    CONF_MAP_MARKER_PATH,
+    CONF_MAP_GPS_TOP_LEFT,
+    CONF_MAP_GPS_BOTTOM_RIGHT,
+    CONF_MAP_ROTATION,
+    CONF_MAP_HISTORY_ENABLE,
+    CONF_MAP_POINTS,
+    CONF_MAP_DRAW_LINES,
+    CONF_MAP_IMAGE_FORMAT,
+    ATTR_LOCATION_HISTORY,
+)
+from .coordinator import ZcsMowerDataUpdateCoordinator
+from .projection import (
+    GpsPoint,
+    ImgPoint,
+    ZcsMowerMapProjection,
+)
+
+ImgDimensions = tuple[int, int]
+
+
+class ZcsMowerMapVariant:
+    """Size and persistent trail layer of one variant of the map."""
+
+    def __init__(
+        self,
+        name: str,
+        max_size: int,
+        marker_size: int,
+    ) -> None:
+        """Initialize map variant.
+
+        Args:
+            name (str): Name of the variant, the key of its render cache entries.
+            max_size (int): Maximum width and height in pixels.
+            marker_size (int): Size of the location marker in pixels.
+
+        """
+        self.name = name
+        self.max_size = max_size
+        self.marker_size = marker_size
+        # Size of variant and its factor to the native map, known after the first render
+        self.size = None
+        self.factor = None
+
+        # Lines and location points are kept apart, so new lines stay below older points
+        self.line_layer = None
+        self.dot_layer = None
+        self.trail_key = None
+        self.trail_last_point = None
+        self.trail_last_sequence = None
+        self.trail_last_dot = False
+        # Location points drawn since the last complete trail
+        self.trail_items = 0
+
+    @property
+    def trail_scale(self) -> float:
+        """Return scale of location points and lines compared to the default marker."""
+        return self.marker_size / 32
+
+    def clear_trail_layer(self) -> None:
+        """Clear trail layers, the next frame renders the complete trail."""
+        self.line_layer = None
+        self.dot_layer = None
+        self.trail_key = None
+        self.trail_last_point = None
+        self.trail_last_sequence = None
+
+
+class ZcsMowerMapRenderer:
+    """Render the map of one mower in several sizes.
+
+    All variants share the decoded base image and the projection of the
+    location history, which is calculated once in the native resolution of
+    the base image and scaled for every variant.
+    """
+
+    def __init__(
+        self,
+        config_entry: ConfigEntry,
+        coordinator: ZcsMowerDataUpdateCoordinator,
+        imei: str,
+    ) -> None:
+        """Initialize the map renderer."""
+        self.config_entry = config_entry
+        self.coordinator = coordinator
+        self.imei = imei
+
+        self.image_format = MAP_IMAGE_FORMATS.get(
+            self.config_entry.options.get(CONF_MAP_IMAGE_FORMAT, MAP_IMAGE_FORMAT_DEFAULT),
+            MAP_IMAGE_FORMATS[MAP_IMAGE_FORMAT_DEFAULT],
+        )
+        self.content_type = self.image_format["content_type"]
+
+        self.map_enabled = self.config_entry.options.get(CONF_MAP_ENABLE, False)
+        self.map_gps_top_left = None
+        self.map_gps_bottom_right = None
+        self.map_rotation = 0
+
+        if self.map_enabled:
+            self.map_gps_top_left = self.config_entry.options.get(CONF_MAP_GPS_TOP_LEFT, None)
+            self.map_gps_bottom_right = self.config_entry.options.get(CONF_MAP_GPS_BOTTOM_RIGHT, None)
+            self.map_rotation = self.config_entry.options.get(CONF_MAP_ROTATION, 0.0)
+        else:
+            latitude_current = self._get_attribute(ATTR_LOCATION, {}).get(ATTR_LATITUDE, None)
+            longitude_current = self._get_attribute(ATTR_LOCATION, {}).get(ATTR_LONGITUDE, None)
+            if latitude_current and longitude_current:
+                earth_radius = 6371008  # meters
+                offset = 100  # meters
+                top_left_latitude = latitude_current - (offset / earth_radius) * (180 / math.pi)
+                top_left_longitude = longitude_current - (offset / earth_radius) * (180 / math.pi) / math.cos(latitude_current * math.pi / 180)
+                bottom_right_latitude = latitude_current + (offset / earth_radius) * (180 / math.pi)
+                bottom_right_longitude = longitude_current + (offset / earth_radius) * (180 / math.pi) / math.cos(latitude_current * math.pi / 180)
+                self.map_gps_top_left = (top_left_latitude, top_left_longitude)
+                self.map_gps_bottom_right = (bottom_right_latitude, bottom_right_longitude)
+
+        # Projection into the native size of the base image
+        self._native_size = None
+        self._projection = None
+
+        self._render_cache = {}
+        self._render_cache_options = None
+        self._history_pixels = None
+        self._history_pixels_key = None
+        self._variants = {}
+
+        # Variants are rendered in the executor and share the caches
+        self._lock = threading.Lock()
+
+    def _get_attribute(
+        self,
+        attr: str,
+        default_value: any | None = None,
+    ) -> any:
+        """Get attribute of the mower."""
+        if (mower := self.coordinator.data.get(self.imei)) is None:
+            return default_value
+        return mower.get(attr, default_value)
+
+    def get_variant(
+        self,
+        name: str,
+        max_size: int,
+        marker_size: int,
+    ) -> ZcsMowerMapVariant:
+        """Get variant of the map by its name, a variant with other dimensions is replaced."""
+        variant = self._variants.get(name)
+        if variant is None or (variant.max_size, variant.marker_size) != (max_size, marker_size):
+            variant = self._variants[name] = ZcsMowerMapVariant(name, max_size, marker_size)
+        return variant
+
+    def get_fingerprint(self) -> tuple:
+        """Get the inputs of the map, a render is skipped if they have not changed."""
+        location_history = self._get_attribute(ATTR_LOCATION_HISTORY, None)
+        return (
+            self._get_attribute(ATTR_LOCATION, {}).get(ATTR_LATITUDE, None),
+            self._get_attribute(ATTR_LOCATION, {}).get(ATTR_LONGITUDE, None),
+            location_history.version if location_history is not None else None,
+            dict(self.config_entry.options),
+        )
+
+    def render(
+        self,
+        variant: ZcsMowerMapVariant,
+    ) -> bytes:
+        """Render variant of the map and return the encoded image."""
+        with self._lock:
+            return self.image_to_bytes(
+                self._generate_image(variant)
+            )
+
+    def clear_render_cache(
+        self,
+        variant: ZcsMowerMapVariant,
+    ) -> None:
+        """Clear render cache of a variant, the shared layers are kept for the other variants."""
+        with self._lock:
+            if self._variants.get(variant.name) is variant:
+                self._variants.pop(variant.name)
+            if len(self._variants) == 0:
+                self._clear_render_cache()
+                return None
+            self._pop_render_cache(variant.name)
+            variant.clear_trail_layer()
+
+    def get_calibration_points(
+        self,
+        variant: ZcsMowerMapVariant,
+    ) -> list[dict] | None:
+        """Get calibration points of the variant, if it is rendered once."""
+        if not self.map_enabled or self._projection is None or variant.factor is None:
+            return None
+        calibration_points = []
+        for point in (
+            self.map_gps_top_left,
+            self.map_gps_bottom_right,
+        ):
+            img_point = self._scale_to_image((point[0], point[1]), variant)
+            calibration_points.append(
+                {
+                    "vacuum": {
+                        "x": point[0],
+                        "y": point[1],
+                    },
+                    "map": {
+                        "x": int(img_point[0]),
+                        "y": int(img_point[1])
+                    },
+                }
+            )
+        return calibration_points
+
+    def _generate_image(
+        self,
+        variant: ZcsMowerMapVariant,
+    ) -> Image:
+        """Generate image of a variant."""
+        # Drop cached layers, if options has changed since the last render
+        if self._render_cache_options != self.config_entry.options:
+            self._clear_render_cache()
+            self._render_cache_options = dict(self.config_entry.options)
+
+        max_size = (variant.max_size, variant.max_size)
+        if self.map_enabled:
+            map_image_path = self.config_entry.options.get(CONF_MAP_IMAGE_PATH, None)
+            if map_image_path and os.path.isfile(map_image_path):
+                # Start every frame from a copy of the cached base layer
+                native_size = self._get_cached_image(map_image_path, None, None, "RGB").size
+                map_image = self._get_cached_image(map_image_path, variant.name, max_size, "RGB").copy()
+            else:
+                native_size = (600, 400)
+                map_image = self.create_empty_map_image("No valid path configured to a map image.", max_size)
+                LOGGER.warning("No valid map image path configured")
+        else:
+            native_size = (600, 400)
+            map_image = self.create_empty_map_image("Map is disabled.", max_size)
+
+        # Projection depends on the native size only, variants are scaled from it
+        if self._native_size != native_size:
+            self._native_size = native_size
+            self._projection = None
+            self._history_pixels_key = None
+        if variant.size != map_image.size:
+            variant.size = map_image.size
+            variant.factor = map_image.size[0] / native_size[0]
+            variant.clear_trail_layer()
+
+        try:
+            if self.map_gps_top_left is not None and self.map_gps_bottom_right is not None:
+                latitude_current = self._get_attribute(ATTR_LOCATION, {}).get(ATTR_LATITUDE, None)
+                longitude_current = self._get_attribute(ATTR_LOCATION, {}).get(ATTR_LONGITUDE, None)
+                if latitude_current and longitude_current:
+                    location_current = (latitude_current, longitude_current)
+                else:
+                    location_current = None
+
+                # Get location history
+                history_enable = self.config_entry.options.get(CONF_MAP_HISTORY_ENABLE, True)
+                location_history = self._get_attribute(ATTR_LOCATION_HISTORY, None)
+
+                if history_enable and location_history is not None:
+                    # View of the ring buffer, stable while rendering
+                    history_key = location_history.version
+                    history_sequence = location_history.total
+                    history_points = location_history.as_array()
+                    # If current location is not last item in location history, append to it
+                    if location_current and location_current != location_history.last():
+                        LOGGER.debug("Map: Current location is not last item in location history")
+                        history_key = (history_key, location_current)
+                        history_sequence += 1
+                        history_points = np.vstack((history_points, location_current))
+
+                    # Update the persistent trail layers and composite them onto the map
+                    self._update_trail_layer(
+                        variant=variant,
+                        history_points=history_points,
+                        history_key=history_key,
+                        history_sequence=history_sequence,
+                        has_location_current=location_current is not None,
+                    )
+                    map_image.paste(variant.line_layer, (0, 0), variant.line_layer)
+                    map_image.paste(variant.dot_layer, (0, 0), variant.dot_layer)
+
+                if location_current:
+                    map_marker_path = self.config_entry.options.get(CONF_MAP_MARKER_PATH, None)
+                    if not map_marker_path or not os.path.isfile(map_marker_path):
+                        map_marker_path = f"{os.path.dirname(__file__)}/resources/marker.png"
+                    map_marker = self._get_cached_image(
+                        map_marker_path, variant.name, (variant.marker_size, variant.marker_size)
+                    )
+
+                    x1, y1 = self._scale_to_image(location_current, variant)
+                    img_w, img_h = map_marker.size
+                    # TODO: sometimes we get ValueError: bad transparency mask
+                    try:
+                        map_image.paste(
+                            map_marker, (x1 - img_w // 2, y1 - img_h // 2), map_marker
+                        )
+                    except Exception as exception:
+                        LOGGER.exception(exception)
+        except Exception as exception:
+            map_image = self.create_empty_map_image("Could not generate the map. Check error log for details.", max_size)
+            LOGGER.exception(exception)
+
+        return map_image
+
+    def _get_cached_image(
+        self,
+        path: str,
+        variant_name: str | None,
+        max_size: ImgDimensions | None,
+        mode: str | None = None,
+    ) -> Image:
+        """Get decoded and resized image from render cache.
+
+        The cache key contains the name of the variant, the path, the
+        modification time and the target size, so a replaced file on disk is
+        loaded again. The file is decoded once in its native size (max.
+        MAP_IMAGE_SIZE_MAX) for all variants and every other size is resized
+        from this image.
+        """
+        mtime = os.path.getmtime(path)
+        cache_key = (variant_name, path, mtime, max_size, mode)
+        if (image := self._render_cache.get(cache_key)) is None:
+            if max_size is None:
+                LOGGER.debug("Map: Load %s into render cache", path)
+                # Remove outdated entries of the same path
+                for key in [key for key in self._render_cache if key[1] == path and key[2] != mtime]:
+                    self._render_cache.pop(key)
+                with Image.open(path, "r") as image_file:
+                    image = image_file.convert(mode) if mode else image_file.copy()
+                max_size = (MAP_IMAGE_SIZE_MAX, MAP_IMAGE_SIZE_MAX)
+            else:
+                # Remove entries of the variant in another size
+                self._pop_render_cache(variant_name, path)
+                image = self._get_cached_image(path, None, None, mode)
+            image = image.resize(self._calculate_image_size(image, max_size))
+            self._render_cache[cache_key] = image
+        return image
+
+    def _pop_render_cache(
+        self,
+        variant_name: str,
+        path: str | None = None,
+    ) -> None:
+        """Remove entries of a variant from render cache, only of the given path if any."""
+        for key in [
+            key
+            for key in self._render_cache
+            if key[0] == variant_name and (path is None or key[1] == path)
+        ]:
+            self._render_cache.pop(key)
+
+    def _clear_render_cache(self) -> None:
+        """Clear render cache."""
+        self._render_cache.clear()
+        self._history_pixels = None
+        self._history_pixels_key = None
+        for variant in self._variants.values():
+            variant.clear_trail_layer()
+
+    def _get_history_pixels(
+        self,
+        history_points: np.ndarray,
+        history_key: any,
+    ) -> np.ndarray:
+        """Get subpixels of the location history in the native size.
+
+        The projection is shared by all variants and only calculated again,
+        if the version of the location history has changed.
+        """
+        if self._history_pixels_key != history_key:
+            self._history_pixels = self._get_projection().to_pixels(history_points)
+            self._history_pixels_key = history_key
+        return self._history_pixels
+
+    def _update_trail_layer(
+        self,
+        variant: ZcsMowerMapVariant,
+        history_points: np.ndarray,
+        history_key: any,
+        history_sequence: int,
+        has_location_current: bool = False,
+    ) -> None:
+        """Draw new location points and lines into the persistent trail layers.
+
+        The opacity of a location point depends on its age and the number of
+        map points. While the number is unchanged, older points are faded with
+        one lookup table for the alpha channel and only the points added since
+        the last frame are drawn. Every segment and location point is
+        composited on its own, so overlapping shapes blend like drawn directly
+        on the map. Overlapping shapes do not fade exactly like that, so the
+        complete trail is rendered again, when all its points are replaced.
+        """
+        map_point_max = int(self.config_entry.options.get(CONF_MAP_POINTS, MAP_POINTS_DEFAULT))
+        draw_lines = self.config_entry.options.get(CONF_MAP_DRAW_LINES, True)
+        location_history_items = len(history_points)
+        map_point_count = min(map_point_max, location_history_items)
+
+        trail_key = (variant.size, map_point_count, draw_lines)
+        new_items = self._get_new_trail_items(variant, history_points, history_sequence)
+        if (
+            variant.line_layer is None
+            or variant.trail_key != trail_key
+            or new_items is None
+            or variant.trail_items + new_items >= map_point_count
+        ):
+            LOGGER.debug("Map: Render complete trail layers")
+            variant.line_layer = Image.new("RGBA", variant.size, (0, 0, 0, 0))
+            variant.dot_layer = Image.new("RGBA", variant.size, (0, 0, 0, 0))
+            variant.trail_key = trail_key
+            variant.trail_items = 0
+            new_items = map_point_count
+            line_first = location_history_items - new_items + 1
+            variant.trail_last_dot = True
+        else:
+            line_first = location_history_items - new_items
+            if new_items > 0:
+                self._fade_trail_layer(variant, new_items, map_point_count)
+
+        if location_history_items > 0:
+            variant.trail_last_point = tuple(history_points[-1].tolist())
+            variant.trail_last_sequence = history_sequence
+        if new_items == 0:
+            return None
+
+        # Scale new location points from the shared projection
+        # (one more point for the first line and the last point without dot)
+        first = max(location_history_items - new_items - 1, 0)
+        scaled_locs = (
+            self._get_history_pixels(history_points, history_key)[first:] * variant.factor
+        ).astype(int).tolist()
+        trail_scale = variant.trail_scale
+
+        # At first draw lines between location points, if lines should show
+        if draw_lines and (line_first := max(line_first, 1)) < location_history_items:
+            # Polyline from the newest to the oldest new location point
+            polyline = np.array(scaled_locs[line_first - 1 - first:][::-1], dtype=float)
+            dashes, segments = self._find_dashes_on_polyline(
+                polyline, max(2, round(10 * trail_scale))
+            )
+            opacities = [
+                self._get_location_opacity(age, map_point_count)
+                for age in range(len(polyline) - 1)
+            ]
+            line_width = max(1, round(trail_scale))
+            # Dashes are ordered by segment
+            boundaries = np.flatnonzero(np.diff(segments)) + 1
+            for start, segment_dashes in zip(
+                [0, *boundaries.tolist()], np.split(dashes, boundaries), strict=True
+            ):
+                if len(segment_dashes) == 0:
+                    continue
+                shape_layer, offset = self._get_shape_layer(variant, segment_dashes, line_width)
+                if shape_layer is None:
+                    continue
+                shape_draw = ImageDraw.Draw(shape_layer)
+                for dash in (segment_dashes - np.tile(offset, 2)).tolist():
+                    shape_draw.line(
+                        dash,
+                        fill=(64, 185, 60, opacities[segments[start]]),
+                        width=line_width
+                    )
+                variant.line_layer.alpha_composite(shape_layer, offset)
+
+        # At second draw location points, the last one is covered by the marker
+        marker_radius = max(1, round(4 * trail_scale))
+        marker_width = max(1, round(3 * trail_scale))
+        dot_first = location_history_items - new_items
+        if not variant.trail_last_dot:
+            dot_first = max(dot_first - 1, 0)
+        dot_last = location_history_items - 1 if has_location_current else location_history_items
+        for i in range(dot_first, dot_last):
+            scaled_loc = scaled_locs[i - first]
+            opacity = self._get_location_opacity(location_history_items - 1 - i, map_point_count)
+            bounding_box = np.array(
+                [
+                    scaled_loc[0] - marker_radius, scaled_loc[1] - marker_radius,
+                    scaled_loc[0] + marker_radius, scaled_loc[1] + marker_radius,
+                ]
+            )
+            shape_layer, offset = self._get_shape_layer(variant, bounding_box, 0)
+            if shape_layer is None:
+                continue
+            ImageDraw.Draw(shape_layer).ellipse(
+                (bounding_box - np.tile(offset, 2)).tolist(),
+                fill=(255, 0, 0, opacity),
+                outline=(64, 185, 60, opacity),
+                width=marker_width
+            )
+            variant.dot_layer.alpha_composite(shape_layer, offset)
+        variant.trail_last_dot = not has_location_current
+
+    def _get_shape_layer(
+        self,
+        variant: ZcsMowerMapVariant,
+        coordinates: np.ndarray,
+        margin: int,
+    ) -> tuple[Image | None, ImgPoint]:
+        """Get transparent layer and its offset, which cover a shape on the trail layer.
+
+        Returns None as layer, if the shape is outside of the trail layer.
+        """
+        points = np.asarray(coordinates).reshape(-1, 2)
+        left, top = np.maximum(np.floor(points.min(axis=0)).astype(int) - margin, 0).tolist()
+        right, bottom = np.minimum(
+            np.ceil(points.max(axis=0)).astype(int) + margin + 1, variant.size
+        ).tolist()
+        if right <= left or bottom <= top:
+            return None, (0, 0)
+        return Image.new("RGBA", (right - left, bottom - top), (0, 0, 0, 0)), (left, top)
+
+    def _get_new_trail_items(
+        self,
+        variant: ZcsMowerMapVariant,
+        history_points: np.ndarray,
+        history_sequence: int,
+    ) -> int | None:
+        """Get number of location points added since the last frame of the variant.
+
+        Returns None, if the last drawn location point is not in the history.
+        """
+        if variant.trail_last_point is None or variant.trail_last_sequence is None:
+            return None
+        new_items = history_sequence - variant.trail_last_sequence
+        if not 0 <= new_items < len(history_points):
+            return None
+        # Location history was replaced, if the last drawn location point differs
+        if tuple(history_points[-1 - new_items].tolist()) != variant.trail_last_point:
+            return None
+        return new_items
+
+    def _fade_trail_layer(
+        self,
+        variant: ZcsMowerMapVariant,
+        new_items: int,
+        map_point_count: int,
+    ) -> None:
+        """Fade all drawn location points and lines by the age of new items."""
+        fading_step = 200 / map_point_count
+        fading_before = round(variant.trail_items * fading_step)
+        variant.trail_items += new_items
+        fading = round(variant.trail_items * fading_step) - fading_before
+        if fading <= 0:
+            return None
+        # Points older than the number of map points disappear
+        lut = [
+            value - fading if value - fading > 55 - fading_step / 2 else 0
+            for value in range(256)
+        ]
+        for layer in (variant.line_layer, variant.dot_layer):
+            layer.putalpha(layer.getchannel("A").point(lut))
+
+    def _get_location_opacity(
+        self,
+        loc_age: int,
+        loc_count: int,
+    ) -> int:
+        """Get opacity of one location point for map by its age and the number of map points."""
+        return round((loc_count - 1 - loc_age) * (200 / loc_count)) + 55
+
+    def _find_dashes_on_polyline(
+        self,
+        polyline: np.ndarray,
+        dash_length: int = 10,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Find dashes on all segments of a polyline in one pass.
+
+        Returns an array with one flat (x1, y1, x2, y2) row per dash and
+        the index of the polyline segment for each dash.
+        """
+        starts = polyline[:-1]
+        vectors = polyline[1:] - starts
+        lengths = np.hypot(vectors[:, 0], vectors[:, 1])
+        directions = np.divide(
+            vectors,
+            lengths[:, None],
+            out=np.zeros_like(vectors),
+            where=lengths[:, None] > 0,
+        )
+
+        # Every segment starts with a dash, the last dash ends at the segment end
+        dash_counts = (np.floor_divide(lengths, dash_length).astype(int) + 2) // 2
+        segments = np.repeat(np.arange(len(starts)), dash_counts)
+        dash_index = np.arange(len(segments)) - np.repeat(
+            np.cumsum(dash_counts) - dash_counts, dash_counts
+        )
+        offset_start = 2 * dash_length * dash_index
+        offset_end = np.minimum(offset_start + dash_length, lengths[segments])
+
+        dashes = np.hstack(
+            (
+                starts[segments] + offset_start[:, None] * directions[segments],
+                starts[segments] + offset_end[:, None] * directions[segments],
+            )
+        )
+        return dashes, segments
+
+    def _get_projection(self) -> ZcsMowerMapProjection:
+        """Get projection into the native size, calculate it first if required."""
+        if self._projection is None:
+            self._find_image_scale(self._native_size)
+        return self._projection
+
+    def _find_image_scale(
+        self,
+        size: ImgDimensions,
+    ) -> None:
+        """Find the scale ration in m/px and centers of image."""
+        # Length of hypotenuse in meters
+        len_meter = geodesic(self.map_gps_top_left, self.map_gps_bottom_right).meters
+
+        # Length of hypotenuse in pixels
+        len_px = int(math.dist((0, 0), size))
+
+        # Center of image in lat/long
+        image_center_gps = (
+            (self.map_gps_top_left[0] + self.map_gps_bottom_right[0]) / 2,
+            (self.map_gps_top_left[1] + self.map_gps_bottom_right[1]) / 2,
+        )
+        self._projection = ZcsMowerMapProjection(
+            center_gps=image_center_gps,
+            # Center of image in pixels
+            center_px=(size[0] / 2, size[1] / 2),
+            # Scale in pixels/meter
+            scale=len_px / len_meter,
+            rotation=self.map_rotation,
+        )
+
+    def _scale_to_image(
+        self,
+        location: GpsPoint,
+        variant: ZcsMowerMapVariant,
+    ) -> ImgPoint:
+        """Convert from latitude and longitude to the image pixels of a variant."""
+        x, y = self._get_projection().to_pixels([location])[0] * variant.factor
+        return int(x), int(y)
+
+    def _calculate_image_size(
+        self,
+        image: Image,
+        max_size: ImgDimensions,
+    ) -> ImgDimensions:
+        """Calculate new image size with max dimensions."""
+        img_w, img_h = image.size
+        max_w, max_h = max_size
+
+        scale = max(1, (img_w / max_w), (img_h / max_h))
+        new_w = round(img_w / scale)
+        new_h = round(img_h / scale)
+
+        return (new_w, new_h)
+
+    def create_empty_map_image(
+        self,
+        text: str = "No map",
+        max_size: ImgDimensions = (600, 400),
+    ) -> Image:
+        """Create empty map image."""
+        map_image = Image.new("RGB", (600, 400), color=(255, 255, 255))
+        img_draw = ImageDraw.Draw(map_image)
+        _, _, w, h = img_draw.textbbox((0,0), text.upper())
+        img_draw.text(((map_image.size[0] - w) / 2, (map_image.size[1] - h) / 2), text.upper(), fill=(0, 0, 0))
+        new_size = self._calculate_image_size(map_image, max_size)
+        if new_size != map_image.size:
+            map_image = map_image.resize(new_size)
+        return map_image
+
+    def image_to_bytes(
+        self,
+        image: Image,
+    ) -> bytes:
+        """Encode image in the configured format."""
+        # Quantize to a palette image, if the format requires it
+        if (colors := self.image_format.get("colors")) is not None:
+            image = image.quantize(colors=colors, method=Image.Quantize.FASTOCTREE)
+        img_byte_arr = io.BytesIO()
+        image.save(
+            img_byte_arr,
+            format=self.image_format["format"],
+            **self.image_format.get("params", {}),
+        )
+        return img_byte_arr.getvalue()
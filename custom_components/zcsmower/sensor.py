@@ -1,12 +1,18 @@
 """ZCS Lawn Mower Robot sensor platform."""
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import (
     date,
     datetime,
+    timedelta,
 )
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.const import (
     ATTR_STATE,
     ATTR_ICON,
@@ -21,6 +27,7 @@ from homeassistant.helpers.entity import (
     Entity,
     EntityCategory,
 )
+from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.typing import StateType
 import homeassistant.util.dt as dt_util
 
@@ -28,9 +35,21 @@ from .const import (
     ATTR_CONNECT_EXPIRATION,
     ATTR_INFINITY_STATE,
     ATTR_INFINITY_EXPIRATION,
+    API_CIRCUIT_STATES,
 )
 from .coordinator import ZcsMowerDataUpdateCoordinator
-from .entity import ZcsMowerRobotEntity
+from .entity import (
+    ZcsMowerRobotEntity,
+    ZcsMowerConfigEntity,
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class ZcsMowerConfigSensorEntityDescription(SensorEntityDescription):
+    """Describes ZCS Lawn Mower Configuration sensor entity."""
+
+    config_key: str
+
 
 ROBOT_ENTITY_DESCRIPTIONS = (
     SensorEntityDescription(
@@ -48,6 +67,18 @@ ROBOT_ENTITY_DESCRIPTIONS = (
     ),
 )
 
+CONFIG_ENTITY_DESCRIPTIONS = (
+    ZcsMowerConfigSensorEntityDescription(
+        key="api_circuit",
+        icon="mdi:electric-switch",
+        device_class=SensorDeviceClass.ENUM,
+        options=list(API_CIRCUIT_STATES),
+        translation_key="api_circuit",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        config_key="api_circuit",
+    ),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -70,6 +101,18 @@ async def async_setup_entry(
         ],
         update_before_add=True,
     )
+    async_add_entities(
+        [
+            ZcsMowerConfigSensorEntity(
+                hass=hass,
+                config_entry=config_entry,
+                coordinator=coordinator,
+                entity_description=entity_description,
+            )
+            for entity_description in CONFIG_ENTITY_DESCRIPTIONS
+        ],
+        update_before_add=True,
+    )
 
 
 class ZcsMowerRobotSensorEntity(ZcsMowerRobotEntity, SensorEntity):
@@ -92,6 +135,69 @@ class ZcsMowerRobotSensorEntity(ZcsMowerRobotEntity, SensorEntity):
             entity_description=entity_description,
             imei=imei,
         )
+        if self._entity_key is None:
+            self._subscribed_fields = frozenset({ATTR_STATE, ATTR_ICON})
+        elif self._entity_key == ATTR_CONNECT_EXPIRATION:
+            self._subscribed_fields = frozenset(
+                {
+                    ATTR_CONNECT_EXPIRATION,
+                    ATTR_INFINITY_STATE,
+                    ATTR_INFINITY_EXPIRATION,
+                }
+            )
+        # +Infinity state changes at the expiration, without an update of the data
+        self._expiration_update_at: datetime | None = None
+        self._unsub_expiration_update: CALLBACK_TYPE | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Schedule the update at the +Infinity expiration."""
+        await super().async_added_to_hass()
+        if self._entity_key == ATTR_CONNECT_EXPIRATION:
+            self.async_on_remove(self._async_cancel_expiration_update)
+            self._async_schedule_expiration_update()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        super()._handle_coordinator_update()
+        if self._entity_key == ATTR_CONNECT_EXPIRATION:
+            self._async_schedule_expiration_update()
+
+    @callback
+    def _async_schedule_expiration_update(self) -> None:
+        """Schedule the update at the +Infinity expiration, if it has changed."""
+        expiration = self._get_attribute(ATTR_INFINITY_EXPIRATION)
+        if expiration is not None and expiration <= dt_util.now():
+            expiration = None
+        if expiration == self._expiration_update_at:
+            return None
+        self._async_cancel_expiration_update()
+        if expiration is not None:
+            self._expiration_update_at = expiration
+            self._unsub_expiration_update = async_track_point_in_utc_time(
+                self.hass,
+                self._async_handle_expiration,
+                dt_util.as_utc(expiration),
+            )
+
+    @callback
+    def _async_cancel_expiration_update(self) -> None:
+        """Cancel the scheduled update at the +Infinity expiration."""
+        if self._unsub_expiration_update is not None:
+            self._unsub_expiration_update()
+        self._unsub_expiration_update = None
+        self._expiration_update_at = None
+
+    @callback
+    def _async_handle_expiration(
+        self,
+        now: datetime,
+    ) -> None:
+        """Write the state, when +Infinity has expired."""
+        self._unsub_expiration_update = None
+        self._expiration_update_at = None
+        self._update_handler()
+        self.async_write_ha_state()
 
     def _update_extra_state_attributes(self) -> None:
         """Update extra attributes."""
@@ -125,3 +231,62 @@ class ZcsMowerRobotSensorEntity(ZcsMowerRobotEntity, SensorEntity):
             return self._get_attribute(ATTR_STATE)
         elif self._entity_key == ATTR_CONNECT_EXPIRATION:
             return self._get_attribute(ATTR_CONNECT_EXPIRATION)
+
+
+class ZcsMowerConfigSensorEntity(ZcsMowerConfigEntity, SensorEntity):
+    """Representation of a ZCS Lawn Mower Configuration sensor."""
+
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        coordinator: ZcsMowerDataUpdateCoordinator,
+        entity_description: SensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor class."""
+        super().__init__(
+            hass=hass,
+            config_entry=config_entry,
+            coordinator=coordinator,
+            entity_type="sensor",
+            entity_description=entity_description,
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to changes of the circuit breaker, which happen between updates."""
+        await super().async_added_to_hass()
+        if self._config_key == "api_circuit":
+            self.async_on_remove(
+                self.coordinator.client.circuit_breaker.add_listener(
+                    self.async_write_ha_state
+                )
+            )
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the native value of the sensor."""
+        if self._config_key == "api_circuit":
+            return self.coordinator.client.circuit_breaker.state
+
+    @property
+    def available(self) -> bool:
+        """Return True if entity is available."""
+        # State of the API is known, even if the last update failed
+        return True
+
+    @property
+    def extra_state_attributes(self) -> dict[str, any]:
+        """Return extra attributes."""
+        if self._config_key == "api_circuit":
+            circuit_breaker = self.coordinator.client.circuit_breaker
+            retry_in = circuit_breaker.retry_in
+            return {
+                "failures": circuit_breaker.failures,
+                "opened_total": circuit_breaker.opened_total,
+                "rejected": circuit_breaker.rejected,
+                "next_probe": (
+                    dt_util.now() + timedelta(seconds=retry_in) if retry_in is not None else None
+                ),
+            }
@@ -213,16 +213,26 @@ def async_unload_services(hass: HomeAssistant) -> None:
     hass.services.async_remove(DOMAIN, SERVICE_CUSTOM_COMMAND)
 
 
+def _group_targets(
+    targets: dict[str, any],
+) -> dict[any, list[str]]:
+    """Group target IMEIs by coordinator, so each coordinator sends one batch request."""
+    groups = {}
+    for imei, coordinator in targets.items():
+        groups.setdefault(coordinator, []).append(imei)
+    return groups
+
+
 async def _async_update_now(
     hass: HomeAssistant,
     targets: dict[str, any],
     data: dict[str, any],
 ) -> None:
     """Handle the service call."""
-    for imei, coordinator in targets.items():
+    for coordinator, imeis in _group_targets(targets).items():
         hass.async_create_task(
             coordinator.async_update_now(
-                imei,
+                imeis,
             )
         )
 
@@ -232,10 +242,10 @@ async def _async_wake_up(
     data: dict[str, any],
 ) -> None:
     """Handle the service call."""
-    for imei, coordinator in targets.items():
+    for coordinator, imeis in _group_targets(targets).items():
         hass.async_create_task(
             coordinator.async_wake_up(
-                imei,
+                imeis,
             )
         )
 
@@ -245,10 +255,10 @@ async def _async_set_profile(
     data: dict[str, any],
 ) -> None:
     """Handle the service call."""
-    for imei, coordinator in targets.items():
+    for coordinator, imeis in _group_targets(targets).items():
         hass.async_create_task(
             coordinator.async_set_profile(
-                imei,
+                imeis,
                 data.get("profile"),
             )
         )
@@ -259,10 +269,10 @@ async def _async_work_now(
     data: dict[str, any],
 ) -> None:
     """Handle the service call."""
-    for imei, coordinator in targets.items():
+    for coordinator, imeis in _group_targets(targets).items():
         hass.async_create_task(
             coordinator.async_work_now(
-                imei,
+                imeis,
             )
         )
 
@@ -272,10 +282,10 @@ async def _async_work_for(
     data: dict[str, any],
 ) -> None:
     """Handle the service call."""
-    for imei, coordinator in targets.items():
+    for coordinator, imeis in _group_targets(targets).items():
         hass.async_create_task(
             coordinator.async_work_for(
-                imei,
+                imeis,
                 data.get("duration"),
                 data.get("area"),
             )
@@ -287,10 +297,10 @@ async def _async_work_until(
     data: dict[str, any],
 ) -> None:
     """Handle the service call."""
-    for imei, coordinator in targets.items():
+    for coordinator, imeis in _group_targets(targets).items():
         hass.async_create_task(
             coordinator.async_work_until(
-                imei,
+                imeis,
                 data.get("hours"),
                 data.get("minutes"),
                 data.get("area"),
@@ -303,10 +313,10 @@ async def _async_border_cut(
     data: dict[str, any],
 ) -> None:
     """Handle the service call."""
-    for imei, coordinator in targets.items():
+    for coordinator, imeis in _group_targets(targets).items():
         hass.async_create_task(
             coordinator.async_border_cut(
-                imei,
+                imeis,
             )
         )
 
@@ -316,10 +326,10 @@ async def _async_charge_now(
     data: dict[str, any],
 ) -> None:
     """Handle the service call."""
-    for imei, coordinator in targets.items():
+    for coordinator, imeis in _group_targets(targets).items():
         hass.async_create_task(
             coordinator.async_charge_now(
-                imei,
+                imeis,
             )
         )
 
@@ -329,10 +339,10 @@ async def _async_charge_for(
     data: dict[str, any],
 ) -> None:
     """Handle the service call."""
-    for imei, coordinator in targets.items():
+    for coordinator, imeis in _group_targets(targets).items():
         hass.async_create_task(
             coordinator.async_charge_for(
-                imei,
+                imeis,
                 data.get("duration"),
             )
         )
@@ -343,10 +353,10 @@ async def _async_charge_until(
     data: dict[str, any],
 ) -> None:
     """Handle the service call."""
-    for imei, coordinator in targets.items():
+    for coordinator, imeis in _group_targets(targets).items():
         hass.async_create_task(
             coordinator.async_charge_until(
-                imei,
+                imeis,
                 data.get("hours"),
                 data.get("minutes"),
                 data.get("weekday"),
@@ -359,10 +369,10 @@ async def _async_trace_position(
     data: dict[str, any],
 ) -> None:
     """Handle the service call."""
-    for imei, coordinator in targets.items():
+    for coordinator, imeis in _group_targets(targets).items():
         hass.async_create_task(
             coordinator.async_trace_position(
-                imei,
+                imeis,
             )
         )
 
@@ -372,10 +382,10 @@ async def _async_change_operator(
     data: dict[str, any],
 ) -> None:
     """Handle the service call."""
-    for imei, coordinator in targets.items():
+    for coordinator, imeis in _group_targets(targets).items():
         hass.async_create_task(
             coordinator.async_change_operator(
-                imei,
+                imeis,
             )
         )
 
@@ -385,10 +395,10 @@ async def _async_keep_out(
     data: dict[str, any],
 ) -> None:
     """Handle the service call."""
-    for imei, coordinator in targets.items():
+    for coordinator, imeis in _group_targets(targets).items():
         hass.async_create_task(
             coordinator.async_keep_out(
-                imei,
+                imeis,
                 data.get(CONF_LOCATION, {}).get(CONF_LATITUDE),
                 data.get(CONF_LOCATION, {}).get(CONF_LONGITUDE),
                 data.get(CONF_LOCATION, {}).get(CONF_RADIUS),
@@ -404,10 +414,10 @@ async def _async_custom_command(
     data: dict[str, any],
 ) -> None:
     """Handle the service call."""
-    for imei, coordinator in targets.items():
+    for coordinator, imeis in _group_targets(targets).items():
         hass.async_create_task(
             coordinator.async_custom_command(
-                imei,
+                imeis,
                 data.get("command"),
                 data.get("params", None),
             )
@@ -18,9 +18,11 @@ from homeassistant.helpers.entity import Entity
 from .const import (
     LOGGER,
     DOMAIN,
+    ATTR_ERROR,
 )
 from .coordinator import ZcsMowerDataUpdateCoordinator
 from .entity import ZcsMowerRobotEntity
+from .models import get_robot_state_by_name
 
 ROBOT_SUPPORTED_FEATURES = (
     VacuumEntityFeature.STOP
@@ -69,6 +71,7 @@ class ZcsMowerRobotVacuumEntity(ZcsMowerRobotEntity, StateVacuumEntity):
 
     _attr_name = None
     _attr_entity_registry_enabled_default = False
+    _subscribed_fields = frozenset({ATTR_STATE, ATTR_ERROR})
 
     def __init__(
         self,
@@ -98,17 +101,7 @@ class ZcsMowerRobotVacuumEntity(ZcsMowerRobotEntity, StateVacuumEntity):
     @property
     def activity(self) -> VacuumActivity | None:
         """Return the state of the lawn mower."""
-        if self._get_attribute(ATTR_STATE) in ("work", "gotoarea", "bordercut", "mapping_started"):
-            return VacuumActivity.CLEANING
-        if self._get_attribute(ATTR_STATE) == "charge":
-            return VacuumActivity.DOCKED
-        if self._get_attribute(ATTR_STATE) == "pause":
-            return VacuumActivity.PAUSED
-        if self._get_attribute(ATTR_STATE) in ("gotostation", "mapping_ended"):
-            return VacuumActivity.RETURNING
-        if self._get_attribute(ATTR_STATE) == "work_standby":
-            return VacuumActivity.IDLE
-        return VacuumActivity.ERROR
+        return get_robot_state_by_name(self._get_attribute(ATTR_STATE)).vacuum_activity
 
     @property
     def error(self) -> str | None:
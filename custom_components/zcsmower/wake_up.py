@@ -0,0 +1,261 @@
+"""ZCS Lawn Mower Robot wake-up orchestration."""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import random
+
+from collections.abc import (
+    Awaitable,
+    Callable,
+)
+from dataclasses import dataclass
+from time import monotonic
+
+from homeassistant.core import (
+    callback,
+    HomeAssistant,
+)
+from homeassistant.config_entries import ConfigEntry
+
+from .const import (
+    LOGGER,
+    WAKE_UP_POLL_DELAY_INITIAL,
+    WAKE_UP_POLL_DELAY_MAX,
+    WAKE_UP_POLL_BACKOFF_FACTOR,
+    WAKE_UP_POLL_JITTER,
+)
+
+
+@dataclass(slots=True)
+class ZcsMowerWakeUpWaiter:
+    """Pending wake-up of a lawn mower, shared by all commands waiting for it."""
+
+    future: asyncio.Future
+    started: float
+    deadline: float
+    delay: float = WAKE_UP_POLL_DELAY_INITIAL
+    next_poll: float = 0.0
+
+    def schedule_next_poll(
+        self,
+        now: float,
+    ) -> None:
+        """Schedule next poll with jitter and increase the delay for the following one."""
+        jitter = random.uniform(-WAKE_UP_POLL_JITTER, WAKE_UP_POLL_JITTER) * self.delay
+        # Last poll is at the deadline
+        self.next_poll = min(now + self.delay + jitter, self.deadline)
+        self.delay = min(self.delay * WAKE_UP_POLL_BACKOFF_FACTOR, WAKE_UP_POLL_DELAY_MAX)
+
+
+@dataclass(slots=True)
+class ZcsMowerWakeUpMetrics:
+    """Wake-up metrics of a lawn mower."""
+
+    waits: int = 0
+    joined: int = 0
+    connects: int = 0
+    timeouts: int = 0
+    polls: int = 0
+    time_to_connect_last: float | None = None
+    time_to_connect_max: float | None = None
+    time_to_connect_total: float = 0.0
+
+    def add_time_to_connect(
+        self,
+        duration: float,
+    ) -> None:
+        """Add time from the start of the wait until the lawn mower was connected."""
+        self.connects += 1
+        self.time_to_connect_last = duration
+        self.time_to_connect_max = max(self.time_to_connect_max or 0.0, duration)
+        self.time_to_connect_total += duration
+
+    def as_dict(self) -> dict[str, any]:
+        """Return metrics as dict."""
+        return {
+            "waits": self.waits,
+            "joined": self.joined,
+            "connects": self.connects,
+            "timeouts": self.timeouts,
+            "polls": self.polls,
+            "time_to_connect_last": (
+                round(self.time_to_connect_last, 1) if self.time_to_connect_last is not None else None
+            ),
+            "time_to_connect_average": (
+                round(self.time_to_connect_total / self.connects, 1) if self.connects else None
+            ),
+            "time_to_connect_max": (
+                round(self.time_to_connect_max, 1) if self.time_to_connect_max is not None else None
+            ),
+        }
+
+
+class ZcsMowerWakeUpOrchestrator:
+    """Wait for woken up lawn mowers to connect.
+
+    There is at most one waiter per lawn mower, all commands for it await
+    the same waiter. One poll task fetches the connection state of all
+    waiters with one request, when the first one is due, and backs off
+    exponentially with jitter. A waiter is also resolved by every other
+    fetch, which reports the lawn mower as connected, like the regular
+    poll of the coordinator.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        fetch: Callable[[list[str]], Awaitable[None]],
+    ) -> None:
+        """Initialize the wake-up orchestrator.
+
+        Args:
+            hass (HomeAssistant): Home Assistant instance.
+            config_entry (ConfigEntry): Config entry, which owns the poll task.
+            fetch (Callable): Fetches the state of the given lawn mowers in one request.
+
+        """
+        self._hass = hass
+        self._config_entry = config_entry
+        self._fetch = fetch
+        self._waiters: dict[str, ZcsMowerWakeUpWaiter] = {}
+        self._task: asyncio.Task | None = None
+        self._wake_up: asyncio.Event = asyncio.Event()
+
+        self.metrics: dict[str, ZcsMowerWakeUpMetrics] = {}
+
+    def is_waiting(
+        self,
+        imei: str,
+    ) -> bool:
+        """Return True, if a wake-up of the lawn mower is pending."""
+        return imei in self._waiters
+
+    def _get_metrics(
+        self,
+        imei: str,
+    ) -> ZcsMowerWakeUpMetrics:
+        """Get metrics of the lawn mower, create them on first use."""
+        if (metrics := self.metrics.get(imei)) is None:
+            metrics = self.metrics[imei] = ZcsMowerWakeUpMetrics()
+        return metrics
+
+    async def async_wait_for_connection(
+        self,
+        imei: str,
+        timeout: float,
+    ) -> None:
+        """Wait until the lawn mower is connected, raise TimeoutError after the timeout.
+
+        If a wake-up of the lawn mower is pending already, its waiter is joined.
+        """
+        if (waiter := self._waiters.get(imei)) is not None:
+            self._get_metrics(imei).joined += 1
+        else:
+            now = monotonic()
+            future = self._hass.loop.create_future()
+            # Retrieve the exception, if all waiting commands were cancelled
+            future.add_done_callback(
+                lambda done: done.cancelled() or done.exception()
+            )
+            waiter = self._waiters[imei] = ZcsMowerWakeUpWaiter(
+                future=future,
+                started=now,
+                deadline=now + timeout,
+            )
+            waiter.schedule_next_poll(now)
+            self._get_metrics(imei).waits += 1
+            self._async_start_poll_task()
+        # Cancelling one command must not cancel the wait of the others
+        await asyncio.shield(waiter.future)
+
+    @callback
+    def async_set_connection_state(
+        self,
+        imei: str,
+        connected: bool,
+    ) -> None:
+        """Resolve the waiter of the lawn mower, if it is connected now."""
+        if not connected or (waiter := self._waiters.pop(imei, None)) is None:
+            return None
+        duration = monotonic() - waiter.started
+        self._get_metrics(imei).add_time_to_connect(duration)
+        LOGGER.debug("Lawn mower %s connected after %.1f seconds", imei, duration)
+        if not waiter.future.done():
+            waiter.future.set_result(None)
+        self._wake_up.set()
+
+    @callback
+    def _async_set_timeout(
+        self,
+        imei: str,
+    ) -> None:
+        """Fail the waiter of the lawn mower with a timeout."""
+        if (waiter := self._waiters.pop(imei, None)) is None:
+            return None
+        self._get_metrics(imei).timeouts += 1
+        if not waiter.future.done():
+            waiter.future.set_exception(
+                TimeoutError(
+                    f"The lawn mower with IMEI {imei} was not available after a long wait"
+                )
+            )
+
+    @callback
+    def _async_start_poll_task(self) -> None:
+        """Start the poll task or wake it up to consider a new waiter."""
+        if self._task is None:
+            self._task = self._config_entry.async_create_background_task(
+                self._hass,
+                self._async_poll_loop(),
+                "zcsmower_wake_up_poll",
+            )
+        else:
+            self._wake_up.set()
+
+    async def _async_poll_loop(self) -> None:
+        """Poll all due waiters together, until no waiter is left."""
+        try:
+            while self._waiters:
+                now = monotonic()
+                next_poll = min(waiter.next_poll for waiter in self._waiters.values())
+                if next_poll > now:
+                    # Sleep until the next poll or a change of the waiters
+                    self._wake_up.clear()
+                    with contextlib.suppress(TimeoutError):
+                        await asyncio.wait_for(self._wake_up.wait(), next_poll - now)
+                    continue
+
+                # All waiters are polled with the request of the first due one,
+                # so they do not drift apart by the jitter
+                imeis = list(self._waiters)
+                for imei in imeis:
+                    self._waiters[imei].schedule_next_poll(now)
+                    self._get_metrics(imei).polls += 1
+                try:
+                    await self._fetch(imeis)
+                except Exception as exception:  # pylint: disable=broad-except
+                    LOGGER.debug("Polling of woken up lawn mowers failed: %s", exception)
+
+                # Connected lawn mowers are resolved by the fetch
+                now = monotonic()
+                for imei in [
+                    imei
+                    for imei, waiter in self._waiters.items()
+                    if waiter.deadline <= now
+                ]:
+                    self._async_set_timeout(imei)
+        finally:
+            self._task = None
+            # Commands must not wait forever, if the task was cancelled on unload
+            for waiter in self._waiters.values():
+                waiter.future.cancel()
+            self._waiters = {}
+
+    def as_dict(self) -> dict[str, any]:
+        """Return wake-up metrics per lawn mower."""
+        return {
+            imei: metrics.as_dict()
+            for imei, metrics in self.metrics.items()
+        }
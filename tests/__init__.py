@@ -0,0 +1 @@
+"""Tests for the ZCS Lawn Mower Robot integration."""
@@ -0,0 +1,67 @@
+"""Tests for the API client of ZCS Lawn Mower Robot."""
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from custom_components.zcsmower.api import (
+    ZcsMowerApiClient,
+    ZcsMowerApiAuthenticationError,
+)
+
+INVALID_SESSION = {
+    "success": False,
+    "errorMessages": ["Authentication session is invalid: expired"],
+}
+
+
+class _Response:
+    """Response of the fake client session."""
+
+    status = 200
+
+    async def __aenter__(self) -> _Response:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        pass
+
+    def raise_for_status(self) -> None:
+        pass
+
+    async def json(self) -> dict:
+        return INVALID_SESSION
+
+
+class _Session:
+    """Fake client session, which answers every request with an invalid session."""
+
+    def __init__(self) -> None:
+        self.commands = []
+
+    def request(self, method: str, url: str, headers: dict | None, json: dict) -> _Response:
+        self.commands.append((json.get("data") or json.get("auth") or {}).get("command"))
+        return _Response()
+
+
+def test_invalid_session_on_authentication() -> None:
+    """Test an invalid session in the response of the authentication does not refresh it again."""
+    session = _Session()
+
+    async def execute() -> None:
+        client = ZcsMowerApiClient(
+            session=session,
+            options={
+                "app_id": "app",
+                "app_token": "token",
+                "thing_key": "thing",
+            },
+        )
+        client.restore_session("expired", time.time() + 3600)
+        await asyncio.wait_for(client.execute("thing.list", {}), timeout=5)
+
+    with pytest.raises(ZcsMowerApiAuthenticationError):
+        asyncio.run(execute())
+    assert session.commands == ["thing.list", "api.authenticate"]
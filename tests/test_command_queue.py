@@ -0,0 +1,135 @@
+"""Tests for the command queue of ZCS Lawn Mower Robot."""
+from __future__ import annotations
+
+import asyncio
+
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.zcsmower.command_queue import (
+    ZcsMowerCommandQueue,
+    ZcsMowerCommandSupersededError,
+)
+
+IMEI = "351234567890123"
+
+
+async def _send_while_waking_up(
+    commands: list[tuple[str, dict[str, any] | None]],
+) -> tuple[list[bool | BaseException], list[tuple[str, dict[str, any] | None]]]:
+    """Send commands, which are pending until the lawn mower is awake."""
+    loop = asyncio.get_running_loop()
+    awake = asyncio.Event()
+    executed = []
+
+    async def prepare(imei: str) -> bool:
+        await awake.wait()
+        return True
+
+    async def execute(imei: str, method: str, params: dict[str, any] | None) -> bool:
+        executed.append((method, params))
+        return True
+
+    queue = ZcsMowerCommandQueue(
+        hass=SimpleNamespace(loop=loop),
+        config_entry=SimpleNamespace(
+            async_create_background_task=lambda hass, target, name: loop.create_task(target),
+        ),
+        prepare=prepare,
+        execute=execute,
+    )
+    tasks = []
+    for method, params in commands:
+        tasks.append(loop.create_task(queue.async_send(IMEI, method, params)))
+        # Enqueue in order
+        await asyncio.sleep(0)
+    awake.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    return results, executed
+
+
+def test_keep_out_zones() -> None:
+    """Test keep_out of different zones are executed in order."""
+    commands = [
+        ("keep_out", {"latitude": 45.1, "longitude": 9.1, "radius": 5, "index": 0}),
+        ("keep_out", {"latitude": 45.2, "longitude": 9.2, "radius": 5, "index": 1}),
+    ]
+    results, executed = asyncio.run(_send_while_waking_up(commands))
+
+    assert results == [True, True]
+    assert executed == commands
+
+
+def test_keep_out_same_zone() -> None:
+    """Test keep_out of the same zone replaces the pending one."""
+    commands = [
+        ("keep_out", {"latitude": 45.1, "longitude": 9.1, "radius": 5, "index": 0}),
+        ("keep_out", {"latitude": 45.2, "longitude": 9.2, "radius": 5, "index": 0}),
+    ]
+    results, executed = asyncio.run(_send_while_waking_up(commands))
+
+    assert isinstance(results[0], ZcsMowerCommandSupersededError)
+    assert results[1] is True
+    assert executed == commands[1:]
+
+
+def test_keep_out_without_zone() -> None:
+    """Test keep_out without zone index are executed in order."""
+    commands = [
+        ("keep_out", {"latitude": 45.1, "longitude": 9.1, "radius": 5}),
+        ("keep_out", {"latitude": 45.2, "longitude": 9.2, "radius": 5}),
+    ]
+    results, executed = asyncio.run(_send_while_waking_up(commands))
+
+    assert results == [True, True]
+    assert executed == commands
+
+
+def test_custom_commands() -> None:
+    """Test custom commands are executed in order."""
+    commands = [
+        ("custom_method", {"value": 1}),
+        ("custom_method", {"value": 2}),
+    ]
+    results, executed = asyncio.run(_send_while_waking_up(commands))
+
+    assert results == [True, True]
+    assert executed == commands
+
+
+@pytest.mark.parametrize(
+    ("method", "params_1", "params_2"),
+    [
+        ("work_until", {"hh": 10, "mm": 0, "area": 255}, {"hh": 11, "mm": 30, "area": 255}),
+        ("charge_until", {"hh": 10, "mm": 0, "weekday": 0}, {"hh": 12, "mm": 0, "weekday": 0}),
+        ("set_profile", {"profile": 0}, {"profile": 2}),
+    ],
+)
+def test_superseded(
+    method: str,
+    params_1: dict[str, any],
+    params_2: dict[str, any],
+) -> None:
+    """Test a command, which overrides the pending one, replaces it."""
+    commands = [
+        (method, params_1),
+        (method, params_2),
+    ]
+    results, executed = asyncio.run(_send_while_waking_up(commands))
+
+    assert isinstance(results[0], ZcsMowerCommandSupersededError)
+    assert results[1] is True
+    assert executed == commands[1:]
+
+
+def test_identical() -> None:
+    """Test identical commands are executed once for all callers."""
+    commands = [
+        ("work_now", None),
+        ("work_now", None),
+    ]
+    results, executed = asyncio.run(_send_while_waking_up(commands))
+
+    assert results == [True, True]
+    assert executed == commands[:1]
@@ -0,0 +1,91 @@
+"""Tests for the fields of thing.list, which are polled from the API."""
+from __future__ import annotations
+
+import json
+import logging
+import time
+
+from pathlib import Path
+
+import pytest
+
+from custom_components.zcsmower.const import (
+    API_FIELDS_HOT,
+    API_FIELDS_STATIC,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+FIXTURE = Path(__file__).parent / "fixtures" / "thing_list.json"
+
+
+@pytest.fixture
+def thing_list() -> dict:
+    """Load a recorded thing.list response with all fields."""
+    return json.loads(FIXTURE.read_text(encoding="utf-8"))
+
+
+def _show(
+    response: dict,
+    fields: tuple[str, ...],
+) -> str:
+    """Return compact response with the given fields only, like the API does with show."""
+    return json.dumps(
+        {
+            "data": {
+                "success": response["data"]["success"],
+                "params": {
+                    "count": response["data"]["params"]["count"],
+                    "result": [
+                        {
+                            key: value
+                            for key, value in mower.items()
+                            if key in fields
+                        }
+                        for mower in response["data"]["params"]["result"]
+                    ],
+                },
+            },
+        },
+        separators=(",", ":"),
+    )
+
+
+def _decode_time(
+    payload: str,
+    rounds: int = 200,
+) -> float:
+    """Return average time in seconds to decode the payload."""
+    start = time.perf_counter()
+    for _i in range(rounds):
+        json.loads(payload)
+    return (time.perf_counter() - start) / rounds
+
+
+def test_fields_of_recorded_response(
+    thing_list: dict,
+) -> None:
+    """Test that the polled fields are in the recorded response."""
+    for mower in thing_list["data"]["params"]["result"]:
+        assert set(API_FIELDS_HOT + API_FIELDS_STATIC) <= set(mower)
+    assert not set(API_FIELDS_HOT) & set(API_FIELDS_STATIC)
+
+
+def test_payload_benchmark(
+    thing_list: dict,
+) -> None:
+    """Benchmark size and decoding of the full, the hot and the static projection."""
+    full = _show(thing_list, tuple(thing_list["data"]["params"]["result"][0]))
+    hot = _show(thing_list, API_FIELDS_HOT)
+    static = _show(thing_list, API_FIELDS_HOT + API_FIELDS_STATIC)
+
+    for name, payload in (("full", full), ("hot", hot), ("hot+static", static)):
+        _LOGGER.info(
+            "Payload %s: %s bytes, decoded in %.3f ms",
+            name,
+            len(payload),
+            _decode_time(payload) * 1000,
+        )
+    assert len(hot) < len(static) < len(full)
+    # Regular poll transfers less than a third of the full response
+    assert len(hot) * 3 < len(full)
@@ -0,0 +1,118 @@
+"""Tests for the helpers of ZCS Lawn Mower Robot."""
+from __future__ import annotations
+
+import json
+import logging
+import time
+
+from datetime import (
+    UTC,
+    datetime,
+    timedelta,
+)
+from pathlib import Path
+
+import pytest
+
+from custom_components.zcsmower.const import (
+    API_DATETIME_FORMAT_DEFAULT,
+    API_DATETIME_FORMAT_FALLBACK,
+)
+from custom_components.zcsmower.helpers import parse_api_datetime
+
+_LOGGER = logging.getLogger(__name__)
+
+FIXTURE = Path(__file__).parent / "fixtures" / "thing_list.json"
+
+
+def _strptime_api_datetime(
+    date_string: str,
+) -> datetime:
+    """Parse datetime string from API data, like it was done before."""
+    try:
+        return datetime.strptime(date_string, API_DATETIME_FORMAT_DEFAULT)
+    except ValueError:
+        return datetime.strptime(date_string, API_DATETIME_FORMAT_FALLBACK)
+
+
+def _week_of_payloads() -> list[str]:
+    """Get datetime strings of a week of polls every 5 minutes for the recorded lawn mowers."""
+    mowers = json.loads(FIXTURE.read_text(encoding="utf-8"))["data"]["params"]["result"]
+    start = datetime(2026, 10, 12, tzinfo=UTC)
+    date_strings = []
+    for poll in range(7 * 24 * 12):
+        now = start + timedelta(minutes=5 * poll)
+        for index, mower in enumerate(mowers):
+            # Lawn mowers report every 15 minutes, so timestamps repeat in between
+            seen = now - timedelta(minutes=(5 * poll + 5 * index) % 15, seconds=index)
+            date_strings.append(seen.strftime("%Y-%m-%dT%H:%M:%S.") + f"{index * 37:03d}Z")
+            date_strings.append(seen.strftime("%Y-%m-%dT%H:%M:%SZ"))
+            date_strings.extend(
+                mower["attrs"][key]["value"]
+                for key in ("expiration_date", "infinity_expiration_date")
+            )
+    return date_strings
+
+
+@pytest.mark.parametrize(
+    "date_string",
+    [
+        "2026-10-18T09:41:12.037Z",
+        "2026-10-18T09:41:12.5Z",
+        "2026-10-18T09:41:12.123456Z",
+        "2026-10-18T09:41:12Z",
+        "2026-10-18T09:41:12.037+02:00",
+        "2026-10-18T09:41:12-0530",
+        "2024-02-29T23:59:59.999Z",
+    ],
+)
+def test_parse_api_datetime(
+    date_string: str,
+) -> None:
+    """Test that both formats of the API are parsed like with strptime."""
+    parsed = parse_api_datetime(date_string)
+
+    assert parsed == _strptime_api_datetime(date_string)
+    assert parsed.utcoffset() == _strptime_api_datetime(date_string).utcoffset()
+
+
+@pytest.mark.parametrize(
+    "date_string",
+    [
+        "2026-10-18T09:41:12.037",
+        "2026-10-18",
+        "",
+    ],
+)
+def test_parse_api_datetime_invalid(
+    date_string: str,
+) -> None:
+    """Test that datetime strings without time zone are rejected like with strptime."""
+    with pytest.raises(ValueError):
+        _strptime_api_datetime(date_string)
+    with pytest.raises(ValueError):
+        parse_api_datetime(date_string)
+
+
+def test_parse_api_datetime_benchmark() -> None:
+    """Benchmark parsing of a week of polls against strptime."""
+    date_strings = _week_of_payloads()
+    parse_api_datetime.cache_clear()
+
+    start = time.perf_counter()
+    parsed = [parse_api_datetime(date_string) for date_string in date_strings]
+    elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = [_strptime_api_datetime(date_string) for date_string in date_strings]
+    elapsed_strptime = time.perf_counter() - start
+
+    _LOGGER.info(
+        "Parsing of %s datetime strings: %.1f ms, strptime: %.1f ms, cache: %s",
+        len(date_strings),
+        elapsed * 1000,
+        elapsed_strptime * 1000,
+        parse_api_datetime.cache_info(),
+    )
+    assert parsed == expected
+    assert elapsed < elapsed_strptime
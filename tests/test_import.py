@@ -0,0 +1,67 @@
+"""Tests for the import of the platforms of ZCS Lawn Mower Robot."""
+from __future__ import annotations
+
+import json
+import logging
+import subprocess
+import sys
+
+from pathlib import Path
+
+_LOGGER = logging.getLogger(__name__)
+
+# Modules of the map, which are imported when a map entity is added
+MAP_MODULES = (
+    "custom_components.zcsmower.renderer",
+    "custom_components.zcsmower.projection",
+    "numpy",
+    "PIL.Image",
+    "PIL.ImageDraw",
+    "geopy.distance",
+)
+
+IMPORT_SCRIPT = """
+import json, sys, time
+# Dependencies of the image platform, which are loaded anyway
+import custom_components.zcsmower.coordinator
+import custom_components.zcsmower.entity
+import homeassistant.components.image
+loaded = set(sys.modules)
+start = time.perf_counter()
+import custom_components.zcsmower.image
+platform = time.perf_counter() - start
+imported = sorted(set(sys.modules) - loaded)
+start = time.perf_counter()
+import custom_components.zcsmower.renderer
+renderer = time.perf_counter() - start
+print(json.dumps({
+    "imported": imported,
+    "platform": platform,
+    "renderer": renderer,
+}))
+"""
+
+
+def _run_import_script() -> dict:
+    """Import the image platform and the renderer in a new interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT],
+        cwd=Path(__file__).parent.parent,
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def test_image_platform_import() -> None:
+    """Test that the image platform does not import the map renderer and its libraries."""
+    result = _run_import_script()
+
+    _LOGGER.info(
+        "Import of image platform: %.1f ms, renderer: %.1f ms",
+        result["platform"] * 1000,
+        result["renderer"] * 1000,
+    )
+    assert "custom_components.zcsmower.image" in result["imported"]
+    assert not set(MAP_MODULES) & set(result["imported"])
@@ -0,0 +1,192 @@
+"""Tests for the map projection of ZCS Lawn Mower Robot."""
+from __future__ import annotations
+
+import logging
+import math
+import time
+
+import numpy as np
+import pytest
+
+from geopy.distance import (
+    distance,
+    geodesic,
+)
+from PIL import Image
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.zcsmower.const import (
+    DOMAIN,
+    CONF_MAP_ENABLE,
+    CONF_MAP_IMAGE_PATH,
+    CONF_MAP_GPS_TOP_LEFT,
+    CONF_MAP_GPS_BOTTOM_RIGHT,
+    CONF_MAP_ROTATION,
+    CONF_MAP_POINTS,
+    ATTR_LOCATION_HISTORY,
+)
+from custom_components.zcsmower.models import ZcsMowerLocationHistory
+from custom_components.zcsmower.projection import ZcsMowerMapProjection
+from custom_components.zcsmower.renderer import ZcsMowerMapRenderer
+
+_LOGGER = logging.getLogger(__name__)
+
+IMEI = "351234567890123"
+
+
+def _create_projection(
+    top_left: tuple[float, float],
+    bottom_right: tuple[float, float],
+    size: tuple[int, int],
+    rotation: float,
+) -> ZcsMowerMapProjection:
+    """Create projection like the renderer does."""
+    return ZcsMowerMapProjection(
+        center_gps=(
+            (top_left[0] + bottom_right[0]) / 2,
+            (top_left[1] + bottom_right[1]) / 2,
+        ),
+        center_px=(size[0] / 2, size[1] / 2),
+        scale=int(math.dist((0, 0), size)) / geodesic(top_left, bottom_right).meters,
+        rotation=rotation,
+    )
+
+
+def _geodesic_to_pixels(
+    projection: ZcsMowerMapProjection,
+    locations: np.ndarray,
+) -> np.ndarray:
+    """Project locations one by one with the geodesic solution, which was used before."""
+    center = projection.center_gps
+    pixels = []
+    for latitude, longitude in locations.tolist():
+        bearing_res = distance(center, (latitude, longitude)).geod.Inverse(
+            center[0], center[1], latitude, longitude
+        )
+        plot_point_center_meter = bearing_res.get("s12") * 1000
+        bearing_center = math.radians(bearing_res.get("azi1") - 90 + projection.rotation)
+        pixels.append(
+            (
+                projection.center_px[0] + plot_point_center_meter * projection.scale * math.cos(bearing_center),
+                projection.center_px[1] + plot_point_center_meter * projection.scale * math.sin(bearing_center),
+            )
+        )
+    return np.array(pixels)
+
+
+def _random_locations(
+    top_left: tuple[float, float],
+    bottom_right: tuple[float, float],
+    count: int,
+) -> np.ndarray:
+    """Get random locations within the map."""
+    rng = np.random.default_rng(42)
+    return np.column_stack(
+        (
+            rng.uniform(bottom_right[0], top_left[0], count),
+            rng.uniform(top_left[1], bottom_right[1], count),
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    ("top_left", "bottom_right", "size", "rotation"),
+    [
+        ((45.5410, 11.5390), (45.5400, 11.5410), (600, 400), 0.0),
+        ((45.5410, 11.5390), (45.5400, 11.5410), (4096, 2731), 0.0),
+        ((59.9141, 10.7510), (59.9131, 10.7540), (600, 340), 27.5),
+        ((-33.8560, 151.2140), (-33.8575, 151.2160), (600, 520), -90.0),
+    ],
+)
+def test_projection_matches_geodesic(
+    top_left: tuple[float, float],
+    bottom_right: tuple[float, float],
+    size: tuple[int, int],
+    rotation: float,
+) -> None:
+    """Test that the tangent plane deviates less than a tenth pixel from the geodesic solution."""
+    projection = _create_projection(top_left, bottom_right, size, rotation)
+    locations = _random_locations(top_left, bottom_right, 200)
+
+    pixels = projection.to_pixels(locations)
+    expected = _geodesic_to_pixels(projection, locations)
+
+    assert pixels.shape == (200, 2)
+    assert np.abs(pixels - expected).max() < 0.1
+
+
+def test_projection_center() -> None:
+    """Test that the center of the map is projected onto the center of the image."""
+    top_left, bottom_right = (45.5410, 11.5390), (45.5400, 11.5410)
+    projection = _create_projection(top_left, bottom_right, (600, 400), 0.0)
+
+    assert projection.to_pixels(projection.center_gps).tolist() == [[300.0, 200.0]]
+
+
+@pytest.mark.parametrize("count", [200, 2000, 20000])
+def test_projection_benchmark(count: int) -> None:
+    """Benchmark the projection against the geodesic solution per location."""
+    top_left, bottom_right = (45.5410, 11.5390), (45.5400, 11.5410)
+    projection = _create_projection(top_left, bottom_right, (600, 400), 0.0)
+    locations = _random_locations(top_left, bottom_right, count)
+
+    start = time.perf_counter()
+    projection.to_pixels(locations)
+    elapsed = time.perf_counter() - start
+
+    # Geodesic solution is measured on a sample and extrapolated
+    sample = locations[:200]
+    start = time.perf_counter()
+    _geodesic_to_pixels(projection, sample)
+    elapsed_geodesic = (time.perf_counter() - start) * count / len(sample)
+
+    _LOGGER.info(
+        "Projection of %s locations: %.2f ms, geodesic: %.2f ms",
+        count,
+        elapsed * 1000,
+        elapsed_geodesic * 1000,
+    )
+    assert elapsed < elapsed_geodesic
+
+
+@pytest.mark.parametrize("count", [200, 2000, 20000])
+def test_render_benchmark(tmp_path, count: int) -> None:
+    """Benchmark a complete render of the map with the given number of locations."""
+    top_left, bottom_right = (45.5410, 11.5390), (45.5400, 11.5410)
+    map_image_path = tmp_path / "map.png"
+    Image.new("RGB", (1200, 800), (90, 140, 90)).save(map_image_path)
+
+    location_history = ZcsMowerLocationHistory(capacity=count)
+    for location in _random_locations(top_left, bottom_right, count).tolist():
+        location_history.append(tuple(location))
+    coordinator = type("Coordinator", (), {})()
+    coordinator.data = {
+        IMEI: {
+            ATTR_LOCATION_HISTORY: location_history,
+        },
+    }
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        options={
+            CONF_MAP_ENABLE: True,
+            CONF_MAP_IMAGE_PATH: str(map_image_path),
+            CONF_MAP_GPS_TOP_LEFT: top_left,
+            CONF_MAP_GPS_BOTTOM_RIGHT: bottom_right,
+            CONF_MAP_ROTATION: 0.0,
+            CONF_MAP_POINTS: count,
+        },
+    )
+    renderer = ZcsMowerMapRenderer(
+        config_entry=config_entry,
+        coordinator=coordinator,
+        imei=IMEI,
+    )
+    variant = renderer.get_variant(name="map", max_size=600, marker_size=32)
+
+    start = time.perf_counter()
+    image_bytes = renderer.render(variant)
+    elapsed = time.perf_counter() - start
+
+    _LOGGER.info("Render of %s locations: %.1f ms", count, elapsed * 1000)
+    assert image_bytes
+    assert variant.size == (600, 400)
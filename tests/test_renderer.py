@@ -0,0 +1,289 @@
+"""Tests for the map renderer of ZCS Lawn Mower Robot."""
+from __future__ import annotations
+
+import logging
+import math
+import time
+
+import numpy as np
+import pytest
+
+from homeassistant.const import (
+    ATTR_LOCATION,
+    ATTR_LATITUDE,
+    ATTR_LONGITUDE,
+)
+from PIL import Image
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.zcsmower.const import (
+    DOMAIN,
+    CONF_MAP_ENABLE,
+    CONF_MAP_IMAGE_PATH,
+    CONF_MAP_GPS_TOP_LEFT,
+    CONF_MAP_GPS_BOTTOM_RIGHT,
+    CONF_MAP_ROTATION,
+    CONF_MAP_POINTS,
+    CONF_MAP_DRAW_LINES,
+    ATTR_LOCATION_HISTORY,
+)
+from custom_components.zcsmower.models import ZcsMowerLocationHistory
+from custom_components.zcsmower.renderer import ZcsMowerMapRenderer
+
+_LOGGER = logging.getLogger(__name__)
+
+IMEI = "351234567890123"
+
+
+@pytest.fixture
+def renderer() -> ZcsMowerMapRenderer:
+    """Create renderer of a lawn mower without location."""
+    coordinator = type("Coordinator", (), {})()
+    coordinator.data = {IMEI: {}}
+    return ZcsMowerMapRenderer(
+        config_entry=MockConfigEntry(domain=DOMAIN, options={}),
+        coordinator=coordinator,
+        imei=IMEI,
+    )
+
+
+def _find_points_on_line(
+    point_1: tuple[float, float],
+    point_2: tuple[float, float],
+    dash_length: int,
+) -> list[tuple[float, float]]:
+    """Find points on line between two points, like it was done before."""
+    line_length = math.sqrt(
+        (point_2[0] - point_1[0]) ** 2 + (point_2[1] - point_1[1]) ** 2
+    )
+    dashes = int(line_length // dash_length)
+
+    points = [point_1]
+    for _i in range(dashes):
+        v = np.array(points[-1], dtype=float)
+        u = np.array(point_2, dtype=float)
+        n = v - u
+        n /= np.linalg.norm(n, 2)
+        points.append(tuple(v - dash_length * n))
+    points.append(point_2)
+    return points
+
+
+def _find_dashes_per_segment(
+    polyline: list[tuple[float, float]],
+    dash_length: int,
+) -> list[list[float]]:
+    """Find dashes of every segment of a polyline, like it was done before."""
+    dashes = []
+    for point_1, point_2 in zip(polyline, polyline[1:], strict=False):
+        plot_points = _find_points_on_line(point_1, point_2, dash_length)
+        for p in range(0, len(plot_points) - 1, 2):
+            dashes.append([*plot_points[p], *plot_points[p + 1]])
+    return dashes
+
+
+def _random_polyline(
+    count: int,
+) -> list[tuple[float, float]]:
+    """Get random walk of integer points like a trail on the map."""
+    rng = np.random.default_rng(7)
+    steps = rng.integers(-40, 41, size=(count, 2))
+    return [tuple(point) for point in np.cumsum(steps, axis=0).astype(float).tolist()]
+
+
+@pytest.mark.parametrize("dash_length", [2, 10, 20])
+def test_dashes_match_per_segment(
+    renderer: ZcsMowerMapRenderer,
+    dash_length: int,
+) -> None:
+    """Test that the dashes of a polyline equal the dashes of each segment."""
+    polyline = _random_polyline(200)
+
+    dashes, segments = renderer._find_dashes_on_polyline(
+        np.array(polyline), dash_length
+    )
+    expected = _find_dashes_per_segment(polyline, dash_length)
+
+    assert dashes.shape == (len(expected), 4)
+    np.testing.assert_allclose(dashes, expected, atol=1e-6)
+    # Dashes are ordered by segment
+    assert segments.tolist() == sorted(segments.tolist())
+    assert set(segments.tolist()) == set(range(len(polyline) - 1))
+
+
+def test_dashes_of_short_segments(
+    renderer: ZcsMowerMapRenderer,
+) -> None:
+    """Test segments shorter than a dash and without length."""
+    polyline = [(0.0, 0.0), (0.0, 0.0), (3.0, 4.0), (13.0, 4.0), (33.0, 4.0)]
+
+    dashes, segments = renderer._find_dashes_on_polyline(np.array(polyline), 10)
+
+    assert dashes.tolist() == [
+        [0.0, 0.0, 0.0, 0.0],
+        [0.0, 0.0, 3.0, 4.0],
+        [3.0, 4.0, 13.0, 4.0],
+        [13.0, 4.0, 23.0, 4.0],
+        [33.0, 4.0, 33.0, 4.0],
+    ]
+    assert segments.tolist() == [0, 1, 2, 3, 3]
+
+
+def test_dashes_benchmark(
+    renderer: ZcsMowerMapRenderer,
+) -> None:
+    """Benchmark the dashes of a polyline against the dashes of each segment."""
+    polyline = _random_polyline(200)
+    polyline_array = np.array(polyline)
+
+    start = time.perf_counter()
+    for _i in range(10):
+        renderer._find_dashes_on_polyline(polyline_array, 10)
+    elapsed = (time.perf_counter() - start) / 10
+
+    start = time.perf_counter()
+    _find_dashes_per_segment(polyline, 10)
+    elapsed_per_segment = time.perf_counter() - start
+
+    _LOGGER.info(
+        "Dashes of %s locations: %.3f ms, per segment: %.3f ms",
+        len(polyline),
+        elapsed * 1000,
+        elapsed_per_segment * 1000,
+    )
+    assert elapsed < elapsed_per_segment
+
+
+@pytest.mark.parametrize("count", [1, 3, 50, 100])
+def test_location_opacity(
+    renderer: ZcsMowerMapRenderer,
+    count: int,
+) -> None:
+    """Test the opacity scales with the number of map points, like it was done before."""
+    for index in range(count):
+        age = count - 1 - index
+        assert renderer._get_location_opacity(age, count) == round(index * (200 / count)) + 55
+
+
+@pytest.mark.parametrize(
+    ("map_points", "start", "steps", "draw_lines"),
+    [
+        (30, 5, 40, True),
+        (50, 100, 7, True),
+        (50, 100, 60, True),
+        (100, 150, 40, True),
+        (50, 100, 60, False),
+    ],
+    ids=["short", "few", "many", "long", "no_lines"],
+)
+def test_incremental_matches_complete_render(
+    tmp_path,
+    map_points: int,
+    start: int,
+    steps: int,
+    draw_lines: bool,
+) -> None:
+    """Test that the map rendered frame by frame equals a complete render."""
+    top_left, bottom_right = (45.5410, 11.5390), (45.5400, 11.5410)
+    map_image_path = tmp_path / "map.png"
+    Image.new("RGB", (1200, 800), (90, 140, 90)).save(map_image_path)
+    options = {
+        CONF_MAP_ENABLE: True,
+        CONF_MAP_IMAGE_PATH: str(map_image_path),
+        CONF_MAP_GPS_TOP_LEFT: top_left,
+        CONF_MAP_GPS_BOTTOM_RIGHT: bottom_right,
+        CONF_MAP_ROTATION: 0.0,
+        CONF_MAP_POINTS: map_points,
+        CONF_MAP_DRAW_LINES: draw_lines,
+    }
+
+    # Random walk of the lawn mower, so location points and lines overlap
+    rng = np.random.default_rng(1)
+    locations = np.cumsum(rng.normal(0, 0.00002, (start + steps, 2)), axis=0) + (
+        (top_left[0] + bottom_right[0]) / 2,
+        (top_left[1] + bottom_right[1]) / 2,
+    )
+    location_history = ZcsMowerLocationHistory(capacity=200)
+    coordinator = type("Coordinator", (), {})()
+    coordinator.data = {
+        IMEI: {
+            ATTR_LOCATION_HISTORY: location_history,
+        },
+    }
+
+    def _add_location(location: list[float]) -> None:
+        location_history.append(tuple(location))
+        coordinator.data[IMEI][ATTR_LOCATION] = {
+            ATTR_LATITUDE: location[0],
+            ATTR_LONGITUDE: location[1],
+        }
+
+    renderer = ZcsMowerMapRenderer(
+        config_entry=MockConfigEntry(domain=DOMAIN, options=options),
+        coordinator=coordinator,
+        imei=IMEI,
+    )
+    variant = renderer.get_variant(name="map", max_size=600, marker_size=32)
+    for location in locations[:start].tolist():
+        _add_location(location)
+    renderer._generate_image(variant)
+    for location in locations[start:].tolist():
+        _add_location(location)
+        image = renderer._generate_image(variant)
+
+    renderer_complete = ZcsMowerMapRenderer(
+        config_entry=MockConfigEntry(domain=DOMAIN, options=options),
+        coordinator=coordinator,
+        imei=IMEI,
+    )
+    image_complete = renderer_complete._generate_image(
+        renderer_complete.get_variant(name="map", max_size=600, marker_size=32)
+    )
+
+    difference = np.abs(
+        np.asarray(image, dtype=np.int16) - np.asarray(image_complete, dtype=np.int16)
+    ).max(axis=2)
+    _LOGGER.info(
+        "Difference of %s frames: mean %.3f, max %s, pixels above 32: %s",
+        steps,
+        difference.mean(),
+        difference.max(),
+        (difference > 32).sum(),
+    )
+    # Only overlapping shapes fade differently
+    assert difference.mean() < 0.5
+    assert (difference > 32).mean() < 0.002
+
+
+def test_clear_render_cache_of_variant(tmp_path) -> None:
+    """Test only the render cache of the removed variant is cleared, even with the same size."""
+    map_image_path = tmp_path / "map.png"
+    Image.new("RGB", (1200, 800), (90, 140, 90)).save(map_image_path)
+    coordinator = type("Coordinator", (), {})()
+    coordinator.data = {IMEI: {}}
+    renderer = ZcsMowerMapRenderer(
+        config_entry=MockConfigEntry(
+            domain=DOMAIN,
+            options={
+                CONF_MAP_ENABLE: True,
+                CONF_MAP_IMAGE_PATH: str(map_image_path),
+                CONF_MAP_GPS_TOP_LEFT: (45.5410, 11.5390),
+                CONF_MAP_GPS_BOTTOM_RIGHT: (45.5400, 11.5410),
+            },
+        ),
+        coordinator=coordinator,
+        imei=IMEI,
+    )
+    variant_map = renderer.get_variant(name="map", max_size=600, marker_size=32)
+    variant_other = renderer.get_variant(name="map_other", max_size=600, marker_size=32)
+    renderer.render(variant_map)
+    renderer.render(variant_other)
+
+    renderer.clear_render_cache(variant_other)
+
+    variant_names = {key[0] for key in renderer._render_cache}
+    assert variant_names == {None, "map"}
+    # A variant in another size replaces the entries of the same name
+    variant_map = renderer.get_variant(name="map", max_size=200, marker_size=16)
+    renderer.render(variant_map)
+    assert [key[3] for key in renderer._render_cache if key[0] == "map"] == [(200, 200)]